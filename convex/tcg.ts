@@ -124,7 +124,7 @@ export const getAllGroups = action({
       let page: any;
       if (svc) {
         const url = `${svc}/groups?${params.toString()}`;
-        page = await fetchJson(url, { method: 'GET' });
+        page = await fetchServiceJson(url);
       } else {
         const clientId = process.env.TCGPLAYER_CLIENT_ID!;
         const clientSecret = process.env.TCGPLAYER_CLIENT_SECRET!;
@@ -231,7 +231,7 @@ export const getGroups = action({
     if (offset !== undefined) params.set('offset', String(offset));
     if (svc) {
       const url = `${svc}/groups?${params.toString()}`;
-      return await fetchJson(url, { method: 'GET' });
+      return await fetchServiceJson(url);
     }
     const clientId = process.env.TCGPLAYER_CLIENT_ID!;
     const clientSecret = process.env.TCGPLAYER_CLIENT_SECRET!;
@@ -443,6 +443,38 @@ async function fetchJson(path: string, init: RequestInit): Promise<any> {
   return await res.json();
 }
 
+// Last body + ETag per python service URL, reused when the service answers 304
+const serviceEtagCache = new Map<string, { etag: string; body: any }>();
+const SERVICE_ETAG_CACHE_MAX = 500;
+
+async function fetchServiceJson(url: string): Promise<any> {
+  const cached = serviceEtagCache.get(url);
+  const headers: Record<string, string> = { Accept: "application/json", "Accept-Encoding": "gzip" };
+  if (cached) headers["If-None-Match"] = cached.etag;
+  const res = await fetch(url, { method: "GET", headers });
+  if (res.status === 304 && cached) {
+    // Refresh recency so hot URLs stay cached
+    serviceEtagCache.delete(url);
+    serviceEtagCache.set(url, cached);
+    return cached.body;
+  }
+  if (!res.ok) {
+    const txt = await res.text();
+    throw new Error(`TCGplayer API error: ${res.status} ${res.statusText} ${txt}`);
+  }
+  const body = await res.json();
+  const etag = res.headers.get("etag");
+  if (etag) {
+    serviceEtagCache.delete(url);
+    serviceEtagCache.set(url, { etag, body });
+    if (serviceEtagCache.size > SERVICE_ETAG_CACHE_MAX) {
+      const oldest = serviceEtagCache.keys().next().value;
+      if (oldest !== undefined) serviceEtagCache.delete(oldest);
+    }
+  }
+  return body;
+}
+
 function getPythonServiceUrl(): string | null {
   const url = (process as any).env?.TCGPY_SERVICE_URL || (globalThis as any).process?.env?.TCGPY_SERVICE_URL;
   if (typeof url === "string" && url.length > 0) return url.replace(/\/$/, "");
@@ -519,7 +551,7 @@ export const getCategories = action({
       let page: any;
       if (svc) {
         const url = `${svc}/categories?${params.toString()}`;
-        page = await fetchJson(url, { method: "GET" });
+        page = await fetchServiceJson(url);
       } else {
         const clientId = process.env.TCGPLAYER_CLIENT_ID!;
         const clientSecret = process.env.TCGPLAYER_CLIENT_SECRET!;
@@ -0,0 +1,7 @@
+"""
+Offline benchmarks for TCGPlayer Client.
+
+Runs the client and the FastAPI service against an in-process fake of the
+TCGPlayer API and reports latency percentiles, achieved request rate, cache
+hit ratio and API calls per logical operation as JSON. See ``run.py``.
+"""
@@ -0,0 +1,289 @@
+"""
+In-process fake of the TCGPlayer API for benchmarks.
+
+Serves a deterministic synthetic catalog (categories, groups, products, SKUs
+and prices) with configurable latency, injected server errors and 429s,
+an optional server-side rate limit, and padded payloads. Every request is
+logged so benchmarks can count API calls and check rate compliance.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from tcgplayer_client.metrics import endpoint_template
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake TCGPlayer API."""
+
+    latency_ms: float = 20.0  # mean response latency
+    latency_jitter_ms: float = 10.0  # uniform +/- jitter around the mean
+    error_rate: float = 0.0  # fraction of requests answered with a 500
+    rate_429: float = 0.0  # fraction of requests answered with a 429
+    rate_limit: int = 0  # requests per rate_limit_window before 429s (0: off)
+    rate_limit_window: float = 1.0
+    categories: int = 3
+    groups_per_category: int = 5
+    products_per_group: int = 120
+    skus_per_product: int = 4
+    padding_bytes: int = 200  # extra text per product, to scale payload size
+    seed: int = 1234
+
+
+class FakeTCGPlayer:
+    """aiohttp server answering TCGPlayer API routes from a synthetic catalog.
+
+    Use as ``async with FakeTCGPlayer(config) as server`` and point the
+    client's ``base_url`` at ``server.base_url``.
+    """
+
+    def __init__(self, config: Optional[FakeServerConfig] = None) -> None:
+        """
+        Initialize the fake server and build its catalog.
+
+        Args:
+            config: Server behaviour (defaults if not given)
+        """
+        self.config = config or FakeServerConfig()
+        self._random = random.Random(self.config.seed)
+        self.base_url = ""
+        # (monotonic time, endpoint template, status) per API request
+        self.request_log: List[Tuple[float, str, int]] = []
+        self._recent: Deque[float] = deque()
+        self._runner: Optional[web.AppRunner] = None
+        self._build_catalog()
+
+    def _build_catalog(self) -> None:
+        cfg = self.config
+        padding = "x" * cfg.padding_bytes
+        self.groups: Dict[int, Dict[str, Any]] = {}
+        self.products: Dict[int, Dict[str, Any]] = {}
+        self.group_products: Dict[int, List[int]] = {}
+        self.skus: Dict[int, List[Dict[str, Any]]] = {}
+        product_id = 1000
+        for category_id in range(1, cfg.categories + 1):
+            for g in range(cfg.groups_per_category):
+                group_id = category_id * 100 + g
+                self.groups[group_id] = {
+                    "groupId": group_id,
+                    "name": f"Set {group_id}",
+                    "abbreviation": f"S{group_id}",
+                    "categoryId": category_id,
+                }
+                self.group_products[group_id] = []
+                for _ in range(cfg.products_per_group):
+                    product_id += 1
+                    self.products[product_id] = {
+                        "productId": product_id,
+                        "name": f"Card {product_id}",
+                        "groupId": group_id,
+                        "categoryId": category_id,
+                        "extendedData": [{"name": "Text", "value": padding}],
+                    }
+                    self.group_products[group_id].append(product_id)
+                    self.skus[product_id] = [
+                        {
+                            "skuId": product_id * 10 + s,
+                            "productId": product_id,
+                            "conditionId": s + 1,
+                            "languageId": 1,
+                            "printingId": 1,
+                        }
+                        for s in range(cfg.skus_per_product)
+                    ]
+
+    def _price(self, product_id: int) -> Dict[str, Any]:
+        market = round(0.25 + (product_id * 7919 % 5000) / 100, 2)
+        return {
+            "productId": product_id,
+            "lowPrice": round(market * 0.8, 2),
+            "midPrice": market,
+            "highPrice": round(market * 1.5, 2),
+            "marketPrice": market,
+            "directLowPrice": None,
+            "subTypeName": "Normal",
+        }
+
+    # -- server lifecycle -------------------------------------------------
+
+    async def start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        app = web.Application(middlewares=[self._behaviour])
+        app.router.add_post("/token", self._token)
+        app.router.add_get("/catalog/categories", self._categories)
+        app.router.add_get("/catalog/groups", self._groups)
+        app.router.add_get("/catalog/products", self._products)
+        app.router.add_get("/catalog/products/{ids}", self._product_details)
+        app.router.add_get("/catalog/products/{ids}/skus", self._product_skus)
+        app.router.add_get("/pricing/product/{ids}", self._product_prices)
+        app.router.add_get("/pricing/group/{group_id}", self._group_prices)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeTCGPlayer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # -- request accounting -----------------------------------------------
+
+    def reset_log(self) -> None:
+        """Forget logged requests (e.g. between scenarios)."""
+        self.request_log.clear()
+
+    def api_calls(self) -> int:
+        """Number of API requests logged (excluding authentication)."""
+        return len(self.request_log)
+
+    def calls_by_endpoint(self) -> Dict[str, int]:
+        """Logged API requests per endpoint template."""
+        return dict(Counter(endpoint for _, endpoint, _ in self.request_log))
+
+    def calls_by_status(self) -> Dict[str, int]:
+        """Logged API requests per response status."""
+        return dict(Counter(str(status) for _, _, status in self.request_log))
+
+    def peak_window_requests(self, window: float = 1.0) -> int:
+        """Most requests received within any ``window`` seconds."""
+        times = sorted(t for t, _, _ in self.request_log)
+        peak = start = 0
+        for end, t in enumerate(times):
+            while times[start] <= t - window:
+                start += 1
+            peak = max(peak, end - start + 1)
+        return peak
+
+    @web.middleware
+    async def _behaviour(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, injected failures and the rate limit to API routes."""
+        if request.path == "/token":
+            return await handler(request)
+        cfg = self.config
+        now = time.monotonic()
+        template = endpoint_template(request.path)
+
+        status = 200
+        if cfg.rate_limit:
+            while self._recent and self._recent[0] <= now - cfg.rate_limit_window:
+                self._recent.popleft()
+            if len(self._recent) >= cfg.rate_limit:
+                status = 429
+            else:
+                self._recent.append(now)
+        if status == 200:
+            roll = self._random.random()
+            if roll < cfg.rate_429:
+                status = 429
+            elif roll < cfg.rate_429 + cfg.error_rate:
+                status = 500
+        self.request_log.append((now, template, status))
+
+        jitter = self._random.uniform(-cfg.latency_jitter_ms, cfg.latency_jitter_ms)
+        await asyncio.sleep(max(0.0, cfg.latency_ms + jitter) / 1000)
+
+        if status == 429:
+            return web.json_response(
+                {"success": False, "errors": ["Too many requests"]},
+                status=429,
+                headers={"Retry-After": "1"},
+            )
+        if status == 500:
+            return web.json_response(
+                {"success": False, "errors": ["Injected failure"]}, status=500
+            )
+        return await handler(request)
+
+    # -- routes -----------------------------------------------------------
+
+    @staticmethod
+    def _ok(results: List[Any], total: Optional[int] = None) -> web.Response:
+        body: Dict[str, Any] = {"success": True, "errors": [], "results": results}
+        if total is not None:
+            body["totalItems"] = total
+        return web.Response(
+            body=json.dumps(body, separators=(",", ":")).encode(),
+            content_type="application/json",
+        )
+
+    @staticmethod
+    def _ids(request: web.Request) -> List[int]:
+        return [int(i) for i in request.match_info["ids"].split(",") if i]
+
+    @staticmethod
+    def _page(request: web.Request, items: List[Any]) -> Tuple[List[Any], int]:
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", 10))
+        return items[offset : offset + limit], len(items)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "access_token": "fake-token",
+                "token_type": "bearer",
+                "expires_in": 1209600,
+            }
+        )
+
+    async def _categories(self, request: web.Request) -> web.Response:
+        results = [
+            {"categoryId": c, "name": f"Category {c}"}
+            for c in range(1, self.config.categories + 1)
+        ]
+        return self._ok(results, len(results))
+
+    async def _groups(self, request: web.Request) -> web.Response:
+        groups = list(self.groups.values())
+        if "categoryId" in request.query:
+            category_id = int(request.query["categoryId"])
+            groups = [g for g in groups if g["categoryId"] == category_id]
+        page, total = self._page(request, groups)
+        return self._ok(page, total)
+
+    async def _products(self, request: web.Request) -> web.Response:
+        if "groupId" in request.query:
+            ids = self.group_products.get(int(request.query["groupId"]), [])
+        else:
+            ids = list(self.products)
+            if "categoryId" in request.query:
+                category_id = int(request.query["categoryId"])
+                ids = [i for i in ids if self.products[i]["categoryId"] == category_id]
+        page, total = self._page(request, ids)
+        return self._ok([self.products[i] for i in page], total)
+
+    async def _product_details(self, request: web.Request) -> web.Response:
+        return self._ok(
+            [self.products[i] for i in self._ids(request) if i in self.products]
+        )
+
+    async def _product_skus(self, request: web.Request) -> web.Response:
+        return self._ok([s for i in self._ids(request) for s in self.skus.get(i, [])])
+
+    async def _product_prices(self, request: web.Request) -> web.Response:
+        return self._ok(
+            [self._price(i) for i in self._ids(request) if i in self.products]
+        )
+
+    async def _group_prices(self, request: web.Request) -> web.Response:
+        group_id = int(request.match_info["group_id"])
+        return self._ok([self._price(i) for i in self.group_products.get(group_id, [])])
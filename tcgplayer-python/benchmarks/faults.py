@@ -0,0 +1,267 @@
+"""
+Retry and backoff benchmarks under injected faults.
+
+Usage (from the tcgplayer-python directory)::
+
+    python -m benchmarks.faults                        # every profile x policy
+    python -m benchmarks.faults -f throttled -p default -p fast --operations 50
+    python -m benchmarks.faults --time-scale 0.1 -o faults.json
+
+Runs single-product lookups (caching off, so each one needs an upstream call)
+through a ``FaultInjectionTransport`` in front of the in-process fake API, for
+each fault profile and retry policy. Per run the report has:
+
+- goodput: successful operations per second
+- wasted budget: upstream attempts (rate limiter slots) that did not produce
+  a successful response, and the share of all attempts they make up
+- backoff seconds slept between retries, rate limiter wait and injected
+  latency
+- operation latency percentiles and errors by type
+
+The client only retries timeouts and connection errors. Injected 429 and
+5xx answers fail the operation on the first attempt under every policy, so
+the ``throttled`` and ``outage_bursts`` profiles measure the cost of those
+failures, not retry behaviour: their results are the same for every policy,
+and the report marks them ``"retried_by_client": false``.
+
+``--time-scale`` shrinks the rate limit window, backoff delays and injected
+latencies together, so a full matrix runs in seconds with the same shape.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional
+
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.budget import budget_scope
+from tcgplayer_client.chaos import FaultConfig, inject_faults
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.hooks import ON_RETRY, HookContext
+
+from .fake_server import FakeServerConfig, FakeTCGPlayer
+from .run import git_commit, percentile
+from .scenarios import OperationRecorder
+
+
+@dataclass
+class RetryPolicy:
+    """The client's retry settings under test."""
+
+    max_retries: int  # attempts per request, including the first
+    base_delay: float  # backoff before retry n is base_delay * 2**(n - 1)
+
+
+PROFILES: Dict[str, FaultConfig] = {
+    "clean": FaultConfig(),
+    "slow_tail": FaultConfig(
+        latency_ms=30, latency_distribution="lognormal", latency_sigma=1.0
+    ),
+    "flaky_network": FaultConfig(reset_rate=0.05, timeout_rate=0.02, timeout_ms=500),
+    "throttled": FaultConfig(rate_429=0.1, retry_after=1),
+    "outage_bursts": FaultConfig(burst_rate=0.02, burst_length=10),
+}
+
+# Profiles whose faults are HTTP status answers (429/5xx), which the client's
+# retry loop does not retry: retry policies cannot change their results
+NOT_RETRIED_BY_CLIENT = frozenset({"throttled", "outage_bursts"})
+
+POLICIES: Dict[str, RetryPolicy] = {
+    "no_retry": RetryPolicy(max_retries=1, base_delay=1.0),
+    "default": RetryPolicy(max_retries=3, base_delay=1.0),
+    "fast": RetryPolicy(max_retries=3, base_delay=0.1),
+    "persistent": RetryPolicy(max_retries=5, base_delay=0.5),
+}
+
+
+def _scaled(faults: FaultConfig, time_scale: float) -> FaultConfig:
+    return replace(
+        faults,
+        latency_ms=faults.latency_ms * time_scale,
+        timeout_ms=faults.timeout_ms * time_scale,
+    )
+
+
+async def run_fault_scenario(
+    server: FakeTCGPlayer,
+    faults: FaultConfig,
+    policy: RetryPolicy,
+    operations: int = 100,
+    concurrency: int = 4,
+    time_scale: float = 1.0,
+) -> Dict[str, Any]:
+    """Run single-product lookups under one fault profile and retry policy."""
+    config = ClientConfig(
+        base_url=server.base_url,
+        client_id="bench",
+        client_secret="bench",
+        enable_caching=False,
+    )
+    # Constructor arguments take precedence over the config's limiter and
+    # retry settings
+    client = TCGPlayerClient(
+        config=config,
+        rate_limit_window=time_scale,
+        max_retries=policy.max_retries,
+        base_delay=policy.base_delay * time_scale,
+    )
+    transport = inject_faults(client, _scaled(faults, time_scale))
+    await client.authenticate()
+
+    backoff = 0.0
+
+    def on_retry(context: HookContext) -> None:
+        nonlocal backoff
+        backoff += context.retry_delay or 0.0
+
+    client.add_hook(ON_RETRY, on_retry)
+
+    product_ids = list(server.products)
+    recorder = OperationRecorder()
+    semaphore = asyncio.Semaphore(concurrency)
+    catalog = client.endpoints.catalog
+
+    async def lookup(i: int) -> Any:
+        async with semaphore:
+            product_id = product_ids[i % len(product_ids)]
+            return await recorder.measure(catalog.get_product_details([product_id]))
+
+    start = time.perf_counter()
+    try:
+        with budget_scope("fault-benchmark") as budget:
+            await asyncio.gather(*(lookup(i) for i in range(operations)))
+    finally:
+        wall = time.perf_counter() - start
+        await client.close()
+
+    failed = sum(recorder.errors.values())
+    succeeded = operations - failed
+    wasted = budget.upstream_calls - succeeded
+    latencies_ms = [latency * 1000 for latency in recorder.latencies]
+    return {
+        "operations": operations,
+        "succeeded": succeeded,
+        "errors": dict(recorder.errors),
+        "wall_seconds": round(wall, 3),
+        "goodput_ops": round(succeeded / wall, 2) if wall > 0 else 0.0,
+        "upstream_attempts": budget.upstream_calls,
+        "wasted_attempts": wasted,
+        "wasted_fraction": (
+            round(wasted / budget.upstream_calls, 4) if budget.upstream_calls else 0.0
+        ),
+        "backoff_seconds": round(backoff, 3),
+        "limiter_wait_seconds": round(budget.limiter_wait, 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 2),
+            "p95": round(percentile(latencies_ms, 95), 2),
+            "p99": round(percentile(latencies_ms, 99), 2),
+        },
+        "injected": dict(transport.injected),
+        "injected_latency_seconds": round(transport.injected_latency, 3),
+    }
+
+
+async def run_fault_benchmarks(
+    profiles: List[str],
+    policies: List[str],
+    server_config: FakeServerConfig,
+    operations: int = 100,
+    concurrency: int = 4,
+    time_scale: float = 1.0,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    """Run every profile x policy combination and build the report."""
+    results: Dict[str, Dict[str, Any]] = {}
+    async with FakeTCGPlayer(server_config) as server:
+        for profile in profiles:
+            # Same seed per policy: each policy faces the same fault sequence
+            faults = replace(PROFILES[profile], seed=seed)
+            results[profile] = {}
+            for policy in policies:
+                results[profile][policy] = await run_fault_scenario(
+                    server,
+                    faults,
+                    POLICIES[policy],
+                    operations,
+                    concurrency,
+                    time_scale,
+                )
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "time_scale": time_scale,
+        "profiles": {
+            name: {
+                **asdict(PROFILES[name]),
+                "retried_by_client": name not in NOT_RETRIED_BY_CLIENT,
+            }
+            for name in profiles
+        },
+        "policies": {name: asdict(POLICIES[name]) for name in policies},
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "-f",
+        "--profile",
+        action="append",
+        choices=sorted(PROFILES),
+        help="Fault profile (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "-p",
+        "--policy",
+        action="append",
+        choices=sorted(POLICIES),
+        help="Retry policy (repeatable; default: all)",
+    )
+    parser.add_argument("--operations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="Multiply rate limit window, backoff and injected latency by this",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("-o", "--output", help="Write the JSON report to a file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    # Injected failures are expected; keep the report readable
+    logging.getLogger("tcgplayer_client").setLevel(logging.CRITICAL)
+
+    server_config = FakeServerConfig(
+        latency_ms=args.latency_ms * args.time_scale, latency_jitter_ms=0
+    )
+    report = asyncio.run(
+        run_fault_benchmarks(
+            args.profile or list(PROFILES),
+            args.policy or list(POLICIES),
+            server_config,
+            args.operations,
+            args.concurrency,
+            args.time_scale,
+            args.seed,
+        )
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Rate limiter compliance and overhead microbenchmarks.
+
+Usage (from the tcgplayer-python directory)::
+
+    python -m benchmarks.limiter                      # all checks
+    python -m benchmarks.limiter --tasks 5000 --time-window 0.02 -o limiter.json
+
+Hammers ``RateLimiter.acquire()`` (and ``FairRateLimiter``) from thousands of
+concurrent tasks and records the timestamp of every grant, as stored by the
+limiter itself. Reports:
+
+- compliance: the most grants in any sliding window, checked at every grant,
+  both at grant time and when the caller actually resumes
+- overhead: time per ``acquire()`` when a slot is free
+- fairness: wait time spread, FIFO order inversions, and per-tenant shares
+  (Jain's index) for the fair limiter
+- wake-up precision: how late each grant is after its slot became free
+
+Compliance does not depend on the window length, so a short ``--time-window``
+checks thousands of grants in a few seconds.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Sequence
+
+from tcgplayer_client.fair_queue import FairRateLimiter, tenant_scope
+from tcgplayer_client.rate_limiter import RateLimiter
+
+from .run import git_commit, percentile
+
+
+class _RecordingDeque(deque):
+    """The limiter's request deque, keeping a copy of every timestamp."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.log: List[float] = []
+
+    def append(self, item: float) -> None:
+        self.log.append(item)
+        super().append(item)
+
+
+def record_grants(limiter: RateLimiter) -> List[float]:
+    """Instrument a limiter; returns the list its grant times are added to."""
+    recording = _RecordingDeque()
+    recording.extend(limiter.requests)
+    limiter.requests = recording
+    return recording.log
+
+
+def max_in_window(timestamps: Sequence[float], window: float) -> int:
+    """
+    Most timestamps within any half-open window ``(t - window, t]``.
+
+    This is the window the limiter enforces, checked ending at every grant.
+    """
+    times = sorted(timestamps)
+    peak = start = 0
+    for end, t in enumerate(times):
+        while times[start] <= t - window:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return peak
+
+
+def _summary_ms(values: Sequence[float]) -> Dict[str, float]:
+    ms = [v * 1000 for v in values]
+    return {
+        "mean": round(statistics.fmean(ms), 4) if ms else 0.0,
+        "stdev": round(statistics.pstdev(ms), 4) if ms else 0.0,
+        "p50": round(percentile(ms, 50), 4),
+        "p99": round(percentile(ms, 99), 4),
+        "max": round(max(ms, default=0.0), 4),
+    }
+
+
+def jain_index(values: Sequence[float]) -> float:
+    """Jain's fairness index: 1.0 when all values are equal."""
+    if not values or not any(values):
+        return 1.0
+    return sum(values) ** 2 / (len(values) * sum(v * v for v in values))
+
+
+async def measure_overhead(limiter: RateLimiter, iterations: int) -> Dict[str, Any]:
+    """Time ``acquire()`` when a slot is always free."""
+    limiter.time_window = 1e-9  # every earlier grant has already expired
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await limiter.acquire()
+        timings.append(time.perf_counter() - start)
+    return {
+        "iterations": iterations,
+        "acquire_us": {
+            key: round(value * 1000, 3) for key, value in _summary_ms(timings).items()
+        },
+    }
+
+
+async def hammer(
+    limiter: RateLimiter,
+    tasks: int,
+    tenants: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Start ``tasks`` concurrent acquires and check every grant.
+
+    Args:
+        limiter: Limiter under test (instrumented here)
+        tasks: Concurrent acquire calls
+        tenants: Tenant -> weight; tasks are spread evenly across tenants
+
+    Returns:
+        Compliance, fairness and wake-up precision results
+    """
+    grants = record_grants(limiter)
+    names = list(tenants or {"default": 1.0})
+    resumed: List[float] = []
+    waits: List[float] = []
+    order: List[int] = []
+    granted_to: List[str] = []
+
+    async def one(index: int) -> None:
+        tenant = names[index % len(names)]
+        with tenant_scope(tenant):
+            start = time.time()
+            await limiter.acquire()
+            now = time.time()
+        resumed.append(now)
+        waits.append(now - start)
+        order.append(index)
+        granted_to.append(tenant)
+
+    started = time.time()
+    await asyncio.gather(*(one(i) for i in range(tasks)))
+    elapsed = time.time() - started
+
+    window, limit = limiter.time_window, limiter.max_requests
+    ordered = sorted(grants)
+    # A grant's slot frees when the grant `limit` places earlier expires
+    lateness = [
+        t - max(started, grants[i - limit] + window) if i >= limit else t - started
+        for i, t in enumerate(grants)
+    ]
+    inversions = sum(1 for a, b in zip(order, order[1:]) if b < a)
+
+    result: Dict[str, Any] = {
+        "tasks": tasks,
+        "max_requests": limit,
+        "time_window_seconds": window,
+        "elapsed_seconds": round(elapsed, 3),
+        "achieved_rate_per_window": round(len(grants) / elapsed * window, 3),
+        "compliance": {
+            "max_grants_in_window": max_in_window(grants, window),
+            "max_resumes_in_window": max_in_window(resumed, window),
+            # Windows ending at a grant that hold more than `limit` grants
+            "violations": sum(
+                1
+                for i in range(limit, len(ordered))
+                if ordered[i - limit] > ordered[i] - window
+            ),
+        },
+        "wait_ms": _summary_ms(waits),
+        "fifo_inversions": inversions,
+        "wakeup_lateness_ms": _summary_ms([max(0.0, x) for x in lateness]),
+    }
+
+    if tenants and len(tenants) > 1:
+        # Shares while every tenant is still backlogged
+        backlogged = len(granted_to)
+        for tenant in names:
+            last = max(i for i, t in enumerate(granted_to) if t == tenant)
+            backlogged = min(backlogged, last + 1)
+        counts = Counter(granted_to[:backlogged])
+        total_weight = sum(tenants.values())
+        normalized = [counts[t] / tenants[t] for t in names]
+        result["tenants"] = {
+            t: {
+                "weight": tenants[t],
+                "share": round(counts[t] / backlogged, 4),
+                "expected_share": round(tenants[t] / total_weight, 4),
+            }
+            for t in names
+        }
+        result["jain_index"] = round(jain_index(normalized), 4)
+    return result
+
+
+async def run_checks(
+    tasks: int, time_window: float, overhead_iterations: int
+) -> Dict[str, Any]:
+    """Run every check and build the report."""
+    weights = {"bulk": 1.0, "user": 1.0, "app": 2.0, "vip": 4.0}
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "overhead": {
+            "rate_limiter": await measure_overhead(RateLimiter(), overhead_iterations),
+            "fair_rate_limiter": await measure_overhead(
+                FairRateLimiter(), overhead_iterations
+            ),
+        },
+        "hammer": {
+            "rate_limiter": await hammer(RateLimiter(10, time_window), tasks),
+            "fair_rate_limiter": await hammer(FairRateLimiter(10, time_window), tasks),
+            "fair_rate_limiter_tenants": await hammer(
+                FairRateLimiter(10, time_window, weights=weights), tasks, weights
+            ),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--tasks", type=int, default=2000, help="Concurrent tasks")
+    parser.add_argument(
+        "--time-window",
+        type=float,
+        default=0.01,
+        help="Limiter window in seconds (10 grants per window)",
+    )
+    parser.add_argument("--overhead-iterations", type=int, default=20000)
+    parser.add_argument("-o", "--output", help="Write the JSON report to a file")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("tcgplayer_client").setLevel(logging.WARNING)
+    report = asyncio.run(
+        run_checks(args.tasks, args.time_window, args.overhead_iterations)
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    violations = sum(
+        result["compliance"]["violations"] for result in report["hammer"].values()
+    )
+    if violations:
+        print(f"Rate limit violated in {violations} windows", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Run the offline benchmarks and emit results as JSON.
+
+Usage (from the tcgplayer-python directory)::
+
+    python -m benchmarks.run                          # all scenarios
+    python -m benchmarks.run -s price_sync --latency-ms 50 --error-rate 0.02
+    python -m benchmarks.run -o bench.json --compare baseline.json
+
+Each scenario gets a fresh client (empty cache) pointed at an in-process fake
+TCGPlayer API. Per scenario the report has operation latency percentiles,
+achieved upstream req/s and the peak requests seen in any rate limit window,
+cache hit ratio, and API calls per logical operation.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Sequence
+
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+
+from .fake_server import FakeServerConfig, FakeTCGPlayer
+from .scenarios import SCENARIOS, Bench, ScenarioSkipped
+
+# Metrics compared by --compare, and whether higher is better
+COMPARED_METRICS = {
+    "latency_ms.p50": False,
+    "latency_ms.p95": False,
+    "latency_ms.p99": False,
+    "achieved_rps": True,
+    "cache_hit_ratio": True,
+    "api_calls_per_operation": False,
+}
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(q / 100 * len(ordered) + 0.5 - 1e-9)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(  # nosec B603 B607 - fixed git command
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenario(
+    name: str,
+    server: FakeTCGPlayer,
+    max_requests_per_second: int,
+    scale: float,
+) -> Dict[str, Any]:
+    """Run one scenario with a fresh client and summarize it."""
+    config = ClientConfig(
+        base_url=server.base_url,
+        client_id="bench",
+        client_secret="bench",
+        max_requests_per_second=max_requests_per_second,
+        max_retries=1,
+    )
+    client = TCGPlayerClient(config=config)
+    await client.authenticate()
+    bench = Bench(client, server, scale)
+    server.reset_log()
+
+    start = time.perf_counter()
+    try:
+        await SCENARIOS[name](bench)
+    except ScenarioSkipped as e:
+        return {"skipped": str(e)}
+    finally:
+        wall = time.perf_counter() - start
+        await client.close()
+
+    recorder = bench.recorder
+    operations = len(recorder.latencies)
+    api_calls = server.api_calls()
+    hits = client.metrics.cache_lookups.get(result="hit")
+    misses = client.metrics.cache_lookups.get(result="miss")
+    latencies_ms = [latency * 1000 for latency in recorder.latencies]
+    return {
+        "operations": operations,
+        "errors": dict(recorder.errors),
+        "wall_seconds": round(wall, 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 2),
+            "p95": round(percentile(latencies_ms, 95), 2),
+            "p99": round(percentile(latencies_ms, 99), 2),
+            "max": round(max(latencies_ms, default=0.0), 2),
+            "mean": round(sum(latencies_ms) / operations, 2) if operations else 0.0,
+        },
+        "api_calls": api_calls,
+        "api_calls_per_operation": (
+            round(api_calls / operations, 3) if operations else 0.0
+        ),
+        "achieved_rps": round(api_calls / wall, 2) if wall > 0 else 0.0,
+        "rate_limit_rps": max_requests_per_second,
+        "peak_window_requests": server.peak_window_requests(1.0),
+        "cache_hit_ratio": (round(hits / (hits + misses), 4) if hits + misses else 0.0),
+        "coalesced_requests": client.coalescer.coalesced,
+        "upstream_statuses": server.calls_by_status(),
+        "calls_by_endpoint": server.calls_by_endpoint(),
+    }
+
+
+async def run_benchmarks(
+    scenarios: List[str],
+    server_config: FakeServerConfig,
+    max_requests_per_second: int = 10,
+    scale: float = 1.0,
+) -> Dict[str, Any]:
+    """Run scenarios against one fake server and build the report."""
+    results: Dict[str, Any] = {}
+    async with FakeTCGPlayer(server_config) as server:
+        for name in scenarios:
+            results[name] = await run_scenario(
+                name, server, max_requests_per_second, scale
+            )
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "scale": scale,
+        "server": asdict(server_config),
+        "scenarios": results,
+    }
+
+
+def _lookup(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Describe metric changes between a baseline report and this one."""
+    lines = []
+    for name, result in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or "skipped" in result or "skipped" in base:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = _lookup(base, metric), _lookup(result, metric)
+            if old is None or new is None or old == new:
+                continue
+            change = (new - old) / old * 100 if old else float("inf")
+            better = (new > old) == higher_is_better
+            lines.append(
+                f"{name:26} {metric:26} {old:>10} -> {new:<10} "
+                f"({change:+.1f}%, {'better' if better else 'worse'})"
+            )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report to a file")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--scale", type=float, default=1.0, help="Operation count")
+    parser.add_argument("--rps", type=int, default=10, help="Client rate limit")
+    defaults = FakeServerConfig()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument(
+        "--latency-jitter-ms", type=float, default=defaults.latency_jitter_ms
+    )
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--rate-429", type=float, default=defaults.rate_429)
+    parser.add_argument(
+        "--server-rate-limit",
+        type=int,
+        default=defaults.rate_limit,
+        help="Answer 429 above this many requests per second (0: off)",
+    )
+    parser.add_argument("--padding-bytes", type=int, default=defaults.padding_bytes)
+    parser.add_argument(
+        "--products-per-group", type=int, default=defaults.products_per_group
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    # Injected failures are expected; keep the report readable
+    logging.getLogger("tcgplayer_client").setLevel(logging.CRITICAL)
+
+    server_config = FakeServerConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        rate_429=args.rate_429,
+        rate_limit=args.server_rate_limit,
+        padding_bytes=args.padding_bytes,
+        products_per_group=args.products_per_group,
+    )
+    report = asyncio.run(
+        run_benchmarks(
+            args.scenario or list(SCENARIOS), server_config, args.rps, args.scale
+        )
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for line in compare(report, baseline) or ["No metric changes"]:
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Benchmark scenarios driving TCGPlayerClient and the service.
+
+Each scenario performs a number of logical operations (e.g. "walk one set's
+products", "load one dashboard") and times each of them; upstream API calls
+are counted by the fake server.
+"""
+
+import asyncio
+import importlib.util
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.exceptions import TCGPlayerError
+
+from .fake_server import FakeTCGPlayer
+
+SERVICE_APP = Path(__file__).resolve().parents[1] / "service" / "app.py"
+
+
+class ScenarioSkipped(Exception):
+    """Raised when a scenario cannot run in this environment."""
+
+
+class OperationRecorder:
+    """Times logical operations and counts their failures."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.errors: Counter = Counter()
+
+    async def measure(self, operation: Awaitable[Any]) -> Any:
+        """Await one logical operation, recording its latency and outcome."""
+        start = time.perf_counter()
+        try:
+            return await operation
+        except (TCGPlayerError, RuntimeError) as e:
+            self.errors[type(e).__name__] += 1
+            return None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+
+class Bench:
+    """What a scenario gets to work with."""
+
+    def __init__(
+        self, client: TCGPlayerClient, server: FakeTCGPlayer, scale: float = 1.0
+    ) -> None:
+        self.client = client
+        self.server = server
+        self.scale = scale
+        self.recorder = OperationRecorder()
+        self.random = random.Random(server.config.seed)
+
+    def scaled(self, count: int) -> int:
+        """Scale an operation count, keeping at least one."""
+        return max(1, int(count * self.scale))
+
+
+async def catalog_walk(bench: Bench) -> None:
+    """List every product of every set in a category, one set per operation."""
+    catalog = bench.client.endpoints.catalog
+    group_ids: List[int] = []
+    async for page in catalog.iter_groups(category_id=1):
+        group_ids.extend(g["groupId"] for g in page)
+
+    async def walk(group_id: int) -> int:
+        count = 0
+        async for page in catalog.iter_products(group_id=group_id):
+            count += len(page)
+        return count
+
+    for group_id in group_ids[: bench.scaled(len(group_ids))]:
+        await bench.recorder.measure(walk(group_id))
+
+
+async def price_sync(bench: Bench) -> None:
+    """Price user collections spread over a few sets, four collections at once."""
+    server = bench.server
+    pricing = bench.client.endpoints.pricing
+    product_groups = {pid: p["groupId"] for pid, p in server.products.items()}
+    group_ids = list(server.group_products)
+
+    collections = []
+    for _ in range(bench.scaled(12)):
+        groups = bench.random.sample(group_ids, 3)
+        # Mostly one set (a fresh booster box), plus a few singles
+        ids = bench.random.sample(server.group_products[groups[0]], 80)
+        for group_id in groups[1:]:
+            ids += bench.random.sample(server.group_products[group_id], 5)
+        collections.append(ids)
+
+    semaphore = asyncio.Semaphore(4)
+
+    async def sync(ids: List[int]) -> Any:
+        async with semaphore:
+            return await bench.recorder.measure(
+                pricing.get_prices_planned(ids, product_groups)
+            )
+
+    await asyncio.gather(*(sync(ids) for ids in collections))
+
+
+def _dashboards(bench: Bench) -> List[Dict[str, Any]]:
+    """Dashboard contents: a few shared watchlists plus hot sets' prices."""
+    server = bench.server
+    hot_groups = list(server.group_products)[:3]
+    watchlists = [
+        sorted(bench.random.sample(server.group_products[g], 10))
+        for g in hot_groups
+        for _ in range(2)
+    ]
+    return [
+        {
+            "group_id": hot_groups[i % len(hot_groups)],
+            "product_ids": watchlists[i % len(watchlists)],
+        }
+        for i in range(bench.scaled(60))
+    ]
+
+
+async def dashboard_burst(bench: Bench) -> None:
+    """Many users open their dashboard at once (overlapping data)."""
+    catalog = bench.client.endpoints.catalog
+    pricing = bench.client.endpoints.pricing
+
+    async def load(dashboard: Dict[str, Any]) -> Any:
+        return await asyncio.gather(
+            catalog.get_categories(),
+            pricing.get_product_prices_by_group(dashboard["group_id"]),
+            catalog.get_product_details(dashboard["product_ids"]),
+        )
+
+    await asyncio.gather(*(bench.recorder.measure(load(d)) for d in _dashboards(bench)))
+
+
+def _load_service(client: TCGPlayerClient) -> Any:
+    """Import service/app.py and attach the benchmark client to it."""
+    try:
+        import httpx  # noqa: F401
+
+        spec = importlib.util.spec_from_file_location(
+            "tcgplayer_service_bench", SERVICE_APP
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load {SERVICE_APP}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except ImportError as e:
+        raise ScenarioSkipped(
+            f"service dependencies not installed (pip install -r "
+            f"service/requirements.txt httpx): {e}"
+        )
+    # Skip the lifespan (it authenticates against the real API)
+    module.client = client
+    return module
+
+
+async def service_dashboard_burst(bench: Bench) -> None:
+    """The dashboard burst, through the FastAPI service routes."""
+    import httpx
+
+    service = _load_service(bench.client)
+    transport = httpx.ASGITransport(app=service.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://service"
+    ) as http:
+
+        async def get(path: str, **params: Any) -> Any:
+            response = await http.get(path, params=params)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{path}: {response.status_code}")
+            return response.json()
+
+        async def load(dashboard: Dict[str, Any]) -> Any:
+            ids = ",".join(map(str, dashboard["product_ids"]))
+            return await asyncio.gather(
+                get("/categories"),
+                get("/pricing/products", ids=ids),
+                get("/product-details", ids=ids),
+            )
+
+        await asyncio.gather(
+            *(bench.recorder.measure(load(d)) for d in _dashboards(bench))
+        )
+
+
+ScenarioFunc = Callable[[Bench], Awaitable[None]]
+
+SCENARIOS: Dict[str, ScenarioFunc] = {
+    "catalog_walk": catalog_walk,
+    "price_sync": price_sync,
+    "dashboard_burst": dashboard_burst,
+    "service_dashboard_burst": service_dashboard_burst,
+}
+
+
+def get_scenario(name: str) -> Optional[ScenarioFunc]:
+    """Look up a scenario by name."""
+    return SCENARIOS.get(name)
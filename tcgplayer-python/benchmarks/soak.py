@@ -0,0 +1,365 @@
+"""
+Soak test: memory growth of the service under long-running traffic.
+
+Usage (from the tcgplayer-python directory)::
+
+    python -m benchmarks.soak                              # 10 minutes
+    python -m benchmarks.soak --duration 3600 --interval 60 -o soak.json
+    python -m benchmarks.soak --time-scale 0.01 --warmup 30 --max-growth-mb 5
+
+Drives the FastAPI service routes (through httpx's ASGI transport, no
+sockets) with a mix of catalog and pricing requests against the in-process
+fake TCGPlayer API. Cached responses expire and get evicted, so the cache,
+coalescer, metrics and session paths all churn. Every ``--interval`` seconds
+the harness runs a full garbage collection and records:
+
+- traced Python memory (``tracemalloc``) and process RSS
+- asyncio task count and live instances of types known to accumulate
+  (cache entries, client sessions, connectors)
+
+The first sample, taken after ``--warmup`` seconds so caches can fill up to
+their size limits, is the baseline. The report lists growth by allocation
+site (file and line) between the baseline and the last sample. The exit
+status is 1 if traced memory or RSS grew more than the thresholds.
+``--time-scale`` shrinks the rate limit window to compress hours of traffic
+at the 10 req/s API limit into minutes; the report's ``simulated_seconds``
+is how long its upstream calls would take at that limit.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+
+from .fake_server import FakeServerConfig, FakeTCGPlayer
+from .run import git_commit
+from .scenarios import _load_service
+
+MB = 1024 * 1024
+
+# Types whose live instances are counted at each sample
+WATCHED_TYPES = ("CacheEntry", "ClientSession", "TCPConnector", "RequestTiming")
+
+# Allocations made by the harness and the fake API are not the service's
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    os.path.join("*", "benchmarks", "*"),
+    "<frozen importlib._bootstrap*>",
+    "<unknown>",
+)
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size of this process, if it can be read."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current RSS off Linux; kilobytes except on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def count_instances(type_names: Tuple[str, ...] = WATCHED_TYPES) -> Dict[str, int]:
+    """Count live objects per type name."""
+    counts: Counter = Counter()
+    wanted = set(type_names)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in wanted:
+            counts[name] += 1
+    return {name: counts[name] for name in type_names}
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    filters = [tracemalloc.Filter(False, pattern) for pattern in _IGNORED_FILES]
+    return tracemalloc.take_snapshot().filter_traces(filters)
+
+
+def growth_sites(
+    baseline: tracemalloc.Snapshot, snapshot: tracemalloc.Snapshot, limit: int = 15
+) -> List[Dict[str, Any]]:
+    """Allocation sites that grew the most between two snapshots."""
+    sites = []
+    for stat in snapshot.compare_to(baseline, "lineno")[:limit]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        sites.append(
+            {
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+                "size_kb": round(stat.size / 1024, 1),
+            }
+        )
+    return sites
+
+
+def evaluate(
+    samples: List[Dict[str, Any]], max_growth_mb: float, max_rss_growth_mb: float
+) -> Dict[str, Any]:
+    """
+    Measure growth from the baseline (first) sample and check the thresholds.
+
+    Args:
+        samples: Samples in time order, the first one being the baseline
+        max_growth_mb: Allowed traced memory growth (MB)
+        max_rss_growth_mb: Allowed RSS growth (MB, 0 disables the check)
+
+    Returns:
+        Growth figures, the failed checks and whether the run passed
+    """
+    if len(samples) < 2:
+        return {
+            "failures": ["fewer than two samples; raise --duration"],
+            "passed": False,
+        }
+    first, last = samples[0], samples[-1]
+    traced = last["traced_mb"] - first["traced_mb"]
+    rss = (
+        last["rss_mb"] - first["rss_mb"]
+        if first["rss_mb"] is not None and last["rss_mb"] is not None
+        else None
+    )
+    requests = last["requests"] - first["requests"]
+    failures = []
+    if traced > max_growth_mb:
+        failures.append(
+            f"traced memory grew {traced:.2f} MB (limit {max_growth_mb} MB)"
+        )
+    if max_rss_growth_mb and rss is not None and rss > max_rss_growth_mb:
+        failures.append(f"RSS grew {rss:.2f} MB (limit {max_rss_growth_mb} MB)")
+    return {
+        "traced_mb": round(traced, 3),
+        "rss_mb": round(rss, 3) if rss is not None else None,
+        "traced_kb_per_1k_requests": (
+            round(traced * 1024 / requests * 1000, 3) if requests else 0.0
+        ),
+        "failures": failures,
+        "passed": not failures,
+    }
+
+
+# Service route mix: (weight, request builder taking the random source and
+# the fake catalog's product ids)
+RouteFunc = Callable[[random.Random, List[int]], Tuple[str, Dict[str, Any]]]
+
+
+def _ids(rng: random.Random, product_ids: List[int], most: int) -> str:
+    return ",".join(map(str, rng.sample(product_ids, rng.randint(1, most))))
+
+
+ROUTES: List[Tuple[int, RouteFunc]] = [
+    (1, lambda rng, ids: ("/categories", {})),
+    (1, lambda rng, ids: ("/groups", {"categoryId": rng.randint(1, 3)})),
+    (4, lambda rng, ids: ("/product-details", {"ids": _ids(rng, ids, 10)})),
+    (4, lambda rng, ids: ("/pricing/products", {"ids": _ids(rng, ids, 10)})),
+    (1, lambda rng, ids: ("/health", {})),
+]
+
+
+async def run_soak(
+    duration: float = 600.0,
+    interval: float = 30.0,
+    warmup: float = 120.0,
+    time_scale: float = 1.0,
+    users: int = 8,
+    cache_ttl: int = 5,
+    max_growth_mb: float = 10.0,
+    max_rss_growth_mb: float = 0.0,
+    server_config: Optional[FakeServerConfig] = None,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    """
+    Drive the service for ``duration`` seconds, sampling memory as it runs.
+
+    The first sample is taken after ``warmup`` seconds and is the baseline
+    for growth; samples are only taken while traffic runs, so the duration
+    should leave room for at least one more ``interval``.
+    """
+    import httpx
+
+    statuses: Counter = Counter()
+    samples: List[Dict[str, Any]] = []
+    requests = 0
+    upstream_calls = 0
+    rng = random.Random(seed)
+    baseline: Optional[tracemalloc.Snapshot] = None
+    snapshot: Optional[tracemalloc.Snapshot] = None
+
+    async with FakeTCGPlayer(server_config) as server:
+        config = ClientConfig(
+            base_url=server.base_url,
+            client_id="soak",
+            client_secret="soak",
+            cache_ttl=cache_ttl,
+        )
+        client = TCGPlayerClient(config=config, rate_limit_window=time_scale)
+        await client.authenticate()
+        service = _load_service(client)
+        # Trace from here: import-time allocations are not growth, and leaving
+        # them out keeps snapshots fast
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start(1)
+        product_ids = list(server.products)
+        weights = [weight for weight, _ in ROUTES]
+        builders = [build for _, build in ROUTES]
+        start = time.perf_counter()
+        deadline = start + duration
+
+        def sample() -> None:
+            nonlocal upstream_calls, baseline, snapshot
+            # The fake API's request log grows with traffic; keep it out
+            upstream_calls += server.api_calls()
+            server.reset_log()
+            gc.collect()
+            snapshot = _snapshot()
+            if baseline is None:
+                baseline = snapshot
+            rss = rss_bytes()
+            samples.append(
+                {
+                    "elapsed_seconds": round(time.perf_counter() - start, 3),
+                    "requests": requests,
+                    "traced_mb": round(
+                        sum(s.size for s in snapshot.statistics("filename")) / MB, 3
+                    ),
+                    "rss_mb": round(rss / MB, 3) if rss is not None else None,
+                    # Part of RSS: tracemalloc's own bookkeeping
+                    "tracemalloc_mb": round(
+                        tracemalloc.get_tracemalloc_memory() / MB, 3
+                    ),
+                    "tasks": len(asyncio.all_tasks()),
+                    "objects": count_instances(),
+                }
+            )
+
+        async def user(http: Any) -> None:
+            nonlocal requests
+            while time.perf_counter() < deadline:
+                path, params = rng.choices(builders, weights)[0](rng, product_ids)
+                response = await http.get(path, params=params)
+                statuses[str(response.status_code)] += 1
+                requests += 1
+
+        async def sampler() -> None:
+            # Let caches and pools fill up before taking the baseline
+            await asyncio.sleep(warmup)
+            while True:
+                sample()
+                await asyncio.sleep(interval)
+
+        transport = httpx.ASGITransport(app=service.app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://service"
+            ) as http:
+                sampling = asyncio.ensure_future(sampler())
+                try:
+                    await asyncio.gather(*(user(http) for _ in range(users)))
+                finally:
+                    sampling.cancel()
+                    await asyncio.gather(sampling, return_exceptions=True)
+        finally:
+            await client.close()
+            if not tracing:
+                tracemalloc.stop()
+        wall = time.perf_counter() - start
+
+    top = growth_sites(baseline, snapshot) if baseline and snapshot else []
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "wall_seconds": round(wall, 3),
+        # How long the upstream calls would take at the API's rate limit
+        "simulated_seconds": round(upstream_calls / config.max_requests_per_second, 1),
+        "requests": requests,
+        "upstream_calls": upstream_calls,
+        "statuses": dict(statuses),
+        "samples": samples,
+        "growth": evaluate(samples, max_growth_mb, max_rss_growth_mb),
+        "top_growth_sites": top,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--duration", type=float, default=600.0, help="Seconds")
+    parser.add_argument(
+        "--interval", type=float, default=30.0, help="Seconds between samples"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=120.0, help="Seconds before the baseline"
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="Rate limit window in seconds (10 requests per window)",
+    )
+    parser.add_argument("--users", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--cache-ttl", type=int, default=5)
+    parser.add_argument("--max-growth-mb", type=float, default=10.0)
+    parser.add_argument(
+        "--max-rss-growth-mb",
+        type=float,
+        default=0.0,
+        help="Fail above this RSS growth (0: report only)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", help="Write the JSON report to a file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("tcgplayer_client").setLevel(logging.WARNING)
+
+    report = asyncio.run(
+        run_soak(
+            duration=args.duration,
+            interval=args.interval,
+            warmup=args.warmup,
+            time_scale=args.time_scale,
+            users=args.users,
+            cache_ttl=args.cache_ttl,
+            max_growth_mb=args.max_growth_mb,
+            max_rss_growth_mb=args.max_rss_growth_mb,
+            server_config=FakeServerConfig(
+                latency_ms=args.latency_ms, latency_jitter_ms=0
+            ),
+            seed=args.seed,
+        )
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for failure in report["growth"]["failures"]:
+        print(f"Memory growth: {failure}", file=sys.stderr)
+    return 0 if report["growth"]["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,128 @@
-import os
 import asyncio
+import gzip
+import inspect
+import json
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args, get_origin
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field
 
 # Ensure local .env is loaded if present
 load_dotenv()
 
 try:
     from tcgplayer_client import TCGPlayerClient
+    from tcgplayer_client.budget import CallBudget, budget_scope
+    from tcgplayer_client.cache import RawResponse
+    from tcgplayer_client.cancellation import deadline_scope
+    from tcgplayer_client.config import get_env_bool, load_config
+    from tcgplayer_client.exceptions import (
+        BudgetExceededError,
+        OverloadedError,
+        QuotaExceededError,
+    )
+    from tcgplayer_client.exceptions import TimeoutError as ClientTimeoutError
+    from tcgplayer_client.exceptions import ValidationError
+    from tcgplayer_client.fair_queue import FairRateLimiter, tenant_scope
+    from tcgplayer_client.jobs import JobManager, import_set_job, sync_prices_job
+    from tcgplayer_client.logging_config import setup_logging
+    from tcgplayer_client.metrics import CONTENT_TYPE_LATEST, MetricsRegistry
+    from tcgplayer_client.reference_data import REFERENCE_FIELDS
+    from tcgplayer_client.validation import validate_id, validate_positive_integer
 except Exception as e:
     raise RuntimeError(
         "Failed to import tcgplayer_client. Make sure to install the package (pip install -e .)"
     ) from e
 
+logger = logging.getLogger("tcgplayer_service")
+
 client: Optional[TCGPlayerClient] = None
+jobs: Optional[JobManager] = None
+
+# Directory for background job checkpoints; unset keeps jobs in memory only
+JOBS_DIR = os.getenv("TCGPLAYER_SERVICE_JOBS_DIR") or None
+# Background jobs allowed to run at once (each shares the client rate limiter)
+MAX_RUNNING_JOBS = int(os.getenv("TCGPLAYER_SERVICE_MAX_RUNNING_JOBS", "2"))
+# Finished jobs (with their results) kept before the oldest are evicted
+MAX_FINISHED_JOBS = int(os.getenv("TCGPLAYER_SERVICE_MAX_FINISHED_JOBS", "100"))
+# Directory for per-job speedscope profiles; unset disables job profiling
+PROFILE_DIR = os.getenv("TCGPLAYER_SERVICE_PROFILE_DIR") or None
+
+# Service-level metrics; /metrics renders these with the client's registry
+service_metrics = MetricsRegistry()
+route_duration = service_metrics.histogram(
+    "tcgplayer_service_request_duration_seconds",
+    "Service request latency by route template, method and status.",
+    ("route", "method", "status"),
+)
+routes_in_flight = service_metrics.gauge(
+    "tcgplayer_service_in_flight_requests",
+    "Service requests currently being handled.",
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global client
+    global client, jobs
     client_id = os.getenv("TCGPLAYER_CLIENT_ID")
     client_secret = os.getenv("TCGPLAYER_CLIENT_SECRET")
     if not client_id or not client_secret:
-        raise RuntimeError("Missing TCGPLAYER_CLIENT_ID or TCGPLAYER_CLIENT_SECRET environment variables")
+        raise RuntimeError(
+            "Missing TCGPLAYER_CLIENT_ID or TCGPLAYER_CLIENT_SECRET environment variables"
+        )
 
-    client = TCGPlayerClient(client_id=client_id, client_secret=client_secret)
+    config = load_config()
+    # The service is shared by all app users: schedule upstream calls fairly
+    # between tenants unless explicitly disabled
+    config.fair_queuing = get_env_bool("TCGPLAYER_FAIR_QUEUING", True)
+    # Queued (off-loop) and sampled client logging, when configured
+    client_log = None
+    if config.log_queue or config.log_sample_rates:
+        client_log = setup_logging(
+            level=config.log_level,
+            log_file=config.log_file,
+            json_format=config.log_json_format,
+            sample_rates=config.log_sample_rates,
+            queued=config.log_queue,
+        )
+    client = TCGPlayerClient(
+        client_id=client_id, client_secret=client_secret, config=config
+    )
     # Authenticate at startup
     await client.authenticate()
+    # Preload reference data (categories, conditions, languages, rarities)
+    try:
+        await client.reference_data.load()
+    except Exception as e:
+        logger.warning(f"Reference data preload failed (will retry lazily): {e}")
+    client.reference_data.start_refresh_task()
+    jobs = JobManager(
+        state_dir=JOBS_DIR,
+        max_running_jobs=MAX_RUNNING_JOBS,
+        profile_dir=PROFILE_DIR,
+        max_finished_jobs=MAX_FINISHED_JOBS,
+    )
+    jobs.register("sync-prices", sync_prices_job(client))
+    jobs.register("import-set", import_set_job(client))
+    await jobs.resume()
     yield
-    # Cleanup
+    # Cleanup; unfinished jobs stay checkpointed and resume on next start
+    if jobs:
+        await jobs.shutdown()
     if client:
         await client.close()
+    if client_log:
+        client_log.stop_queue()
 
 
 app = FastAPI(title="TCGplayer Python Service", version="0.1.0", lifespan=lifespan)
@@ -47,9 +134,274 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Upstream-Calls",
+        "X-Upstream-Cache-Hits",
+        "X-Upstream-Coalesced",
+        "X-Upstream-Bytes",
+        "X-Upstream-Wait-Ms",
+    ],
 )
 
 
+def _http_error(e: Exception) -> HTTPException:
+    """Map a client error to an HTTP error (shed 503, over quota/budget 429)."""
+    if isinstance(e, OverloadedError):
+        retry_after = max(1, math.ceil(e.retry_after or 1))
+        return HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(retry_after)},
+        )
+    if isinstance(e, QuotaExceededError):
+        return HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after or 1)},
+        )
+    if isinstance(e, BudgetExceededError):
+        return HTTPException(status_code=429, detail=str(e))
+    if isinstance(e, ClientTimeoutError):
+        return HTTPException(status_code=504, detail=str(e))
+    return HTTPException(status_code=500, detail=str(e))
+
+
+@app.middleware("http")
+async def record_route_metrics(request: Request, call_next):
+    """Record per-route latency, labelled by route template rather than URL."""
+    start = time.perf_counter()
+    routes_in_flight.inc()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    except asyncio.CancelledError:
+        # Client went away before the response was sent
+        status = "499"
+        raise
+    finally:
+        routes_in_flight.dec()
+        # The router stores the matched route in the shared scope
+        route = request.scope.get("route")
+        route_duration.observe(
+            time.perf_counter() - start,
+            route=getattr(route, "path", "unmatched"),
+            method=request.method,
+            status=status,
+        )
+
+
+# Default deadline for upstream work per request in seconds (0 disables);
+# callers can send a shorter one in the X-Request-Timeout header
+REQUEST_TIMEOUT = float(os.getenv("TCGPLAYER_SERVICE_REQUEST_TIMEOUT", "0"))
+
+
+# Header naming the app user a request is made for; upstream slots are shared
+# fairly between tenants and per-tenant quotas apply
+TENANT_HEADER = os.getenv("TCGPLAYER_SERVICE_TENANT_HEADER", "X-Tenant-Id")
+_tenant_header = TENANT_HEADER.lower().encode("latin-1")
+
+
+def _request_tenant(scope: Dict[str, Any]) -> Optional[str]:
+    """Get the tenant key of a request from its header."""
+    for name, value in scope.get("headers", []):
+        if name == _tenant_header:
+            return value.decode("latin-1").strip()[:128] or None
+    return None
+
+
+def _request_timeout(scope: Dict[str, Any]) -> Optional[float]:
+    """Get the upstream deadline for a request from its header and the default."""
+    timeout = None
+    for name, value in scope.get("headers", []):
+        if name == b"x-request-timeout":
+            try:
+                timeout = float(value)
+            except ValueError:
+                pass
+            break
+    # Streams legitimately outlive request deadlines; only honor explicit ones
+    default = 0.0 if scope["path"].startswith("/export/") else REQUEST_TIMEOUT
+    if default > 0:
+        timeout = default if timeout is None else min(timeout, default)
+    return timeout if timeout is not None and timeout > 0 else None
+
+
+# Most upstream calls one service request may make (0: no limit); callers
+# can send a lower one in the X-Call-Budget header
+CALL_BUDGET = int(os.getenv("TCGPLAYER_SERVICE_CALL_BUDGET", "0"))
+
+
+def _request_budget(scope: Dict[str, Any]) -> Optional[int]:
+    """Get the upstream call limit for a request from its header and the default."""
+    limit = None
+    for name, value in scope.get("headers", []):
+        if name == b"x-call-budget":
+            try:
+                limit = int(value)
+            except ValueError:
+                pass
+            break
+    if CALL_BUDGET > 0:
+        limit = CALL_BUDGET if limit is None else min(limit, CALL_BUDGET)
+    return limit if limit is not None and limit >= 0 else None
+
+
+# Routes streaming their body after the response headers; their upstream
+# calls happen while streaming, so no cost headers are sent for them
+STREAMED_PREFIX = "/export/"
+
+
+def _budget_headers(budget: CallBudget) -> List[Tuple[bytes, bytes]]:
+    """Response headers reporting a request's upstream cost so far."""
+    return [
+        (b"x-upstream-calls", str(budget.upstream_calls).encode()),
+        (b"x-upstream-cache-hits", str(budget.cache_hits).encode()),
+        (b"x-upstream-coalesced", str(budget.coalesced).encode()),
+        (b"x-upstream-bytes", str(budget.bytes).encode()),
+        (b"x-upstream-wait-ms", f"{budget.limiter_wait * 1000:.1f}".encode()),
+    ]
+
+
+class CancelOnDisconnectMiddleware:
+    """Cancel a request's handler when its client disconnects.
+
+    The handler runs as its own task inside a ``deadline_scope`` for the
+    request's timeout, a ``tenant_scope`` for its tenant header and a
+    ``budget_scope`` whose totals are added to the response headers (except
+    for streamed exports, whose calls are made after the headers), while
+    this middleware watches the incoming ASGI messages. On
+    ``http.disconnect`` the handler is cancelled, which withdraws its
+    upstream requests from the rate limiter queue unless other coalesced
+    callers still need them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        budget: Optional[CallBudget] = None
+        report_cost = not scope["path"].startswith(STREAMED_PREFIX)
+
+        async def send_with_budget(message):
+            if (
+                message["type"] == "http.response.start"
+                and budget is not None
+                and report_cost
+            ):
+                message = dict(message)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    *_budget_headers(budget),
+                ]
+            await send(message)
+
+        with deadline_scope(_request_timeout(scope)), tenant_scope(
+            _request_tenant(scope)
+        ), budget_scope(scope["path"], _request_budget(scope)) as budget:
+            # The task copies the current context: deadline, tenant and budget
+            handler = asyncio.ensure_future(
+                self.app(scope, messages.get, send_with_budget)
+            )
+        disconnected = False
+
+        async def watch():
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    if not handler.done():
+                        disconnected = True
+                        handler.cancel()
+                    return
+
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+            logger.info(f"Client disconnected; cancelled {scope['path']}")
+        finally:
+            watcher.cancel()
+            if not handler.done():
+                handler.cancel()
+
+
+app.add_middleware(CancelOnDisconnectMiddleware)
+
+
+# Bodies at least this large are gzip-compressed when the caller accepts it
+GZIP_MIN_SIZE = int(os.getenv("TCGPLAYER_SERVICE_GZIP_MIN_SIZE", "1024"))
+# Compressed bodies kept per ETag so hot payloads are only compressed once
+GZIP_CACHE_SIZE = int(os.getenv("TCGPLAYER_SERVICE_GZIP_CACHE_SIZE", "256"))
+_gzip_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (any encoding variant)."""
+    if not if_none_match:
+        return False
+    base = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"').split("-", 1)[0] == base:
+            return True
+    return False
+
+
+def _gzip_body(etag: str, body: bytes) -> bytes:
+    """Gzip a body, reusing the compressed bytes for a repeated ETag."""
+    compressed = _gzip_cache.get(etag)
+    if compressed is None:
+        compressed = gzip.compress(body, compresslevel=6)
+        _gzip_cache[etag] = compressed
+        while len(_gzip_cache) > GZIP_CACHE_SIZE:
+            _gzip_cache.popitem(last=False)
+    else:
+        _gzip_cache.move_to_end(etag)
+    return compressed
+
+
+def _raw_json(raw: RawResponse, request: Optional[Request] = None) -> Response:
+    """Return an upstream/cached JSON body as-is, skipping decode/re-encode.
+
+    Honors If-None-Match with 304 using the ETag stored with the cache entry,
+    and gzips large bodies for callers that accept it.
+    """
+    headers = {"ETag": raw.etag, "Vary": "Accept-Encoding"}
+    if request is None:
+        return Response(
+            content=raw.body, media_type="application/json", headers=headers
+        )
+
+    if _etag_matches(request.headers.get("if-none-match"), raw.etag):
+        return Response(status_code=304, headers=headers)
+
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if len(raw.body) >= GZIP_MIN_SIZE and "gzip" in accept_encoding:
+        # Distinct strong ETag per content-coding
+        headers["ETag"] = raw.etag[:-1] + '-gzip"'
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=_gzip_body(raw.etag, raw.body),
+            media_type="application/json",
+            headers=headers,
+        )
+    return Response(content=raw.body, media_type="application/json", headers=headers)
+
+
 @app.get("/health")
 async def health():
     if not client:
@@ -58,14 +410,42 @@ async def health():
     return {"ok": True, "rate_limit": status}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Expose client, rate limiter, cache and service metrics for Prometheus."""
+    text = service_metrics.render()
+    if client:
+        text += client.metrics.registry.render()
+    return Response(content=text, media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/tenants")
+async def get_tenants():
+    """Per-tenant weights, quota usage, queue depth and average wait."""
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    limiter = client.rate_limiter
+    if not isinstance(limiter, FairRateLimiter):
+        return {"success": True, "fair_queuing": False, "tenants": {}}
+    return {
+        "success": True,
+        "fair_queuing": True,
+        "quota_window_seconds": limiter.quota_window,
+        "tenants": limiter.get_tenant_stats(),
+    }
+
+
 @app.get("/categories")
-async def get_categories():
+async def get_categories(request: Request = None):
     if not client:
         raise HTTPException(status_code=503, detail="Client not initialized")
     try:
-        return await client.endpoints.catalog.get_categories()
+        return _raw_json(
+            await client._make_api_request("/catalog/categories", raw=True), request
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
+
 
 @app.get("/category-media")
 async def get_category_media(categoryId: int = Query(..., description="Category ID")):
@@ -74,7 +454,7 @@ async def get_category_media(categoryId: int = Query(..., description="Category
     try:
         return await client.endpoints.catalog.get_category_media(categoryId)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
 
 
 @app.get("/groups")
@@ -83,6 +463,7 @@ async def get_groups(
     name: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    request: Request = None,
 ):
     """List groups (sets), optionally filtered by categoryId and name.
 
@@ -100,13 +481,35 @@ async def get_groups(
             params["limit"] = limit
         if offset is not None:
             params["offset"] = offset
-        return await client._make_api_request("/catalog/groups", params=params)
+        return _raw_json(
+            await client._make_api_request("/catalog/groups", params=params, raw=True),
+            request,
+        )
+    except Exception as e:
+        raise _http_error(e)
+
+
+@app.get("/groups/by-ids")
+async def get_groups_by_ids(
+    ids: str = Query(..., description="Comma-separated group IDs")
+):
+    """Get group (set) details for many IDs, in request order.
+
+    Uncached IDs are fetched in batched /catalog/groups/{ids} calls.
+    """
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    try:
+        group_ids: List[int] = [int(x) for x in ids.split(",") if x]
+        return await client.endpoints.catalog.get_groups_by_ids(group_ids)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
 
 
 @app.get("/skus")
-async def get_skus(productIds: str = Query(..., description="Comma-separated product IDs")):
+async def get_skus(
+    productIds: str = Query(..., description="Comma-separated product IDs")
+):
     """Fetch SKUs for one or more product IDs."""
     if not client:
         raise HTTPException(status_code=503, detail="Client not initialized")
@@ -114,7 +517,7 @@ async def get_skus(productIds: str = Query(..., description="Comma-separated pro
         ids: List[int] = [int(x) for x in productIds.split(",") if x]
         return await client.endpoints.catalog.get_skus(ids)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
 
 
 @app.get("/media")
@@ -126,18 +529,21 @@ async def get_media(productId: int = Query(..., description="Single product ID")
         # The endpoint helper expects a list; for single product we use the single-product path
         return await client.endpoints.catalog.get_product_media([productId])
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
 
 
 @app.get("/product-details")
-async def get_product_details(ids: str = Query(..., description="Comma-separated product IDs")):
+async def get_product_details(
+    ids: str = Query(..., description="Comma-separated product IDs")
+):
     if not client:
         raise HTTPException(status_code=503, detail="Client not initialized")
     try:
         product_ids: List[int] = [int(x) for x in ids.split(",") if x]
         return await client.endpoints.catalog.get_product_details(product_ids)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
+
 
 @app.get("/products")
 async def get_products(
@@ -158,26 +564,402 @@ async def get_products(
             offset=offset,
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
+
+
+def _ndjson_page(items: List[Any]) -> bytes:
+    """Encode a page of items as newline-delimited JSON."""
+    return "".join(
+        json.dumps(item, separators=(",", ":")) + "\n" for item in items
+    ).encode()
+
+
+def _validate_export(page_size: Optional[int] = None, **ids: Optional[int]) -> None:
+    """Reject bad export filters with a 400 before the 200 headers are sent."""
+    try:
+        for name, value in ids.items():
+            if value is not None:
+                validate_id(value, name)
+        if page_size is not None:
+            validate_positive_integer(page_size, "pageSize")
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/export/products")
+async def export_products(
+    categoryId: Optional[int] = None,
+    groupId: Optional[int] = None,
+    pageSize: int = 100,
+):
+    """Stream every matching product as NDJSON (one product per line).
+
+    Pages are fetched inside the service only as fast as the caller reads, so
+    memory stays bounded to a single page regardless of export size. If the
+    export fails part way, a final ``{"error": ...}`` line says so.
+    """
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    if categoryId is None and groupId is None:
+        raise HTTPException(status_code=400, detail="categoryId or groupId is required")
+    _validate_export(pageSize, categoryId=categoryId, groupId=groupId)
+
+    async def stream():
+        exported = 0
+        try:
+            async for page in client.endpoints.catalog.iter_products(
+                category_id=categoryId, group_id=groupId, page_size=pageSize
+            ):
+                exported += len(page)
+                yield _ndjson_page(page)
+        except Exception as e:
+            # The 200 is already sent; tell a truncated export from a short one
+            logger.warning(f"Product export failed after {exported} rows: {e}")
+            yield _ndjson_page([{"error": str(e), "exported": exported}])
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.get("/export/prices")
+async def export_prices(
+    groupId: Optional[int] = None,
+    categoryId: Optional[int] = None,
+):
+    """Stream group price rows as NDJSON.
+
+    With groupId, streams that group's prices; with categoryId, walks every
+    group in the category and streams their prices one group at a time.
+    Prices bypass the response cache, like catalog pages. A group that fails
+    gets an inline ``{"groupId": ..., "error": ...}`` line; if the group walk
+    itself fails, a final ``{"error": ...}`` line ends the stream.
+    """
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    if categoryId is None and groupId is None:
+        raise HTTPException(status_code=400, detail="groupId or categoryId is required")
+    _validate_export(groupId=groupId, categoryId=categoryId)
+
+    async def group_ids():
+        if groupId is not None:
+            yield groupId
+            return
+        async for page in client.endpoints.catalog.iter_groups(category_id=categoryId):
+            for group in page:
+                yield group["groupId"]
+
+    async def stream():
+        try:
+            async for gid in group_ids():
+                try:
+                    # PricingEndpoints.get_product_prices_by_group, uncached
+                    response = await client._make_api_request(
+                        f"/pricing/group/{gid}", use_cache=False
+                    )
+                except Exception as e:
+                    # Keep the stream going; report the failed group inline
+                    yield _ndjson_page([{"groupId": gid, "error": str(e)}])
+                    continue
+                yield _ndjson_page(
+                    [{**row, "groupId": gid} for row in response.get("results") or []]
+                )
+        except Exception as e:
+            logger.warning(f"Price export of category {categoryId} failed: {e}")
+            yield _ndjson_page([{"error": str(e)}])
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @app.get("/pricing/products")
-async def get_product_prices(ids: str = Query(..., description="Comma-separated product IDs")):
+async def get_product_prices(
+    ids: str = Query(..., description="Comma-separated product IDs"),
+    request: Request = None,
+):
     if not client:
         raise HTTPException(status_code=503, detail="Client not initialized")
     try:
         product_ids: List[int] = [int(x) for x in ids.split(",") if x]
-        return await client.endpoints.pricing.get_market_prices(product_ids)
+        # Same endpoint as PricingEndpoints.get_market_prices, passed through raw
+        return _raw_json(
+            await client._make_api_request(
+                f"/pricing/product/{','.join(map(str, product_ids))}", raw=True
+            ),
+            request,
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
 
 
 @app.get("/pricing/skus")
-async def get_sku_prices(ids: str = Query(..., description="Comma-separated SKU IDs")):
+async def get_sku_prices(
+    ids: str = Query(..., description="Comma-separated SKU IDs"),
+    request: Request = None,
+):
     if not client:
         raise HTTPException(status_code=503, detail="Client not initialized")
     try:
         sku_ids: List[int] = [int(x) for x in ids.split(",") if x]
-        return await client.endpoints.pricing.get_sku_market_prices(sku_ids)
+        # Same endpoint as PricingEndpoints.get_sku_market_prices, passed through raw
+        return _raw_json(
+            await client._make_api_request(
+                "/pricing/marketprices/skus",
+                params={"skuIds": ",".join(map(str, sku_ids))},
+                raw=True,
+            ),
+            request,
+        )
+    except Exception as e:
+        raise _http_error(e)
+
+
+@app.get("/reference/{kind}")
+async def get_reference_data(kind: str, categoryId: Optional[int] = None):
+    """Get an id -> name table of reference data.
+
+    Kinds are categories, conditions, languages, rarities and printings.
+    Tables come from the preloaded reference data registry; per-category
+    printings and rarities are loaded on first use.
+    """
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    if kind not in REFERENCE_FIELDS:
+        raise HTTPException(
+            status_code=404, detail=f"Unknown reference data kind: {kind}"
+        )
+    try:
+        reference = client.reference_data
+        await reference.ensure_loaded()
+        if categoryId is not None and kind in ("printings", "rarities"):
+            await reference.ensure_category(categoryId)
+        table = reference.table(kind, categoryId)
+        return {"success": True, "kind": kind, "results": dict(table.by_id)}
+    except Exception as e:
+        raise _http_error(e)
+
+
+# Maximum sub-requests accepted by a single /batch call
+MAX_BATCH_SIZE = int(os.getenv("TCGPLAYER_SERVICE_MAX_BATCH_SIZE", "50"))
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = None
+    path: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+
+def _coerce_param(value: Any, annotation: Any) -> Any:
+    """Coerce a sub-request parameter to the route handler's annotated type."""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    if value is None or annotation in (Any, inspect.Parameter.empty):
+        return value
+    if annotation is str and isinstance(value, list):
+        return ",".join(map(str, value))
+    if annotation in (int, float, str) and not isinstance(value, annotation):
+        return annotation(value)
+    return value
+
+
+def _resolve_batch_route(path: str) -> Tuple[Any, Dict[str, str]]:
+    """Find the GET route handler and path parameters for a sub-request path."""
+    for route in app.routes:
+        if (
+            isinstance(route, APIRoute)
+            and "GET" in route.methods
+            and route.path != "/batch"
+            and not route.path.startswith(STREAMED_PREFIX)
+        ):
+            match = route.path_regex.match(path)
+            if match:
+                return route.endpoint, match.groupdict()
+    raise HTTPException(status_code=404, detail=f"Unknown route: {path}")
+
+
+async def _run_batch_item(path: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+    """Run one sub-request against an existing route handler."""
+    try:
+        endpoint, path_params = _resolve_batch_route(path)
+        signature = inspect.signature(endpoint)
+        kwargs = {**params, **path_params}
+        # The HTTP request is not forwarded: sub-responses are plain JSON
+        accepted = {
+            name
+            for name, param in signature.parameters.items()
+            if param.annotation is not Request
+        }
+        unknown = set(kwargs) - accepted
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown parameters: {sorted(unknown)}"
+            )
+        try:
+            kwargs = {
+                name: _coerce_param(value, signature.parameters[name].annotation)
+                for name, value in kwargs.items()
+            }
+            # Fill omitted optional params with plain defaults, not Query objects
+            for name, param in signature.parameters.items():
+                if name not in kwargs:
+                    default = param.default
+                    required = default is inspect.Parameter.empty or (
+                        hasattr(default, "is_required") and default.is_required()
+                    )
+                    if required:
+                        raise HTTPException(
+                            status_code=400, detail=f"Missing parameter: {name}"
+                        )
+                    kwargs[name] = getattr(default, "default", default)
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        result = await endpoint(**kwargs)
+        if isinstance(result, Response):
+            # Raw pass-through routes return JSON bytes, embedded parsed;
+            # other bodies (e.g. /metrics) are embedded as text
+            body = bytes(result.body)
+            if result.media_type != "application/json":
+                return result.status_code, body.decode(result.charset)
+            return result.status_code, json.loads(body) if body else None
+        return 200, result
+    except HTTPException as e:
+        return e.status_code, {"detail": e.detail}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return 500, {"detail": str(e)}
+
+
+@app.post("/batch")
+async def batch(request: BatchRequest):
+    """Run several GET sub-requests in one round trip.
+
+    Each item names an existing route (e.g. "/categories", "/pricing/products")
+    and its query parameters. Identical sub-requests are executed once, all
+    unique ones run concurrently, and each result carries its own status.
+    """
+    if not client:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    if len(request.requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many sub-requests: {len(request.requests)} > {MAX_BATCH_SIZE}",
+        )
+
+    # Dedupe identical sub-requests by path + canonical params
+    keys = [
+        (item.path, json.dumps(item.params, sort_keys=True, default=str))
+        for item in request.requests
+    ]
+    unique = list(dict.fromkeys(keys))
+    outcomes = await asyncio.gather(
+        *(_run_batch_item(path, json.loads(params)) for path, params in unique)
+    )
+    by_key = dict(zip(unique, outcomes))
+
+    results = []
+    for item, key in zip(request.requests, keys):
+        status, body = by_key[key]
+        results.append(
+            {"id": item.id, "path": item.path, "status": status, "body": body}
+        )
+    return {
+        "success": True,
+        "deduplicated": len(keys) - len(unique),
+        "results": results,
+    }
+
+
+def _get_job_manager() -> JobManager:
+    if not client or not jobs:
+        raise HTTPException(status_code=503, detail="Client not initialized")
+    return jobs
+
+
+async def _submit_job(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    manager = _get_job_manager()
+    try:
+        job = await manager.submit(kind, params)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return job.to_dict()
+
+
+class SyncPricesJobRequest(BaseModel):
+    productIds: Optional[List[int]] = None
+    # productId -> groupId, lets the job use group-level pricing calls
+    productGroups: Optional[Dict[int, int]] = None
+    groupIds: Optional[List[int]] = None
+    categoryId: Optional[int] = None
+
+
+class ImportSetJobRequest(BaseModel):
+    groupId: int
+
+
+@app.post("/jobs/sync-prices", status_code=202)
+async def submit_sync_prices(request: SyncPricesJobRequest):
+    """Start a background price refresh for products, groups or a category.
+
+    Returns the job immediately; poll GET /jobs/{id} for progress and ETA and
+    read rows from GET /jobs/{id}/results.
+    """
+    params = request.model_dump(exclude_none=True)
+    if not any(k in params for k in ("productIds", "groupIds", "categoryId")):
+        raise HTTPException(
+            status_code=400, detail="One of productIds, groupIds or categoryId"
+        )
+    return await _submit_job("sync-prices", params)
+
+
+@app.post("/jobs/import-set", status_code=202)
+async def submit_import_set(request: ImportSetJobRequest):
+    """Start a background import of a set's products, SKUs and prices."""
+    return await _submit_job("import-set", request.model_dump())
+
+
+@app.get("/jobs")
+async def list_jobs():
+    manager = _get_job_manager()
+    return {
+        "success": True,
+        "stats": manager.get_stats(),
+        "jobs": [job.to_dict() for job in manager.list_jobs()],
+    }
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = _get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job.to_dict()
+
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10000),
+):
+    """Page through a job's result rows (available while it is running)."""
+    job = _get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return {
+        "success": True,
+        "status": job.status,
+        "total": len(job.results),
+        "offset": offset,
+        "results": job.results[offset : offset + limit],
+    }
+
+
+@app.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    manager = _get_job_manager()
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    cancelled = await manager.cancel(job_id)
+    return {"success": cancelled, "job": job.to_dict()}
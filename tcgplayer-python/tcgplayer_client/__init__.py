@@ -9,13 +9,26 @@ A Python client library for the TCGPlayer API with support for:
 """
 
 from .auth import TCGPlayerAuth
+from .budget import CallBudget, budget_scope, get_budget
 from .cache import (
     CacheEntry,
     CacheKeyGenerator,
     CacheManager,
     LRUCache,
+    RawResponse,
     ResponseCache,
+    compute_etag,
 )
+from .cancellation import RequestCoalescer, deadline_scope
+from .cassette import (
+    Cassette,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    record_session,
+    replay_session,
+)
+from .chaos import FaultConfig, FaultInjectionTransport, inject_faults
 from .client import TCGPlayerClient
 from .config import (
     ClientConfig,
@@ -29,22 +42,57 @@ from .config import (
 from .exceptions import (
     APIError,
     AuthenticationError,
+    BudgetExceededError,
+    CassetteMissError,
     ConfigurationError,
     InvalidResponseError,
     NetworkError,
+    OverloadedError,
+    QuotaExceededError,
     RateLimitError,
     RetryExhaustedError,
     TCGPlayerError,
     TimeoutError,
     ValidationError,
 )
+from .fair_queue import FairRateLimiter, get_tenant, tenant_scope
+from .gtin_index import GTINIndex, normalize_gtin
+from .hooks import HOOK_EVENTS, HookContext, HookRegistry
+from .jobs import (
+    Job,
+    JobDefinition,
+    JobManager,
+    import_set_job,
+    sync_prices_job,
+)
 from .logging_config import (
+    SamplingFilter,
     StructuredFormatter,
     TCGPlayerLogger,
     get_logger,
     setup_logging,
 )
+from .metrics import (
+    ClientMetrics,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    endpoint_template,
+)
+from .price_changes import (
+    PriceChange,
+    PriceChangeDetector,
+    PriceDelta,
+    PriceSnapshot,
+    diff_snapshots,
+)
+from .pricing_planner import PricingPlan, execute_pricing_plan, plan_price_requests
+from .profiling import SamplingProfiler
 from .rate_limiter import RateLimiter
+from .reference_data import LookupTable, ReferenceData
+from .sku_index import SKUIndex, pack_sku_key
+from .tracing import MetricsTimingSink, RequestTiming, TimingRecorder
 from .validation import (
     ParameterValidator,
     validate_id,
@@ -70,6 +118,7 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "StructuredFormatter",
+    "SamplingFilter",
     "ClientConfig",
     "ConfigurationManager",
     "load_config",
@@ -82,14 +131,69 @@ __all__ = [
     "LRUCache",
     "CacheEntry",
     "CacheKeyGenerator",
+    "RawResponse",
+    "compute_etag",
+    "GTINIndex",
+    "normalize_gtin",
+    "SKUIndex",
+    "pack_sku_key",
+    "PricingPlan",
+    "plan_price_requests",
+    "execute_pricing_plan",
+    "PriceSnapshot",
+    "PriceChange",
+    "PriceDelta",
+    "PriceChangeDetector",
+    "diff_snapshots",
+    "RequestCoalescer",
+    "deadline_scope",
+    "FairRateLimiter",
+    "tenant_scope",
+    "get_tenant",
+    "JobManager",
+    "JobDefinition",
+    "Job",
+    "sync_prices_job",
+    "import_set_job",
+    "ReferenceData",
+    "LookupTable",
+    "MetricsRegistry",
+    "ClientMetrics",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "endpoint_template",
+    "RequestTiming",
+    "TimingRecorder",
+    "MetricsTimingSink",
+    "HookRegistry",
+    "HookContext",
+    "HOOK_EVENTS",
+    "Cassette",
+    "Interaction",
+    "RecordingTransport",
+    "ReplayTransport",
+    "record_session",
+    "replay_session",
+    "CallBudget",
+    "budget_scope",
+    "get_budget",
+    "SamplingProfiler",
+    "FaultConfig",
+    "FaultInjectionTransport",
+    "inject_faults",
     "TCGPlayerError",
     "AuthenticationError",
     "RateLimitError",
     "APIError",
     "NetworkError",
+    "OverloadedError",
+    "QuotaExceededError",
     "ValidationError",
     "ConfigurationError",
     "TimeoutError",
     "RetryExhaustedError",
     "InvalidResponseError",
+    "CassetteMissError",
+    "BudgetExceededError",
 ]
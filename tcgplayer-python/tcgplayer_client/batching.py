@@ -0,0 +1,50 @@
+"""
+ID batching helpers for TCGPlayer Client.
+
+Many TCGPlayer endpoints accept a comma-separated list of IDs in the path.
+This module provides the shared chunking used when fanning out such calls.
+"""
+
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+# IDs per comma-joined path segment; keeps URLs well under server limits
+DEFAULT_ID_BATCH_SIZE = 25
+
+
+def chunked(items: Iterable[T], size: int = DEFAULT_ID_BATCH_SIZE) -> Iterator[List[T]]:
+    """
+    Split items into lists of at most ``size`` elements.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk size
+
+    Yields:
+        Consecutive chunks of items
+    """
+    if size <= 0:
+        raise ValueError("size must be positive")
+
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def unique_ids(ids: Iterable[int]) -> List[int]:
+    """
+    Deduplicate IDs while preserving first-seen order.
+
+    Args:
+        ids: IDs to deduplicate
+
+    Returns:
+        Unique IDs in request order
+    """
+    return list(dict.fromkeys(int(i) for i in ids))
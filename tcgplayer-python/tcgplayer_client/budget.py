@@ -0,0 +1,173 @@
+"""
+API call budgets for logical operations.
+
+A ``budget_scope`` counts what the client requests made within it cost:
+upstream calls (each attempt, including retries), cache hits, calls served
+by joining an identical in-flight fetch, response bytes and time spent
+waiting for rate limiter slots. Scopes nest: an operation's costs also count
+towards every enclosing scope, so a collection import can be broken down by
+step. A scope with a ``limit`` rejects new upstream requests once it has made
+that many calls. Each request reserves its call before queueing for a rate
+limiter slot, so concurrent requests cannot overshoot the limit.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from .exceptions import BudgetExceededError
+
+_budget: ContextVar[Optional["CallBudget"]] = ContextVar(
+    "tcgplayer_budget", default=None
+)
+
+
+@dataclass
+class CallBudget:
+    """Upstream cost of the requests made within a ``budget_scope``."""
+
+    name: str = "operation"
+    limit: Optional[int] = None  # most upstream calls allowed (None: no limit)
+    upstream_calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    bytes: int = 0
+    limiter_wait: float = 0.0
+    reserved: int = 0  # calls reserved but not yet sent
+    parent: Optional["CallBudget"] = field(default=None, repr=False)
+
+    def _chain(self) -> Iterator["CallBudget"]:
+        budget: Optional[CallBudget] = self
+        while budget is not None:
+            yield budget
+            budget = budget.parent
+
+    def check(self, endpoint: str = "") -> None:
+        """
+        Reject a new upstream request if this or an enclosing budget is spent.
+
+        Reserved calls count as made.
+
+        Args:
+            endpoint: Endpoint about to be requested (for the error message)
+
+        Raises:
+            BudgetExceededError: If a budget's call limit has been reached
+        """
+        for budget in self._chain():
+            if (
+                budget.limit is not None
+                and budget.upstream_calls + budget.reserved >= budget.limit
+            ):
+                raise BudgetExceededError(
+                    f"Call budget of {budget.name} exhausted: {budget.limit} "
+                    f"upstream calls made, not requesting {endpoint}",
+                    name=budget.name,
+                    limit=budget.limit,
+                )
+
+    def reserve(self, endpoint: str = "") -> "BudgetReservation":
+        """
+        Check the limits and reserve one upstream call in a single step.
+
+        Args:
+            endpoint: Endpoint about to be requested (for the error message)
+
+        Returns:
+            The reservation; commit it once the call is sent, or release it
+
+        Raises:
+            BudgetExceededError: If a budget's call limit has been reached
+        """
+        self.check(endpoint)
+        for budget in self._chain():
+            budget.reserved += 1
+        return BudgetReservation(self)
+
+    def record_call(self, limiter_wait: float = 0.0) -> None:
+        """Count an upstream call attempt and its rate limiter wait."""
+        for budget in self._chain():
+            budget.upstream_calls += 1
+            budget.limiter_wait += limiter_wait
+
+    def record_bytes(self, size: int) -> None:
+        """Count response body bytes received from upstream."""
+        for budget in self._chain():
+            budget.bytes += size
+
+    def record_cache_hit(self) -> None:
+        """Count a request answered from the response cache."""
+        for budget in self._chain():
+            budget.cache_hits += 1
+
+    def record_coalesced(self) -> None:
+        """Count a request answered by an identical in-flight fetch."""
+        for budget in self._chain():
+            budget.coalesced += 1
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Upstream calls left before the limit (None without a limit)."""
+        if self.limit is None:
+            return None
+        return max(0, self.limit - self.upstream_calls)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging or responses."""
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "upstream_calls": self.upstream_calls,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "bytes": self.bytes,
+            "limiter_wait_seconds": round(self.limiter_wait, 6),
+        }
+
+
+class BudgetReservation:
+    """An upstream call reserved against a budget before it is sent."""
+
+    def __init__(self, budget: CallBudget) -> None:
+        self.budget = budget
+        self.active = True
+
+    def release(self) -> None:
+        """Give the reserved call back (no-op once committed or released)."""
+        if self.active:
+            self.active = False
+            for budget in self.budget._chain():
+                budget.reserved -= 1
+
+    def commit(self, limiter_wait: float = 0.0) -> None:
+        """Count the reserved call as made, with its rate limiter wait."""
+        self.release()
+        self.budget.record_call(limiter_wait)
+
+
+@contextmanager
+def budget_scope(
+    name: str = "operation", limit: Optional[int] = None
+) -> Iterator[CallBudget]:
+    """
+    Account for all client requests made within the block.
+
+    Args:
+        name: Operation name (e.g. "collection-import")
+        limit: Most upstream calls the block may make (None: no limit)
+
+    Yields:
+        The budget, updated as requests complete
+    """
+    budget = CallBudget(name=name, limit=limit, parent=_budget.get())
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def get_budget() -> Optional[CallBudget]:
+    """Get the innermost budget of the current context, if any."""
+    return _budget.get()
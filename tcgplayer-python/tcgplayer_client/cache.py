@@ -11,12 +11,41 @@ import json
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+
+    Args:
+        body: Response body bytes
+
+    Returns:
+        Quoted ETag value
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class RawResponse(NamedTuple):
+    """Undecoded response body with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+# Value of an entry stored only as its undecoded body
+UNDECODED = object()
 
 
 @dataclass
 class CacheEntry:
-    """Represents a cached item."""
+    """Represents a cached item.
+
+    An entry keeps a response in one form only: the parsed ``value``, or (for
+    raw pass-through fetches) the undecoded ``raw`` body with ``value`` set to
+    ``UNDECODED``. The other form is derived on each access rather than kept.
+    """
 
     key: str
     value: Any
@@ -24,10 +53,31 @@ class CacheEntry:
     ttl: int = 300  # 5 minutes default
     access_count: int = 0
     last_accessed: float = field(default_factory=time.time)
-
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return time.time() - self.timestamp > self.ttl
+    raw: Optional[bytes] = None  # Undecoded response body, if kept
+    etag: Optional[str] = None  # Strong ETag of the raw body, computed lazily
+    size: Optional[int] = None  # Length of the response body, if known
+
+    def get_value(self) -> Any:
+        """Get the parsed value, decoding the body if only that was kept."""
+        if self.value is UNDECODED:
+            return json.loads(self.raw or b"null")
+        return self.value
+
+    def get_raw(self) -> bytes:
+        """Get the response body bytes, encoding the value if none were kept."""
+        if self.raw is None:
+            return json.dumps(self.value, separators=(",", ":")).encode()
+        return self.raw
+
+    def get_etag(self) -> str:
+        """Get the strong ETag of the response body, hashing it once."""
+        if self.etag is None:
+            self.etag = compute_etag(self.get_raw())
+        return self.etag
+
+    def is_expired(self, grace: float = 0) -> bool:
+        """Check if the cache entry has expired (optionally past a grace period)."""
+        return time.time() - self.timestamp > self.ttl + grace
 
     def access(self):
         """Mark the entry as accessed."""
@@ -38,7 +88,7 @@ class CacheEntry:
         """Convert to dictionary for serialization."""
         return {
             "key": self.key,
-            "value": self.value,
+            "value": self.get_value(),
             "timestamp": self.timestamp,
             "ttl": self.ttl,
             "access_count": self.access_count,
@@ -93,16 +143,21 @@ class CacheKeyGenerator:
 class LRUCache:
     """LRU (Least Recently Used) cache implementation."""
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, stale_ttl: int = 0):
         """
         Initialize LRU cache.
 
         Args:
             max_size: Maximum number of cache entries
+            stale_ttl: Seconds expired entries are kept for stale reads
         """
         self.max_size = max_size
+        self.stale_ttl = stale_ttl
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = asyncio.Lock()
+        # Running totals of removed entries, for metrics
+        self.evictions = 0
+        self.expirations = 0
 
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -114,23 +169,49 @@ class LRUCache:
         Returns:
             Cached value or None if not found/expired
         """
+        entry = await self.get_entry(key)
+        return entry.get_value() if entry is not None else None
+
+    async def get_entry(
+        self, key: str, allow_stale: bool = False
+    ) -> Optional[CacheEntry]:
+        """
+        Get a cache entry, including its raw body if one was stored.
+
+        Args:
+            key: Cache key
+            allow_stale: Also return entries expired within ``stale_ttl``
+
+        Returns:
+            Cache entry or None if not found/expired
+        """
         async with self._lock:
             if key in self.cache:
                 entry = self.cache[key]
 
-                # Check if expired
+                # Check if expired; keep it for stale reads within the grace
                 if entry.is_expired():
+                    if not entry.is_expired(self.stale_ttl):
+                        return entry if allow_stale else None
                     del self.cache[key]
+                    self.expirations += 1
                     return None
 
                 # Mark as accessed and move to end (most recently used)
                 entry.access()
                 self.cache.move_to_end(key)
-                return entry.value
+                return entry
 
             return None
 
-    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = 300,
+        raw: Optional[bytes] = None,
+        size: Optional[int] = None,
+    ) -> None:
         """
         Set a value in cache.
 
@@ -138,10 +219,16 @@ class LRUCache:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
+            raw: Optional undecoded body to serve without re-encoding; when
+                given only the body is kept and the value is decoded on access
+            size: Length of the response body (default: that of ``raw``)
         """
         async with self._lock:
             # Create new entry
-            entry = CacheEntry(key=key, value=value, ttl=ttl)
+            if raw is not None:
+                value = UNDECODED
+                size = len(raw)
+            entry = CacheEntry(key=key, value=value, ttl=ttl, raw=raw, size=size)
 
             # If key exists, remove old entry
             if key in self.cache:
@@ -153,6 +240,7 @@ class LRUCache:
             # Evict oldest entries if cache is full
             while len(self.cache) > self.max_size:
                 self.cache.popitem(last=False)
+                self.evictions += 1
 
     async def delete(self, key: str) -> bool:
         """
@@ -214,6 +302,8 @@ class LRUCache:
                 "utilization": (total_entries / self.max_size) * 100,
                 "average_ttl": avg_ttl,
                 "average_access_count": avg_access,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
             }
 
     async def cleanup_expired(self) -> int:
@@ -225,11 +315,14 @@ class LRUCache:
         """
         async with self._lock:
             expired_keys = [
-                key for key, entry in self.cache.items() if entry.is_expired()
+                key
+                for key, entry in self.cache.items()
+                if entry.is_expired(self.stale_ttl)
             ]
 
             for key in expired_keys:
                 del self.cache[key]
+            self.expirations += len(expired_keys)
 
             return len(expired_keys)
 
@@ -242,6 +335,7 @@ class ResponseCache:
         max_size: int = 1000,
         default_ttl: int = 300,
         enable_compression: bool = False,
+        stale_ttl: int = 0,
     ):
         """
         Initialize response cache.
@@ -250,8 +344,9 @@ class ResponseCache:
             max_size: Maximum cache size
             default_ttl: Default time to live in seconds
             enable_compression: Whether to enable response compression
+            stale_ttl: Seconds expired responses stay available for stale reads
         """
-        self.cache = LRUCache(max_size)
+        self.cache = LRUCache(max_size, stale_ttl)
         self.default_ttl = default_ttl
         self.enable_compression = enable_compression
         self.key_generator = CacheKeyGenerator()
@@ -343,6 +438,34 @@ class ResponseCache:
         key = self.key_generator.generate_key(endpoint, params, method, data)
         return await self.cache.get(key)
 
+    async def get_cached_entry(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        data: Optional[Any] = None,
+        allow_stale: bool = False,
+    ) -> Optional[CacheEntry]:
+        """
+        Get the cache entry for a request, giving access to its raw body.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            method: HTTP method
+            data: Request body data
+            allow_stale: Also return recently expired entries (check
+                ``entry.is_expired()`` to tell them apart)
+
+        Returns:
+            Cache entry or None
+        """
+        if self._cleanup_task is None:
+            self._start_cleanup_task()
+
+        key = self.key_generator.generate_key(endpoint, params, method, data)
+        return await self.cache.get_entry(key, allow_stale)
+
     async def cache_response(
         self,
         endpoint: str,
@@ -352,6 +475,8 @@ class ResponseCache:
         response: Any = None,
         status_code: int = 200,
         custom_ttl: Optional[int] = None,
+        raw: Optional[bytes] = None,
+        size: Optional[int] = None,
     ) -> bool:
         # Start cleanup task if not already started
         if self._cleanup_task is None:
@@ -367,6 +492,8 @@ class ResponseCache:
             response: Response to cache
             status_code: HTTP status code
             custom_ttl: Custom TTL override
+            raw: Undecoded response body to keep instead of the parsed value
+            size: Length of the response body, when only the value is kept
 
         Returns:
             True if response was cached, False otherwise
@@ -377,7 +504,7 @@ class ResponseCache:
         key = self.key_generator.generate_key(endpoint, params, method, data)
         ttl = custom_ttl or self.default_ttl
 
-        await self.cache.set(key, response, ttl)
+        await self.cache.set(key, response, ttl, raw, size)
         return True
 
     async def invalidate_endpoint(self, endpoint: str) -> int:
@@ -440,11 +567,13 @@ class CacheManager:
             max_size = cache_config.get("max_size", 1000)
             default_ttl = cache_config.get("default_ttl", 300)
             enable_compression = cache_config.get("enable_compression", False)
+            stale_ttl = cache_config.get("stale_ttl", 0)
 
             self.caches[name] = ResponseCache(
                 max_size=max_size,
                 default_ttl=default_ttl,
                 enable_compression=enable_compression,
+                stale_ttl=stale_ttl,
             )
 
         return self.caches[name]
@@ -0,0 +1,164 @@
+"""
+Request deadlines and coalescing for TCGPlayer Client.
+
+This module lets callers bound how long a request may take (via an explicit
+deadline or an ambient ``deadline_scope``) and shares one upstream fetch
+between identical concurrent GET requests. A fetch is cancelled, releasing
+its place in the rate limiter queue, as soon as no caller is waiting for it.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Absolute time.monotonic() deadline for requests made in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("tcgplayer_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Bound all client requests made within the block.
+
+    Nested scopes can only shorten the effective deadline.
+
+    Args:
+        timeout: Seconds from now (None leaves the current deadline unchanged)
+
+    Yields:
+        The effective absolute deadline (``time.monotonic()`` based)
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + timeout
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """
+    Clear the ambient deadline within the block.
+
+    Background work started from a request (e.g. a job) copies the request's
+    context and would otherwise inherit its deadline.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline() -> Optional[float]:
+    """Get the absolute deadline of the current context, if any."""
+    return _deadline.get()
+
+
+def remaining_time(deadline: Optional[float] = None) -> Optional[float]:
+    """
+    Get the seconds left before a deadline.
+
+    Args:
+        deadline: Absolute deadline (default: the current context's)
+
+    Returns:
+        Remaining seconds (may be negative), or None without a deadline
+    """
+    if deadline is None:
+        deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class _Flight:
+    """A shared upstream fetch and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Shares one in-flight fetch between identical concurrent requests.
+
+    Each caller waits on the shared task through ``asyncio.shield``, so a
+    cancelled caller (client disconnect, deadline) only withdraws itself.
+    When the last caller withdraws before the fetch completes, the fetch is
+    cancelled; if it is still queued in the rate limiter its slot goes to
+    the next waiter instead of a result nobody reads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._flights: Dict[str, _Flight] = {}
+        self.coalesced = 0
+        self.withdrawn = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def _finish(self, key: str, flight: _Flight, task: "asyncio.Future[Any]") -> None:
+        """Drop a completed flight and mark its outcome as retrieved."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not task.cancelled():
+            # Callers may all have withdrawn; avoid "exception never retrieved"
+            task.exception()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a fetch, or join an identical one already in flight.
+
+        Args:
+            key: Identity of the request (e.g. its cache key)
+            factory: Creates the fetch coroutine when no flight exists
+
+        Returns:
+            The fetch result
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(factory())
+            flight = _Flight(task)
+            self._flights[key] = flight
+            task.add_done_callback(lambda t: self._finish(key, flight, t))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                # Later identical requests must start a fresh fetch
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                self.withdrawn += 1
+                logger.debug(f"Withdrew upstream request {key}: no callers left")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescer statistics."""
+        return {
+            "in_flight": len(self._flights),
+            "coalesced": self.coalesced,
+            "withdrawn": self.withdrawn,
+        }
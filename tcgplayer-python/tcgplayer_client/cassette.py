@@ -0,0 +1,418 @@
+"""
+Record and replay TCGPlayer API sessions.
+
+A cassette is a JSON file of recorded interactions: request method, path,
+query and body, and the response status, headers, body and elapsed time.
+Recording wraps the real aiohttp session; replay swaps it out entirely, so
+realistic workloads can be benchmarked and profiled offline and
+deterministically.
+
+Usage::
+
+    async with record_session(client, "catalog.json"):
+        await client.endpoints.catalog.get_categories()
+
+    replay_session(client, "catalog.json")  # or ClientConfig(mock_responses=True)
+
+Requests are matched on method, path, sorted query parameters and JSON body;
+the host is ignored so a cassette can be replayed against any base URL.
+Repeated identical requests replay their recordings in order, then keep
+returning the last one.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .auth import TCGPlayerAuth
+from .exceptions import CassetteMissError
+from .session_manager import SessionManager, Transport
+
+if TYPE_CHECKING:
+    from .client import TCGPlayerClient
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Response headers never written to a cassette
+_SKIPPED_HEADERS = {"set-cookie", "date"}
+
+InteractionKey = Tuple[str, str, str]
+
+
+def request_key(method: str, url: str, body: Any = None) -> InteractionKey:
+    """Key a request on method, path, sorted query and canonical JSON body."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = f"{parts.path}?{query}" if query else parts.path
+    canonical = "" if body is None else json.dumps(body, sort_keys=True)
+    return method.upper(), path, canonical
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response."""
+
+    method: str
+    path: str
+    status: int
+    body: bytes
+    request_body: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> InteractionKey:
+        return request_key(self.method, self.path, self.request_body)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the cassette file representation."""
+        data = asdict(self)
+        try:
+            data["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            data["body"] = base64.b64encode(self.body).decode("ascii")
+            data["body_encoding"] = "base64"
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Interaction":
+        """Create from the cassette file representation."""
+        data = dict(data)
+        encoding = data.pop("body_encoding", None)
+        body = data.pop("body", "")
+        raw = base64.b64decode(body) if encoding == "base64" else body.encode("utf-8")
+        return cls(body=raw, **data)
+
+
+class Cassette:
+    """Recorded interactions, with a replay cursor per request."""
+
+    def __init__(
+        self,
+        interactions: Optional[List[Interaction]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the cassette.
+
+        Args:
+            interactions: Recorded interactions, in recording order
+            metadata: Free-form details saved with the cassette
+        """
+        self.interactions: List[Interaction] = []
+        self.metadata: Dict[str, Any] = metadata or {}
+        self._by_key: DefaultDict[InteractionKey, List[Interaction]] = defaultdict(list)
+        self._played: DefaultDict[InteractionKey, int] = defaultdict(int)
+        for interaction in interactions or []:
+            self.add(interaction)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def add(self, interaction: Interaction) -> None:
+        """Record an interaction."""
+        self.interactions.append(interaction)
+        self._by_key[interaction.key].append(interaction)
+
+    def match(
+        self, method: str, url: str, body: Any = None, repeat: bool = True
+    ) -> Optional[Interaction]:
+        """
+        Find the next recorded response for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL (the host is ignored)
+            body: JSON request body
+            repeat: Keep returning the last recording once all were played
+
+        Returns:
+            The interaction, or None if there is no recording left
+        """
+        key = request_key(method, url, body)
+        recorded = self._by_key.get(key)
+        if not recorded:
+            return None
+        played = self._played[key]
+        if played >= len(recorded) and not repeat:
+            return None
+        self._played[key] = played + 1
+        return recorded[min(played, len(recorded) - 1)]
+
+    def rewind(self) -> None:
+        """Replay every request from its first recording again."""
+        self._played.clear()
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the cassette to a JSON file (atomically)."""
+        path = Path(path)
+        data = {
+            "version": CASSETTE_VERSION,
+            "metadata": self.metadata,
+            "interactions": [i.to_dict() for i in self.interactions],
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+        logger.info(f"Saved {len(self)} interactions to cassette {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """Read a cassette written by ``save``."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            [Interaction.from_dict(i) for i in data.get("interactions", [])],
+            data.get("metadata"),
+        )
+
+
+class ReplayResponse:
+    """The parts of ``aiohttp.ClientResponse`` the client uses."""
+
+    def __init__(
+        self, status: int, headers: Dict[str, str], body: bytes, url: str = ""
+    ) -> None:
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.url = url
+        self._body = body
+
+    @property
+    def content_length(self) -> int:
+        return len(self._body)
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._body.decode(encoding, errors="replace")
+
+    async def json(self, **kwargs: Any) -> Any:
+        return json.loads(self._body)
+
+
+class _SessionLike:
+    """Request methods shared by the recording and replaying sessions."""
+
+    closed = False
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self._request("PUT", url, **kwargs)
+
+
+class RecordingSession(_SessionLike):
+    """Wraps an aiohttp session, recording every response to a cassette."""
+
+    def __init__(self, session: Any, cassette: Cassette) -> None:
+        self.session = session
+        self.cassette = cassette
+
+    @property
+    def closed(self) -> bool:  # type: ignore[override]
+        return bool(self.session.closed)
+
+    @asynccontextmanager
+    async def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[ReplayResponse]:
+        start = time.perf_counter()
+        async with self.session.request(method, url, **kwargs) as response:
+            body = await response.read()
+            elapsed = time.perf_counter() - start
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _SKIPPED_HEADERS
+            }
+            _, path, _ = request_key(method, url)
+            self.cassette.add(
+                Interaction(
+                    method=method,
+                    path=path,
+                    status=response.status,
+                    body=body,
+                    request_body=kwargs.get("json"),
+                    headers=headers,
+                    elapsed=round(elapsed, 6),
+                )
+            )
+            yield ReplayResponse(response.status, headers, body, url)
+
+
+class RecordingTransport(Transport):
+    """Sends requests through aiohttp and records them."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            cassette: Cassette to record into
+        """
+        self.cassette = cassette
+        self._wrapped: Optional[RecordingSession] = None
+
+    async def open(self, manager: SessionManager) -> Any:
+        session = await manager.get_http_session()
+        if self._wrapped is None or self._wrapped.session is not session:
+            self._wrapped = RecordingSession(session, self.cassette)
+        return self._wrapped
+
+
+class ReplayTransport(Transport, _SessionLike):
+    """Answers requests from a cassette instead of the network."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        realtime: bool = False,
+        speed: float = 1.0,
+        repeat: bool = True,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            cassette: Recorded interactions to replay
+            realtime: Wait each interaction's recorded elapsed time
+            speed: Divide recorded latencies by this when ``realtime``
+            repeat: Keep returning a request's last recording once all of its
+                recordings were played
+        """
+        self.cassette = cassette
+        self.realtime = realtime
+        self.speed = speed
+        self.repeat = repeat
+        self.replayed = 0
+
+    async def open(self, manager: SessionManager) -> Any:
+        return self
+
+    @asynccontextmanager
+    async def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[ReplayResponse]:
+        interaction = self.cassette.match(
+            method, url, kwargs.get("json"), repeat=self.repeat
+        )
+        if interaction is None:
+            raise CassetteMissError(
+                f"No recorded response for {method} {url}", method, url
+            )
+        if self.realtime and interaction.elapsed > 0:
+            await asyncio.sleep(interaction.elapsed / self.speed)
+        self.replayed += 1
+        yield ReplayResponse(
+            interaction.status, interaction.headers, interaction.body, url
+        )
+
+
+class ReplayAuth(TCGPlayerAuth):
+    """Authentication stand-in for replay: no credentials or network needed."""
+
+    def __init__(self, base_url: str = "https://api.tcgplayer.com") -> None:
+        super().__init__("replay", "replay", base_url=base_url)
+
+    async def authenticate(self) -> Dict[str, Any]:
+        self.access_token = "replay"
+        return {
+            "success": True,
+            "message": "Replaying recorded responses",
+            "access_token": self.access_token,
+        }
+
+
+@asynccontextmanager
+async def record_session(
+    client: "TCGPlayerClient", path: Union[str, Path]
+) -> AsyncIterator[Cassette]:
+    """
+    Record the client's API responses to a cassette file.
+
+    The cassette is saved when the block exits, even on error.
+
+    Args:
+        client: Client whose requests to record
+        path: Cassette file to write
+
+    Yields:
+        The cassette being recorded
+    """
+    manager = client.session_manager
+    cassette = Cassette(
+        metadata={
+            "base_url": client.base_url,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+    )
+    previous = manager.transport
+    manager.transport = RecordingTransport(cassette)
+    try:
+        yield cassette
+    finally:
+        manager.transport = previous
+        cassette.save(path)
+
+
+def replay_session(
+    client: "TCGPlayerClient",
+    cassette: Union[Cassette, str, Path],
+    realtime: bool = False,
+    speed: float = 1.0,
+) -> ReplayTransport:
+    """
+    Serve the client's API requests from a cassette.
+
+    Also replaces the client's authentication so ``authenticate()`` works
+    offline.
+
+    Args:
+        client: Client to switch to replay
+        cassette: Cassette or path to a cassette file
+        realtime: Reproduce recorded latencies instead of answering at once
+        speed: Divide recorded latencies by this when ``realtime``
+
+    Returns:
+        The installed replay transport
+    """
+    if not isinstance(cassette, Cassette):
+        cassette = Cassette.load(cassette)
+    transport = ReplayTransport(cassette, realtime=realtime, speed=speed)
+    client.session_manager.transport = transport
+    client.auth = ReplayAuth(client.base_url)
+    logger.info(f"Replaying {len(cassette)} recorded interactions")
+    return transport
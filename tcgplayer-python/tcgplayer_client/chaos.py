@@ -0,0 +1,208 @@
+"""
+Fault injection for TCGPlayer Client.
+
+``FaultInjectionTransport`` sits between the client and its real session (or
+another transport, e.g. cassette replay) and, at configured rates, delays
+requests, resets connections, times them out, answers 429 with
+``Retry-After`` or starts bursts of 5xx responses. Injected faults happen
+after the rate limiter granted a slot, exactly like real ones, so retry and
+backoff policies can be benchmarked for how much of the rate limit budget
+they waste (see ``benchmarks/faults.py``).
+
+Usage::
+
+    transport = inject_faults(client, FaultConfig(reset_rate=0.05, seed=1))
+    ...
+    print(transport.injected)
+"""
+
+import asyncio
+import errno
+import json
+import logging
+import random
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
+
+import aiohttp
+
+from .cassette import ReplayResponse
+from .exceptions import ConfigurationError
+from .session_manager import SessionManager, Transport
+
+if TYPE_CHECKING:
+    from .client import TCGPlayerClient
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Fault kinds, as counted in FaultInjectionTransport.injected
+RESET = "reset"
+TIMEOUT = "timeout"
+RATE_LIMITED = "429"
+SERVER_ERROR = "5xx"
+
+
+@dataclass
+class FaultConfig:
+    """Faults to inject and how often (rates are per request, 0 to 1)."""
+
+    # Extra latency before each request: ``latency_ms`` is the mean (median
+    # for lognormal), ``latency_sigma`` the lognormal shape
+    latency_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_sigma: float = 1.0
+    reset_rate: float = 0.0  # connection reset by peer
+    timeout_rate: float = 0.0  # no response within timeout_ms
+    timeout_ms: float = 1000.0
+    rate_429: float = 0.0  # answered 429 with Retry-After: retry_after
+    retry_after: int = 1
+    burst_rate: float = 0.0  # chance a request starts a burst of 5xx answers
+    burst_length: int = 5  # consecutive requests failing in a burst
+    burst_status: int = 503
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        rates = (self.reset_rate, self.timeout_rate, self.rate_429, self.burst_rate)
+        if any(not 0 <= rate <= 1 for rate in rates):
+            raise ConfigurationError("Fault rates must be between 0 and 1")
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ConfigurationError(
+                f"latency_distribution must be one of {LATENCY_DISTRIBUTIONS}"
+            )
+        if self.burst_length < 1:
+            raise ConfigurationError("burst_length must be positive")
+
+
+class FaultInjectionTransport(Transport):
+    """Injects latency and failures into requests sent through a session."""
+
+    def __init__(self, config: FaultConfig, inner: Optional[Transport] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            config: Faults to inject
+            inner: Transport to forward requests to (None: the real session)
+        """
+        self.config = config
+        self.inner = inner
+        self.random = random.Random(config.seed)
+        self.requests = 0
+        self.injected: Counter = Counter()
+        self.injected_latency = 0.0
+        self._burst_left = 0
+        self._manager: Optional[SessionManager] = None
+
+    async def open(self, manager: SessionManager) -> Any:
+        self._manager = manager
+        return self
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self._request("PUT", url, **kwargs)
+
+    def _latency(self) -> float:
+        """Draw an injected delay in seconds."""
+        cfg = self.config
+        mean = cfg.latency_ms / 1000
+        if mean <= 0:
+            return 0.0
+        if cfg.latency_distribution == "uniform":
+            return self.random.uniform(0, 2 * mean)
+        if cfg.latency_distribution == "exponential":
+            return self.random.expovariate(1 / mean)
+        if cfg.latency_distribution == "lognormal":
+            return mean * self.random.lognormvariate(0, cfg.latency_sigma)
+        return mean
+
+    def _fault(self) -> Optional[str]:
+        """Pick the fault (if any) for the next request."""
+        cfg = self.config
+        if self._burst_left > 0:
+            self._burst_left -= 1
+            return SERVER_ERROR
+        roll = self.random.random()
+        for kind, rate in (
+            (RESET, cfg.reset_rate),
+            (TIMEOUT, cfg.timeout_rate),
+            (RATE_LIMITED, cfg.rate_429),
+            (SERVER_ERROR, cfg.burst_rate),
+        ):
+            if roll < rate:
+                if kind == SERVER_ERROR:
+                    self._burst_left = cfg.burst_length - 1
+                return kind
+            roll -= rate
+        return None
+
+    @asynccontextmanager
+    async def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        cfg = self.config
+        self.requests += 1
+        delay = self._latency()
+        if delay:
+            self.injected_latency += delay
+            await asyncio.sleep(delay)
+        fault = self._fault()
+        if fault is not None:
+            self.injected[fault] += 1
+            logger.debug(f"Injecting {fault} into {method} {url}")
+        if fault == RESET:
+            raise aiohttp.ClientOSError(errno.ECONNRESET, "Connection reset by peer")
+        if fault == TIMEOUT:
+            await asyncio.sleep(cfg.timeout_ms / 1000)
+            raise aiohttp.ServerTimeoutError(f"Timeout on reading data from {url}")
+        if fault == RATE_LIMITED:
+            body = json.dumps({"errors": ["Too many requests"]}).encode()
+            yield ReplayResponse(429, {"Retry-After": str(cfg.retry_after)}, body, url)
+            return
+        if fault == SERVER_ERROR:
+            body = json.dumps({"errors": ["Service unavailable"]}).encode()
+            yield ReplayResponse(cfg.burst_status, {}, body, url)
+            return
+
+        manager = self._manager
+        if manager is None:
+            raise RuntimeError("FaultInjectionTransport used before open()")
+        if self.inner is not None:
+            session = await self.inner.open(manager)
+        else:
+            session = await manager.get_http_session()
+        async with getattr(session, method.lower())(url, **kwargs) as response:
+            yield response
+
+
+def inject_faults(
+    client: "TCGPlayerClient", config: FaultConfig
+) -> FaultInjectionTransport:
+    """
+    Inject faults into the client's requests.
+
+    Wraps the client's current transport (e.g. cassette replay), if any.
+
+    Args:
+        client: Client whose requests should fail
+        config: Faults to inject
+
+    Returns:
+        The installed transport, which counts injected faults
+    """
+    manager = client.session_manager
+    transport = FaultInjectionTransport(config, inner=manager.transport)
+    manager.transport = transport
+    return transport
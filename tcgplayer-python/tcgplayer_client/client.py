@@ -3,26 +3,55 @@ Main TCGPlayer client class for API interactions.
 """
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Union
 from urllib.parse import urlencode
 
 import aiohttp
 
 from .auth import TCGPlayerAuth
-from .cache import CacheManager, ResponseCache
+from .budget import BudgetReservation, get_budget
+from .cache import (
+    CacheKeyGenerator,
+    CacheManager,
+    RawResponse,
+    ResponseCache,
+    compute_etag,
+)
+from .cancellation import RequestCoalescer, get_deadline, remaining_time
+from .cassette import replay_session
 from .config import ClientConfig, load_config
 from .exceptions import (
     APIError,
     AuthenticationError,
     InvalidResponseError,
     NetworkError,
+    OverloadedError,
     RateLimitError,
     RetryExhaustedError,
     TimeoutError,
 )
+from .fair_queue import FairRateLimiter
+from .gtin_index import GTINIndex
+from .hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    ON_CACHE_HIT,
+    ON_RATE_LIMIT_WAIT,
+    ON_RETRY,
+    Hook,
+    HookContext,
+    HookRegistry,
+)
+from .logging_config import CACHE_HIT_EVENT, REQUEST_EVENT, RESPONSE_EVENT
+from .metrics import ClientMetrics, endpoint_template
+from .profiling import SamplingProfiler
 from .rate_limiter import RateLimiter
+from .reference_data import ReferenceData
 from .session_manager import SessionManager
+from .tracing import MetricsTimingSink
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +62,7 @@ class TCGPlayerClient:
     # Type annotations for instance attributes
     cache_manager: Optional[CacheManager]
     response_cache: Optional[ResponseCache]
+    gtin_index: Optional[GTINIndex]
 
     def __init__(
         self,
@@ -102,6 +132,10 @@ class TCGPlayerClient:
             keepalive_timeout=config.keepalive_timeout,
         )
 
+        # Serve requests from a recorded cassette instead of the API
+        if config.mock_responses and config.cassette_path:
+            replay_session(self, config.cassette_path, realtime=config.replay_realtime)
+
         # Rate limiting configuration (prioritize passed parameters, but enforce
         # maximum)
         config_rate_limit = config.max_requests_per_second or 10
@@ -113,15 +147,30 @@ class TCGPlayerClient:
             )
             config_rate_limit = 10
 
-        self.rate_limiter: RateLimiter = RateLimiter(
-            max_requests_per_second or config_rate_limit,
-            rate_limit_window or config.rate_limit_window,
-        )
+        if config.fair_queuing:
+            # Share slots between tenants (see tenant_scope) by weight
+            self.rate_limiter: RateLimiter = FairRateLimiter(
+                max_requests_per_second or config_rate_limit,
+                rate_limit_window or config.rate_limit_window,
+                weights=config.tenant_weights,
+                quota=config.tenant_quota,
+                quota_window=config.tenant_quota_window,
+                max_tenants=config.max_tenants,
+            )
+        else:
+            self.rate_limiter = RateLimiter(
+                max_requests_per_second or config_rate_limit,
+                rate_limit_window or config.rate_limit_window,
+            )
 
         # Request retry configuration (prioritize passed parameters)
         self.max_retries: int = max_retries or config.max_retries
         self.base_delay: float = base_delay or config.base_delay
 
+        # Admission control: shed requests whose expected limiter wait exceeds
+        # this many seconds (0 disables)
+        self.admission_max_wait: float = config.admission_max_wait
+
         # Caching configuration
         if config.enable_caching:
             self.cache_manager = CacheManager(
@@ -130,6 +179,7 @@ class TCGPlayerClient:
                         "max_size": config.cache_max_size,
                         "default_ttl": config.cache_ttl,
                         "enable_compression": False,
+                        "stale_ttl": config.cache_stale_ttl,
                     }
                 }
             )
@@ -138,6 +188,29 @@ class TCGPlayerClient:
             self.cache_manager = None
             self.response_cache = None
 
+        # Identical concurrent GETs share one upstream fetch
+        self.coalescer: RequestCoalescer = RequestCoalescer()
+
+        # Request, rate limiter and cache metrics (rendered by the service)
+        self.metrics: ClientMetrics = ClientMetrics()
+        self.metrics.registry.add_collector(self._collect_metrics)
+        if config.trace_requests:
+            self.session_manager.add_timing_sink(MetricsTimingSink(self.metrics))
+
+        # Request lifecycle hooks (see add_hook)
+        self.hooks: HookRegistry = HookRegistry()
+
+        # Sampling profiler, started by authenticate() and written by close()
+        self.profile_path: Optional[str] = config.profile_path
+        self.profiler: Optional[SamplingProfiler] = (
+            SamplingProfiler(config.profile_interval) if config.profile_path else None
+        )
+
+        # Local GTIN index for barcode lookups (loaded lazily on first use)
+        self.gtin_index = (
+            GTINIndex(config.gtin_index_path) if config.gtin_index_path else None
+        )
+
         # Initialize endpoint classes
         from .endpoints import (
             CatalogEndpoints,
@@ -159,6 +232,11 @@ class TCGPlayerClient:
             },
         )()
 
+        # Reference data registry (loaded explicitly, e.g. at service startup)
+        self.reference_data: ReferenceData = ReferenceData(
+            self.endpoints.catalog, config.reference_refresh_interval
+        )
+
         logger.info(
             f"TCGPlayer client initialized with rate limit: "
             f"{max_requests_per_second} req/s (TCGPlayer maximum: 10 req/s)"
@@ -168,6 +246,57 @@ class TCGPlayerClient:
         )
         logger.info("All endpoint modules loaded successfully")
 
+    def add_hook(self, event: str, hook: Hook) -> Hook:
+        """
+        Register a request lifecycle hook.
+
+        Args:
+            event: ``before_request``, ``after_response``, ``on_retry``,
+                ``on_cache_hit`` or ``on_rate_limit_wait``
+            hook: Callable (sync or async) taking a ``HookContext``
+
+        Returns:
+            The hook
+
+        Raises:
+            ValidationError: If the event is unknown
+        """
+        return self.hooks.register(event, hook)
+
+    def remove_hook(self, event: str, hook: Hook) -> bool:
+        """
+        Remove a request lifecycle hook.
+
+        Args:
+            event: Event the hook was registered for
+            hook: The registered hook
+
+        Returns:
+            True if the hook was registered
+        """
+        return self.hooks.unregister(event, hook)
+
+    def _collect_metrics(self) -> None:
+        """Copy rate limiter and cache state into gauges before rendering."""
+        self.metrics.coalesced.set_total(self.coalescer.coalesced)
+        self.metrics.withdrawn.set_total(self.coalescer.withdrawn)
+        self.metrics.limiter_queue_depth.set(self.rate_limiter.waiting)
+        self.metrics.limiter_window_requests.set(self.rate_limiter.window_count())
+        if isinstance(self.rate_limiter, FairRateLimiter):
+            # Forgotten tenants drop out of the per-tenant series
+            self.metrics.tenant_requests.clear()
+            self.metrics.tenant_rejected.clear()
+            self.metrics.tenant_queue_depth.clear()
+            for tenant, state in self.rate_limiter.tenants.items():
+                self.metrics.tenant_requests.set_total(state.granted, tenant=tenant)
+                self.metrics.tenant_rejected.set_total(state.rejected, tenant=tenant)
+                self.metrics.tenant_queue_depth.set(state.queued, tenant=tenant)
+        if self.response_cache:
+            lru = self.response_cache.cache
+            self.metrics.cache_entries.set(len(lru.cache))
+            self.metrics.cache_evictions.set_total(lru.evictions, reason="size")
+            self.metrics.cache_evictions.set_total(lru.expirations, reason="expired")
+
     async def authenticate(self) -> Dict[str, Any]:
         """
         Authenticate with the TCGPlayer API.
@@ -182,8 +311,66 @@ class TCGPlayerClient:
             raise AuthenticationError(
                 "No authentication configured. Provide client_id and client_secret."
             )
+        if self.profiler and not self.profiler.running:
+            self.profiler.start()
         return await self.auth.authenticate()
 
+    async def _record_cache_hit(
+        self,
+        endpoint: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        duration: float,
+        size: int,
+    ) -> None:
+        """Count a fresh cache hit in metrics, the current budget and hooks."""
+        self.metrics.cache_lookups.inc(result="hit")
+        budget = get_budget()
+        if budget is not None:
+            budget.record_cache_hit()
+        logger.info("Cache hit for %s", endpoint, extra=CACHE_HIT_EVENT)
+        if self.hooks.on_cache_hit:
+            await self.hooks.emit(
+                HookContext(
+                    ON_CACHE_HIT,
+                    endpoint,
+                    endpoint_template(endpoint),
+                    method,
+                    params,
+                    duration=duration,
+                    bytes=size,
+                )
+            )
+
+    async def _get_cached_response(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Any]:
+        """
+        Look up a GET response in the cache without falling back to the API.
+
+        Hits and misses are accounted exactly as in ``_make_api_request``, for
+        endpoints that assemble one response from several cache entries.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Cached response, or None on a miss or with caching disabled
+        """
+        if not self.response_cache:
+            return None
+
+        lookup_start = time.perf_counter()
+        entry = await self.response_cache.get_cached_entry(endpoint, params)
+        duration = time.perf_counter() - lookup_start
+        self.metrics.cache_lookup_duration.observe(duration)
+        if entry is None:
+            self.metrics.cache_lookups.inc(result="miss")
+            return None
+        await self._record_cache_hit(endpoint, "GET", params, duration, entry.size)
+        return entry.get_value()
+
     async def _make_api_request(
         self,
         endpoint: str,
@@ -192,7 +379,10 @@ class TCGPlayerClient:
         data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
         use_cache: bool = True,
         cache_ttl: Optional[int] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+        max_wait: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         Make an authenticated API request to TCGPlayer with rate limiting and retry
         logic.
@@ -204,12 +394,32 @@ class TCGPlayerClient:
             data: Request body data for POST/PUT requests (dict or list of dicts)
             use_cache: Whether to use caching for GET requests
             cache_ttl: Custom TTL for cached responses
+            raw: Return the undecoded JSON body and its ETag as a RawResponse
+                instead of parsed data, so callers can pass cached responses
+                through without re-encoding
+            max_wait: Longest acceptable rate limiter wait in seconds; when the
+                estimated wait is longer the request is served stale from cache
+                or rejected (default: ``admission_max_wait``, 0 disables)
+            deadline: Absolute ``time.monotonic()`` time after which the caller
+                no longer wants the result (default: the ambient
+                ``deadline_scope``); the request is withdrawn from the rate
+                limiter queue when it passes
+
+        Identical concurrent GET requests share one upstream fetch. If every
+        caller is cancelled (e.g. on client disconnect) or times out before
+        it completes, the fetch is cancelled and its rate limiter place is
+        released to other requests.
 
         Returns:
-            API response data
+            API response data (RawResponse if ``raw`` is True)
 
         Raises:
             AuthenticationError: If not authenticated
+            OverloadedError: If the request was shed by admission control
+            QuotaExceededError: If the current tenant's request quota is used up
+            BudgetExceededError: If the current ``budget_scope``'s call limit
+                has been reached
+            TimeoutError: If the deadline passed before a response arrived
             RateLimitError: If rate limit is exceeded
             APIError: If API returns an error
             NetworkError: If network error occurs
@@ -221,14 +431,87 @@ class TCGPlayerClient:
         if not self.auth.is_authenticated():
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
 
-        # Check cache for GET requests
+        metrics = self.metrics
+        hooks = self.hooks
+        budget = get_budget()
+        template = endpoint_template(endpoint)
+        if max_wait is None:
+            max_wait = self.admission_max_wait
+        if deadline is None:
+            deadline = get_deadline()
+
+        # Check cache for GET requests (keeping a stale entry for shedding)
+        stale_entry = None
         if use_cache and method == "GET" and self.response_cache:
-            cached_response = await self.response_cache.get_cached_response(
-                endpoint, params, method, data
+            lookup_start = time.perf_counter()
+            cached_entry = await self.response_cache.get_cached_entry(
+                endpoint,
+                params,
+                method,
+                data,
+                allow_stale=max_wait > 0 or deadline is not None,
             )
-            if cached_response is not None:
-                logger.info(f"Cache hit for {endpoint}")
-                return cached_response
+            lookup_duration = time.perf_counter() - lookup_start
+            metrics.cache_lookup_duration.observe(lookup_duration)
+            if cached_entry is not None and cached_entry.is_expired():
+                stale_entry, cached_entry = cached_entry, None
+            if cached_entry is not None:
+                await self._record_cache_hit(
+                    endpoint, method, params, lookup_duration, cached_entry.size
+                )
+                if raw:
+                    return RawResponse(cached_entry.get_raw(), cached_entry.get_etag())
+                return cached_entry.get_value()
+            metrics.cache_lookups.inc(result="miss")
+
+        # Reject before coalescing so joined callers never see another
+        # tenant's quota error
+        if isinstance(self.rate_limiter, FairRateLimiter):
+            self.rate_limiter.check_quota()
+
+        # Admission control: don't queue for a slot we can't get in time
+        remaining = remaining_time(deadline)
+        if remaining is not None:
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Deadline passed before requesting {endpoint}",
+                    timeout_seconds=0,
+                )
+            max_wait = min(max_wait, remaining) if max_wait > 0 else remaining
+        if max_wait > 0:
+            expected_wait = self.rate_limiter.estimate_wait()
+            if expected_wait > max_wait:
+                if stale_entry is not None:
+                    metrics.shed.inc(endpoint=template, outcome="stale")
+                    if budget is not None:
+                        budget.record_cache_hit()
+                    logger.warning(
+                        f"Serving stale {endpoint}: expected wait "
+                        f"{expected_wait:.2f}s exceeds {max_wait:.2f}s"
+                    )
+                    if hooks.on_cache_hit:
+                        await hooks.emit(
+                            HookContext(
+                                ON_CACHE_HIT,
+                                endpoint,
+                                template,
+                                method,
+                                params,
+                                bytes=stale_entry.size,
+                                stale=True,
+                            )
+                        )
+                    if raw:
+                        return RawResponse(
+                            stale_entry.get_raw(), stale_entry.get_etag()
+                        )
+                    return stale_entry.get_value()
+                metrics.shed.inc(endpoint=template, outcome="rejected")
+                raise OverloadedError(
+                    f"Request to {endpoint} shed: expected wait "
+                    f"{expected_wait:.2f}s exceeds {max_wait:.2f}s",
+                    retry_after=expected_wait,
+                )
 
         headers = {
             "Authorization": f"Bearer {self.auth.get_access_token()}",
@@ -239,58 +522,236 @@ class TCGPlayerClient:
         if params:
             url += f"?{urlencode(params)}"
 
+        # The call budget is charged to the caller that starts the fetch;
+        # callers joining an identical fetch cost nothing
+        fetched = False
+        fetch_started = False
+        reservation: Optional[BudgetReservation] = None
+
+        async def fetch() -> Any:
+            nonlocal fetch_started
+            fetch_started = True
+            metrics.in_flight.inc()
+            try:
+                return await self._send_with_retries(
+                    endpoint,
+                    template,
+                    url,
+                    headers,
+                    method,
+                    params,
+                    data,
+                    use_cache,
+                    cache_ttl,
+                    raw,
+                    reservation,
+                )
+            finally:
+                metrics.in_flight.dec()
+
+        def start_fetch() -> Awaitable[Any]:
+            nonlocal fetched, reservation
+            fetched = True
+            if budget is not None:
+                reservation = budget.reserve(endpoint)
+            return fetch()
+
+        if method == "GET":
+            key = CacheKeyGenerator.generate_key(endpoint, params, method, data)
+            call = self.coalescer.run(f"{key}:{int(raw)}", start_fetch)
+        else:
+            call = start_fetch()
+
+        try:
+            if remaining is None:
+                return await call
+            try:
+                return await asyncio.wait_for(call, remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Request to {endpoint} exceeded its deadline",
+                    timeout_seconds=remaining,
+                )
+        finally:
+            if budget is not None and not fetched:
+                budget.record_coalesced()
+            if reservation is not None and not fetch_started:
+                # The fetch was withdrawn before it ran
+                reservation.release()
+
+    async def _send_with_retries(
+        self,
+        endpoint: str,
+        template: str,
+        url: str,
+        headers: Dict[str, str],
+        method: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]],
+        use_cache: bool,
+        cache_ttl: Optional[int],
+        raw: bool,
+        reservation: Optional[BudgetReservation] = None,
+    ) -> Any:
+        """Send a request under the rate limiter, retrying transient failures."""
+        metrics = self.metrics
+        hooks = self.hooks
+        # The context of the caller that started the fetch
+        budget = get_budget()
         for attempt in range(self.max_retries):
+            # Reserve each attempt's call before queueing for its slot (the
+            # first attempt's was reserved by the caller)
+            if budget is not None and (reservation is None or not reservation.active):
+                reservation = budget.reserve(endpoint)
             try:
                 # Acquire rate limit permission
-                await self.rate_limiter.acquire()
+                wait_start = time.perf_counter()
+                try:
+                    await self.rate_limiter.acquire()
+                except BaseException:
+                    # The call never went upstream
+                    if reservation is not None:
+                        reservation.release()
+                    raise
+                attempt_start = time.perf_counter()
+                wait = attempt_start - wait_start
+                metrics.limiter_wait.observe(wait)
+                if reservation is not None:
+                    reservation.commit(wait)
+                if hooks.on_rate_limit_wait:
+                    await hooks.emit(
+                        HookContext(
+                            ON_RATE_LIMIT_WAIT,
+                            endpoint,
+                            template,
+                            method,
+                            params,
+                            attempt=attempt + 1,
+                            wait=wait,
+                        )
+                    )
+                if hooks.before_request:
+                    await hooks.emit(
+                        HookContext(
+                            BEFORE_REQUEST,
+                            endpoint,
+                            template,
+                            method,
+                            params,
+                            attempt=attempt + 1,
+                            wait=wait,
+                        )
+                    )
+                # Filled in by _handle_response and emitted once the attempt ends
+                response_context = (
+                    HookContext(
+                        AFTER_RESPONSE,
+                        endpoint,
+                        template,
+                        method,
+                        params,
+                        attempt=attempt + 1,
+                        wait=wait,
+                    )
+                    if hooks.after_response
+                    else None
+                )
 
                 logger.info(
-                    f"Making {method} API request to {endpoint} "
-                    f"(attempt {attempt + 1}/{self.max_retries})"
+                    "Making %s API request to %s (attempt %d/%d)",
+                    method,
+                    endpoint,
+                    attempt + 1,
+                    self.max_retries,
+                    extra=REQUEST_EVENT,
                 )
 
-                async with self.session_manager.session_context() as session:
-                    if method == "POST":
-                        async with session.post(
-                            url, headers=headers, json=data
-                        ) as response:
-                            return await self._handle_response(
-                                response,
-                                endpoint,
-                                use_cache,
-                                method,
-                                params,
-                                data,
-                                cache_ttl,
-                            )
-                    elif method == "PUT":
-                        async with session.put(
-                            url, headers=headers, json=data
-                        ) as response:
-                            return await self._handle_response(
-                                response,
-                                endpoint,
-                                use_cache,
-                                method,
-                                params,
-                                data,
-                                cache_ttl,
-                            )
-                    else:
-                        async with session.get(url, headers=headers) as response:
-                            return await self._handle_response(
-                                response,
-                                endpoint,
-                                use_cache,
-                                method,
-                                params,
-                                data,
-                                cache_ttl,
-                            )
+                timing = self.session_manager.start_timing(method, template)
+                try:
+                    async with self.session_manager.session_context() as session:
+                        if method == "POST":
+                            async with session.post(
+                                url,
+                                headers=headers,
+                                json=data,
+                                trace_request_ctx=timing,
+                            ) as response:
+                                return await self._handle_response(
+                                    response,
+                                    endpoint,
+                                    use_cache,
+                                    method,
+                                    params,
+                                    data,
+                                    cache_ttl,
+                                    raw,
+                                    response_context,
+                                )
+                        elif method == "PUT":
+                            async with session.put(
+                                url,
+                                headers=headers,
+                                json=data,
+                                trace_request_ctx=timing,
+                            ) as response:
+                                return await self._handle_response(
+                                    response,
+                                    endpoint,
+                                    use_cache,
+                                    method,
+                                    params,
+                                    data,
+                                    cache_ttl,
+                                    raw,
+                                    response_context,
+                                )
+                        else:
+                            async with session.get(
+                                url, headers=headers, trace_request_ctx=timing
+                            ) as response:
+                                return await self._handle_response(
+                                    response,
+                                    endpoint,
+                                    use_cache,
+                                    method,
+                                    params,
+                                    data,
+                                    cache_ttl,
+                                    raw,
+                                    response_context,
+                                )
+                except Exception as e:
+                    if response_context is not None:
+                        response_context.error = type(e).__name__
+                    raise
+                finally:
+                    duration = time.perf_counter() - attempt_start
+                    metrics.request_duration.observe(
+                        duration, endpoint=template, method=method
+                    )
+                    self.session_manager.finish_timing(timing)
+                    if response_context is not None:
+                        response_context.duration = duration
+                        await hooks.emit(response_context)
 
             except asyncio.TimeoutError:
+                metrics.requests.inc(endpoint=template, method=method, status="timeout")
                 if attempt < self.max_retries - 1:
+                    metrics.retries.inc(endpoint=template, reason="timeout")
                     wait_time = self.base_delay * (2**attempt)
+                    if hooks.on_retry:
+                        await hooks.emit(
+                            HookContext(
+                                ON_RETRY,
+                                endpoint,
+                                template,
+                                method,
+                                params,
+                                attempt=attempt + 1,
+                                error="TimeoutError",
+                                retry_delay=wait_time,
+                            )
+                        )
                     logger.warning(
                         f"Request timeout. Retrying in {wait_time} seconds..."
                     )
@@ -305,8 +766,23 @@ class TCGPlayerClient:
                     )
 
             except aiohttp.ClientError as e:
+                metrics.requests.inc(endpoint=template, method=method, status="error")
                 if attempt < self.max_retries - 1:
+                    metrics.retries.inc(endpoint=template, reason="network")
                     wait_time = self.base_delay * (2**attempt)
+                    if hooks.on_retry:
+                        await hooks.emit(
+                            HookContext(
+                                ON_RETRY,
+                                endpoint,
+                                template,
+                                method,
+                                params,
+                                attempt=attempt + 1,
+                                error=type(e).__name__,
+                                retry_delay=wait_time,
+                            )
+                        )
                     logger.warning(
                         f"Network error: {e}. Retrying in {wait_time} seconds..."
                     )
@@ -332,7 +808,9 @@ class TCGPlayerClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
         cache_ttl: Optional[int] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+        hook_context: Optional[HookContext] = None,
+    ) -> Any:
         """
         Handle API response and extract data or raise appropriate exceptions.
 
@@ -344,26 +822,52 @@ class TCGPlayerClient:
             params: Query parameters used
             data: Request body data used
             cache_ttl: Custom TTL for cached responses
+            raw: Return the undecoded body and ETag instead of parsed data
+            hook_context: ``after_response`` context to record status and
+                size into
 
         Returns:
-            Response data
+            Response data (RawResponse if ``raw`` is True)
 
         Raises:
             RateLimitError: If rate limit exceeded
             APIError: If API returns error status
         """
+        template = endpoint_template(endpoint)
+        self.metrics.requests.inc(
+            endpoint=template, method=method, status=str(response.status)
+        )
+        if hook_context is not None:
+            hook_context.status = response.status
         if response.status == 200:
             try:
-                result = await response.json()
-                logger.info(f"API request successful: {endpoint}")
+                decode_start = time.perf_counter()
+                body = await response.read()
+                self._count_bytes(hook_context, len(body))
+                result = json.loads(body)
+                self.metrics.decode_duration.observe(
+                    time.perf_counter() - decode_start, endpoint=template
+                )
+                logger.info(
+                    "API request successful: %s", endpoint, extra=RESPONSE_EVENT
+                )
 
-                # Cache successful GET responses
+                # Cache successful GET responses, keeping only the body for
+                # raw pass-through fetches and only the parsed data otherwise
                 if use_cache and method == "GET" and self.response_cache:
                     await self.response_cache.cache_response(
-                        endpoint, params, method, data, result, 200, cache_ttl
+                        endpoint,
+                        params,
+                        method,
+                        data,
+                        result,
+                        200,
+                        cache_ttl,
+                        body if raw else None,
+                        len(body),
                     )
 
-                return result
+                return RawResponse(body, compute_etag(body)) if raw else result
             except Exception as e:
                 logger.error(f"Failed to parse JSON response from {endpoint}: {e}")
                 raise InvalidResponseError(
@@ -381,6 +885,7 @@ class TCGPlayerClient:
                 raise RateLimitError("Rate limit exceeded.")
         elif response.status in (500, 502, 503, 504):  # Server errors
             error_text = await response.text()
+            self._count_bytes(hook_context, len(error_text.encode()))
             raise APIError(
                 f"Server error {response.status}: {error_text}",
                 response.status,
@@ -388,12 +893,22 @@ class TCGPlayerClient:
             )
         else:
             error_text = await response.text()
+            self._count_bytes(hook_context, len(error_text.encode()))
             raise APIError(
                 f"API request failed: {response.status} - {error_text}",
                 response.status,
                 error_text,
             )
 
+    @staticmethod
+    def _count_bytes(hook_context: Optional[HookContext], size: int) -> None:
+        """Record a response body size for hooks and the call budget."""
+        if hook_context is not None:
+            hook_context.bytes = size
+        budget = get_budget()
+        if budget is not None:
+            budget.record_bytes(size)
+
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """
         Get current rate limit status.
@@ -425,9 +940,15 @@ class TCGPlayerClient:
 
     async def close(self) -> None:
         """Close the client and cleanup resources."""
+        self.reference_data.stop_refresh_task()
+        if self.gtin_index is not None:
+            await self.gtin_index.flush_pending(force=True)
         await self.session_manager.cleanup()
         if self.cache_manager:
             await self.cache_manager.close_all()
+        if self.profiler and self.profiler.running and self.profile_path:
+            self.profiler.stop()
+            self.profiler.write(self.profile_path)
         logger.info("TCGPlayer client closed and resources cleaned up")
 
     async def clear_cache(self) -> None:
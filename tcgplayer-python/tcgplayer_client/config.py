@@ -8,7 +8,7 @@ environment variables, configuration files, and runtime configuration.
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -49,15 +49,43 @@ class ClientConfig:
     log_level: str = "INFO"
     log_file: Optional[str] = None
     log_json_format: bool = False
+    log_queue: bool = False  # write logs from a listener thread
+    # Fraction of hot-path records kept per event (see SamplingFilter)
+    log_sample_rates: Dict[str, float] = field(default_factory=dict)
 
     # Caching Configuration
     enable_caching: bool = True
     cache_ttl: int = 300  # 5 minutes
     cache_max_size: int = 1000
+    cache_stale_ttl: int = 0  # seconds expired responses may be served stale
+
+    # Admission Control (0 disables load shedding)
+    admission_max_wait: float = 0.0
+
+    # Per-tenant fair queuing (see FairRateLimiter)
+    fair_queuing: bool = False
+    tenant_weights: Dict[str, float] = field(default_factory=dict)
+    tenant_quota: int = 0  # requests per tenant per quota window (0 disables)
+    tenant_quota_window: float = 3600.0
+    max_tenants: int = 1000  # further tenants share the default tenant
+
+    # Per-request phase timing via aiohttp tracing (see tracing.py)
+    trace_requests: bool = False
+
+    # Sampling profiler from authenticate() to close() (see profiling.py);
+    # a .json path gets speedscope format, anything else collapsed stacks
+    profile_path: Optional[str] = None
+    profile_interval: float = 0.005
+
+    # Local Index Configuration
+    gtin_index_path: Optional[str] = None
+    reference_refresh_interval: int = 86400  # 24 hours
 
     # Development/Testing
     debug_mode: bool = False
-    mock_responses: bool = False
+    mock_responses: bool = False  # replay cassette_path instead of the API
+    cassette_path: Optional[str] = None
+    replay_realtime: bool = False  # reproduce recorded latencies on replay
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -97,6 +125,36 @@ class ClientConfig:
         if self.cache_ttl <= 0:
             raise ConfigurationError("cache_ttl must be positive")
 
+        if self.cache_stale_ttl < 0:
+            raise ConfigurationError("cache_stale_ttl must be non-negative")
+
+        if self.admission_max_wait < 0:
+            raise ConfigurationError("admission_max_wait must be non-negative")
+
+        if any(not 0 <= rate <= 1 for rate in self.log_sample_rates.values()):
+            raise ConfigurationError("log_sample_rates must be between 0 and 1")
+
+        if any(weight <= 0 for weight in self.tenant_weights.values()):
+            raise ConfigurationError("tenant_weights must be positive")
+
+        if self.tenant_quota < 0:
+            raise ConfigurationError("tenant_quota must be non-negative")
+
+        if self.tenant_quota_window <= 0:
+            raise ConfigurationError("tenant_quota_window must be positive")
+
+        if self.max_tenants < 1:
+            raise ConfigurationError("max_tenants must be positive")
+
+        if self.profile_interval <= 0:
+            raise ConfigurationError("profile_interval must be positive")
+
+        if self.mock_responses and not self.cassette_path:
+            raise ConfigurationError("mock_responses requires cassette_path")
+
+        if self.reference_refresh_interval <= 0:
+            raise ConfigurationError("reference_refresh_interval must be positive")
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return asdict(self)
@@ -154,11 +212,27 @@ class ConfigurationManager:
             "TCGPLAYER_LOG_LEVEL": "log_level",
             "TCGPLAYER_LOG_FILE": "log_file",
             "TCGPLAYER_LOG_JSON_FORMAT": "log_json_format",
+            "TCGPLAYER_LOG_QUEUE": "log_queue",
+            "TCGPLAYER_LOG_SAMPLE_RATES": "log_sample_rates",
             "TCGPLAYER_ENABLE_CACHING": "enable_caching",
             "TCGPLAYER_CACHE_TTL": "cache_ttl",
             "TCGPLAYER_CACHE_MAX_SIZE": "cache_max_size",
+            "TCGPLAYER_CACHE_STALE_TTL": "cache_stale_ttl",
+            "TCGPLAYER_ADMISSION_MAX_WAIT": "admission_max_wait",
+            "TCGPLAYER_FAIR_QUEUING": "fair_queuing",
+            "TCGPLAYER_TENANT_WEIGHTS": "tenant_weights",
+            "TCGPLAYER_TENANT_QUOTA": "tenant_quota",
+            "TCGPLAYER_TENANT_QUOTA_WINDOW": "tenant_quota_window",
+            "TCGPLAYER_MAX_TENANTS": "max_tenants",
+            "TCGPLAYER_TRACE_REQUESTS": "trace_requests",
+            "TCGPLAYER_PROFILE_PATH": "profile_path",
+            "TCGPLAYER_PROFILE_INTERVAL": "profile_interval",
+            "TCGPLAYER_GTIN_INDEX_PATH": "gtin_index_path",
+            "TCGPLAYER_REFERENCE_REFRESH_INTERVAL": "reference_refresh_interval",
             "TCGPLAYER_DEBUG_MODE": "debug_mode",
             "TCGPLAYER_MOCK_RESPONSES": "mock_responses",
+            "TCGPLAYER_CASSETTE_PATH": "cassette_path",
+            "TCGPLAYER_REPLAY_REALTIME": "replay_realtime",
         }
 
         for env_var, config_key in env_mapping.items():
@@ -173,6 +247,10 @@ class ConfigurationManager:
                     "keepalive_timeout",
                     "cache_ttl",
                     "cache_max_size",
+                    "cache_stale_ttl",
+                    "tenant_quota",
+                    "max_tenants",
+                    "reference_refresh_interval",
                 ]:
                     env_config[config_key] = int(value)
                 elif config_key in [
@@ -181,15 +259,30 @@ class ConfigurationManager:
                     "timeout_total",
                     "timeout_connect",
                     "timeout_read",
+                    "admission_max_wait",
+                    "tenant_quota_window",
+                    "profile_interval",
                 ]:
                     env_config[config_key] = float(value)
                 elif config_key in [
                     "log_json_format",
+                    "log_queue",
                     "enable_caching",
                     "debug_mode",
                     "mock_responses",
+                    "replay_realtime",
+                    "fair_queuing",
+                    "trace_requests",
                 ]:
                     env_config[config_key] = value.lower() in ("true", "1", "yes", "on")
+                elif config_key in ["tenant_weights", "log_sample_rates"]:
+                    # "alice=2,bob=1" / "cache_hit=0.01,request=0.1"
+                    env_config[config_key] = {
+                        name.strip(): float(weight)
+                        for name, _, weight in (
+                            pair.partition("=") for pair in value.split(",") if pair
+                        )
+                    }
                 elif config_key in [
                     "log_level",
                     "base_url",
@@ -197,6 +290,8 @@ class ConfigurationManager:
                     "client_id",
                     "client_secret",
                     "log_file",
+                    "gtin_index_path",
+                    "profile_path",
                 ]:
                     env_config[config_key] = str(value)
                 else:
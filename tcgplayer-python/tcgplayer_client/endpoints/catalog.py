@@ -7,15 +7,22 @@ This module contains all catalog-related operations including:
 - Media and search functionality
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
+from ..batching import DEFAULT_ID_BATCH_SIZE, chunked, unique_ids
+from ..cache import ResponseCache
 from ..client import TCGPlayerClient
+from ..gtin_index import GTINIndex, product_id_from_response
 from ..validation import (
     validate_id,
     validate_non_negative_integer,
     validate_positive_integer,
 )
 
+# Maximum page size accepted by paginated catalog listings
+MAX_PAGE_SIZE = 100
+
 
 class CatalogEndpoints:
     """Catalog-related API endpoints."""
@@ -43,6 +50,66 @@ class CatalogEndpoints:
         group_id = validate_id(group_id, "group_id")
         return await self.client._make_api_request(f"/catalog/groups/{group_id}")
 
+    async def get_groups_by_ids(
+        self, group_ids: Iterable[int], batch_size: int = DEFAULT_ID_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """Get details for many groups, in request order.
+
+        Groups are cached individually under their single-group endpoint, so
+        only uncached IDs are fetched. Those are chunked into comma-joined
+        ``/catalog/groups/{ids}`` requests issued concurrently under the
+        client's rate limiter.
+        """
+        ids = [validate_id(group_id, "group_id") for group_id in unique_ids(group_ids)]
+        batch_size = validate_positive_integer(batch_size, "batch_size")
+        cache = getattr(self.client, "response_cache", None)
+        if not isinstance(cache, ResponseCache):
+            cache = None
+
+        found: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+        for group_id in ids:
+            # Through the client so hits reach metrics, budgets and hooks
+            cached = (
+                await self.client._get_cached_response(f"/catalog/groups/{group_id}")
+                if cache
+                else None
+            )
+            results = (cached or {}).get("results")
+            if results:
+                found[group_id] = results[0]
+            else:
+                missing.append(group_id)
+
+        responses = await asyncio.gather(
+            *(
+                self.client._make_api_request(
+                    f"/catalog/groups/{','.join(map(str, batch))}", use_cache=False
+                )
+                for batch in chunked(missing, batch_size)
+            )
+        )
+
+        errors: List[Any] = []
+        for response in responses:
+            errors.extend(response.get("errors") or [])
+            for group in response.get("results") or []:
+                group_id = group.get("groupId")
+                if group_id is None:
+                    continue
+                found[int(group_id)] = group
+                if cache:
+                    await cache.cache_response(
+                        f"/catalog/groups/{group_id}",
+                        response={"success": True, "errors": [], "results": [group]},
+                    )
+
+        return {
+            "success": True,
+            "errors": errors,
+            "results": [found[group_id] for group_id in ids if group_id in found],
+        }
+
     async def get_condition_names(self) -> Dict[str, Any]:
         """Get all condition names."""
         return await self.client._make_api_request("/catalog/conditions")
@@ -55,6 +122,20 @@ class CatalogEndpoints:
         """Get all rarities."""
         return await self.client._make_api_request("/catalog/rarities")
 
+    async def get_category_rarities(self, category_id: int) -> Dict[str, Any]:
+        """Get all rarities for a specific category."""
+        category_id = validate_id(category_id, "category_id")
+        return await self.client._make_api_request(
+            f"/catalog/categories/{category_id}/rarities"
+        )
+
+    async def get_category_printings(self, category_id: int) -> Dict[str, Any]:
+        """Get all printings for a specific category."""
+        category_id = validate_id(category_id, "category_id")
+        return await self.client._make_api_request(
+            f"/catalog/categories/{category_id}/printings"
+        )
+
     async def get_skus(self, product_ids: List[int]) -> Dict[str, Any]:
         """Get SKUs for products."""
         return await self.client._make_api_request(
@@ -90,11 +171,82 @@ class CatalogEndpoints:
 
         return await self.client._make_api_request("/catalog/products", params=params)
 
+    async def _paginate(
+        self, endpoint: str, params: Dict[str, Any], page_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield result pages of a paginated listing, one request at a time.
+
+        Pages bypass the response cache so bulk exports do not evict hot
+        entries, and the next page is only requested once the consumer asks
+        for it.
+        """
+        page_size = min(
+            validate_positive_integer(page_size, "page_size"), MAX_PAGE_SIZE
+        )
+        offset = 0
+        while True:
+            response = await self.client._make_api_request(
+                endpoint,
+                params={**params, "limit": page_size, "offset": offset},
+                use_cache=False,
+            )
+            results = response.get("results") or []
+            if results:
+                yield results
+            offset += len(results)
+            total = response.get("totalItems")
+            if len(results) < page_size or (total is not None and offset >= total):
+                return
+
+    async def iter_products(
+        self,
+        category_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over all products matching the filters, page by page."""
+        params: Dict[str, Any] = {}
+        if category_id is not None:
+            params["categoryId"] = validate_id(category_id, "category_id")
+        if group_id is not None:
+            params["groupId"] = validate_id(group_id, "group_id")
+        async for page in self._paginate("/catalog/products", params, page_size):
+            await self._index_gtins(page)
+            yield page
+        await self._index_gtins((), flush=True)
+
+    async def _index_gtins(
+        self, products: Iterable[Dict[str, Any]], flush: bool = False
+    ) -> None:
+        """Feed synced products into the GTIN index, if one is configured.
+
+        Batches are written in a worker thread once enough records are
+        buffered (or at once with ``flush``), so catalog sync builds the index
+        without blocking the event loop.
+        """
+        gtin_index = getattr(self.client, "gtin_index", None)
+        if not isinstance(gtin_index, GTINIndex):
+            return
+        gtin_index.update_from_products(products)
+        await gtin_index.flush_pending(force=flush)
+
+    async def iter_groups(
+        self, category_id: Optional[int] = None, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over all groups (sets), optionally within a category."""
+        params: Dict[str, Any] = {}
+        if category_id is not None:
+            params["categoryId"] = validate_id(category_id, "category_id")
+        async for page in self._paginate("/catalog/groups", params, page_size):
+            yield page
+
     async def get_product_details(self, product_ids: List[int]) -> Dict[str, Any]:
         """Get detailed information for specific products."""
-        return await self.client._make_api_request(
+        response = await self.client._make_api_request(
             f"/catalog/products/{','.join(map(str, product_ids))}"
         )
+        await self._index_gtins(response.get("results") or ())
+        return response
 
     async def get_product_media(self, product_ids: List[int]) -> Dict[str, Any]:
         """Get media (images) for products."""
@@ -111,7 +263,28 @@ class CatalogEndpoints:
 
     async def get_product_by_gtin(self, gtin: str) -> Dict[str, Any]:
         """Get product details by GTIN."""
-        return await self.client._make_api_request(f"/catalog/products/gtin/{gtin}")
+        response = await self.client._make_api_request(f"/catalog/products/gtin/{gtin}")
+        # Write the result back so the next scan is answered locally
+        gtin_index = getattr(self.client, "gtin_index", None)
+        if isinstance(gtin_index, GTINIndex):
+            gtin_index.record_response(gtin, response)
+            await gtin_index.flush_pending()
+        return response
+
+    async def get_product_id_by_gtin(self, gtin: str) -> Optional[int]:
+        """Resolve a GTIN to a product ID, using the local GTIN index first.
+
+        Only GTINs missing from the index cost an API request; the result is
+        written back to the index.
+        """
+        gtin_index = getattr(self.client, "gtin_index", None)
+        if isinstance(gtin_index, GTINIndex):
+            product_id = gtin_index.get(gtin)
+            if product_id is not None:
+                return product_id
+
+        response = await self.get_product_by_gtin(gtin)
+        return product_id_from_response(response)
 
     async def get_related_products(self, product_ids: List[int]) -> Dict[str, Any]:
         """Get related products for specific products."""
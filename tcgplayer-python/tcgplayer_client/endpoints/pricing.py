@@ -7,9 +7,11 @@ This module contains all pricing-related operations including:
 - SKU-specific pricing
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+from ..batching import DEFAULT_ID_BATCH_SIZE
 from ..client import TCGPlayerClient
+from ..pricing_planner import execute_pricing_plan, plan_price_requests
 
 
 class PricingEndpoints:
@@ -77,3 +79,18 @@ class PricingEndpoints:
     #     ) -> Dict[str, Any]:
     #     """Get product buylist prices by group ID."""
     #     return await self.client._make_api_request(f"/pricing/buy/group/{group_id}")
+
+    async def get_prices_planned(
+        self,
+        product_ids: Iterable[int],
+        product_groups: Mapping[int, int],
+        batch_size: int = DEFAULT_ID_BATCH_SIZE,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get prices for many products using the fewest API calls.
+
+        Mixes group-level and batched product-ID pricing calls according to
+        ``plan_price_requests`` and returns a productId -> price rows map.
+        """
+        plan = plan_price_requests(product_ids, product_groups, batch_size)
+        return await execute_pricing_plan(self, plan, max_concurrency)
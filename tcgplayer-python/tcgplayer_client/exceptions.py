@@ -34,6 +34,18 @@ class RateLimitError(TCGPlayerError):
         self.retry_after = retry_after
 
 
+class QuotaExceededError(RateLimitError):
+    """Raised when a tenant has used up its request quota for the window."""
+
+
+class OverloadedError(TCGPlayerError):
+    """Raised when a request is shed because the rate limiter queue is too deep."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class APIError(TCGPlayerError):
     """Raised when the TCGPlayer API returns an error."""
 
@@ -111,3 +123,21 @@ class InvalidResponseError(TCGPlayerError):
 
     def __init__(self, message: str, response_data: Optional[Any] = None):
         super().__init__(message, response_data=response_data)
+
+
+class CassetteMissError(TCGPlayerError):
+    """Raised when a replayed request has no recorded response."""
+
+    def __init__(self, message: str, method: str, url: str):
+        super().__init__(message)
+        self.method = method
+        self.url = url
+
+
+class BudgetExceededError(TCGPlayerError):
+    """Raised when an operation's upstream call budget is used up."""
+
+    def __init__(self, message: str, name: str, limit: int):
+        super().__init__(message)
+        self.name = name
+        self.limit = limit
@@ -0,0 +1,327 @@
+"""
+Per-tenant fair queuing for TCGPlayer Client.
+
+When one client serves many users, a single large job (e.g. importing a
+20k-card collection) can fill the rate limiter queue and starve everyone
+else. ``FairRateLimiter`` keeps one queue per tenant and hands out slots with
+self-clocked weighted fair queuing, so each backlogged tenant gets a share of
+the rate proportional to its weight. Optional per-tenant quotas cap how many
+upstream requests a tenant may make per quota window. Tenant keys may come
+from request headers, so at most ``max_tenants`` are tracked: idle tenants
+are forgotten to make room, and requests of further tenants are charged to
+the default tenant.
+
+The tenant of a request is taken from the ambient ``tenant_scope``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import QuotaExceededError
+from .logging_config import RATE_LIMIT_WAIT_EVENT
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Tenant charged for requests made without a tenant_scope
+DEFAULT_TENANT = "default"
+
+_tenant: ContextVar[Optional[str]] = ContextVar("tcgplayer_tenant", default=None)
+
+
+@contextmanager
+def tenant_scope(tenant: Optional[str]) -> Iterator[str]:
+    """
+    Attribute all client requests made within the block to a tenant.
+
+    Args:
+        tenant: Tenant key (None or empty uses the default tenant)
+
+    Yields:
+        The effective tenant key
+    """
+    token = _tenant.set(tenant or None)
+    try:
+        yield tenant or DEFAULT_TENANT
+    finally:
+        _tenant.reset(token)
+
+
+def get_tenant() -> str:
+    """Get the tenant of the current context."""
+    return _tenant.get() or DEFAULT_TENANT
+
+
+@dataclass
+class TenantState:
+    """Scheduling state and usage counters for one tenant."""
+
+    weight: float
+    quota: int
+    # Virtual finish tag of the tenant's most recently queued request
+    last_finish: float = 0.0
+    queued: int = 0
+    granted: int = 0
+    rejected: int = 0
+    wait_seconds: float = 0.0
+    # Grant times within the quota window
+    window: Deque[float] = field(default_factory=deque)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for stats responses."""
+        return {
+            "weight": self.weight,
+            "quota": self.quota or None,
+            "quota_used": len(self.window),
+            "queued": self.queued,
+            "granted": self.granted,
+            "rejected": self.rejected,
+            "avg_wait_seconds": (
+                round(self.wait_seconds / self.granted, 4) if self.granted else 0.0
+            ),
+        }
+
+
+class FairRateLimiter(RateLimiter):
+    """Rate limiter that shares slots fairly between tenants.
+
+    Each queued request gets a virtual finish tag
+    ``max(virtual_time, tenant.last_finish) + 1 / weight`` and slots go to the
+    smallest tag; virtual time advances to the tag of the request being
+    served. A tenant with weight 2 therefore gets twice the slots of a
+    weight-1 tenant while both are backlogged, and an idle tenant's next
+    request goes ahead of a busy tenant's backlog. With a single tenant it
+    behaves like the FIFO ``RateLimiter``.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 10,
+        time_window: float = 1.0,
+        weights: Optional[Dict[str, float]] = None,
+        default_weight: float = 1.0,
+        quota: int = 0,
+        quota_window: float = 3600.0,
+        quotas: Optional[Dict[str, int]] = None,
+        max_tenants: int = 1000,
+    ) -> None:
+        """
+        Initialize the fair rate limiter.
+
+        Args:
+            max_requests: Maximum number of requests allowed in the time window
+            time_window: Time window in seconds
+            weights: Per-tenant scheduling weights
+            default_weight: Weight of tenants not in ``weights``
+            quota: Requests each tenant may make per ``quota_window`` (0: none)
+            quota_window: Quota window in seconds
+            quotas: Per-tenant quota overrides
+            max_tenants: Distinct unconfigured tenants tracked at once; further
+                tenants share the default tenant's state
+
+        Raises:
+            ValueError: If a weight is not positive
+        """
+        super().__init__(max_requests, time_window)
+        if default_weight <= 0 or any(w <= 0 for w in (weights or {}).values()):
+            raise ValueError("Tenant weights must be positive")
+        self.weights: Dict[str, float] = dict(weights or {})
+        self.default_weight = default_weight
+        self.quota = quota
+        self.quota_window = quota_window
+        self.quotas: Dict[str, int] = dict(quotas or {})
+        self.max_tenants = max_tenants
+        self.tenants: Dict[str, TenantState] = {}
+        self._queue: List[Tuple[float, int, str, "asyncio.Future[None]"]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+
+    def _tenant_key(self, tenant: str) -> str:
+        """Map a tenant to the key its requests are tracked under."""
+        if tenant in self.tenants or tenant in self.weights or tenant in self.quotas:
+            return tenant
+        if len(self.tenants) >= self.max_tenants:
+            self._prune_idle()
+            if len(self.tenants) >= self.max_tenants:
+                return DEFAULT_TENANT
+        return tenant
+
+    def _prune_idle(self) -> None:
+        """Forget unconfigured tenants with nothing queued or counted."""
+        cutoff = time.time() - self.quota_window
+        for tenant, state in list(self.tenants.items()):
+            while state.window and state.window[0] <= cutoff:
+                state.window.popleft()
+            if (
+                tenant != DEFAULT_TENANT
+                and tenant not in self.weights
+                and tenant not in self.quotas
+                and not state.queued
+                and not state.window
+                # Its next request would get the same tag as a new tenant's
+                and state.last_finish <= self._virtual_time
+            ):
+                del self.tenants[tenant]
+
+    def _tenant_state(self, tenant: str) -> TenantState:
+        state = self.tenants.get(tenant)
+        if state is None:
+            state = TenantState(
+                weight=self.weights.get(tenant, self.default_weight),
+                quota=self.quotas.get(tenant, self.quota),
+            )
+            self.tenants[tenant] = state
+        return state
+
+    def check_quota(self, tenant: Optional[str] = None) -> None:
+        """
+        Check that a tenant may queue another request.
+
+        Args:
+            tenant: Tenant key (default: the current context's)
+
+        Raises:
+            QuotaExceededError: If the tenant's quota for the window is used up
+        """
+        tenant = self._tenant_key(tenant or get_tenant())
+        state = self._tenant_state(tenant)
+        if not state.quota:
+            return
+        cutoff = time.time() - self.quota_window
+        while state.window and state.window[0] <= cutoff:
+            state.window.popleft()
+        if len(state.window) + state.queued >= state.quota:
+            state.rejected += 1
+            retry_after = (
+                state.window[0] - cutoff if state.window else self.quota_window
+            )
+            raise QuotaExceededError(
+                f"Tenant {tenant} exceeded its quota of "
+                f"{state.quota} requests per {self.quota_window:g}s",
+                retry_after=max(1, int(retry_after + 0.999)),
+            )
+
+    async def acquire(self) -> None:
+        """
+        Acquire a request slot for the current tenant, waiting if necessary.
+
+        Raises:
+            QuotaExceededError: If the tenant's quota is used up
+        """
+        tenant = self._tenant_key(get_tenant())
+        self.check_quota(tenant)
+        state = self._tenant_state(tenant)
+
+        finish = max(self._virtual_time, state.last_finish) + 1.0 / state.weight
+        state.last_finish = finish
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (finish, next(self._sequence), tenant, waiter))
+
+        start = time.perf_counter()
+        self.waiting += 1
+        state.queued += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        try:
+            await waiter
+        finally:
+            self.waiting -= 1
+            state.queued -= 1
+            if not waiter.done():
+                # Withdrawn: the dispatcher skips cancelled waiters
+                waiter.cancel()
+        state.wait_seconds += time.perf_counter() - start
+
+    async def _dispatch(self) -> None:
+        """Grant slots to queued requests in virtual finish tag order."""
+        while True:
+            # Drop withdrawn requests at the head
+            while self._queue and self._queue[0][3].done():
+                heapq.heappop(self._queue)
+            if not self._queue:
+                return
+
+            now = time.time()
+            while self.requests and self.requests[0] <= now - self.time_window:
+                self.requests.popleft()
+            if len(self.requests) >= self.max_requests:
+                wait_time = self.requests[0] - (now - self.time_window)
+                if wait_time > 0:
+                    logger.debug(
+                        "Rate limit reached. Waiting %.2fs",
+                        wait_time,
+                        extra=RATE_LIMIT_WAIT_EVENT,
+                    )
+                    await asyncio.sleep(wait_time)
+                # Re-pick: a request with a smaller tag may have arrived
+                continue
+
+            finish, _, tenant, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+            self._virtual_time = finish
+            self.requests.append(now)
+            state = self.tenants[tenant]
+            state.granted += 1
+            if state.quota:
+                state.window.append(now)
+            waiter.set_result(None)
+
+    def estimate_wait(self, queued: Optional[int] = None) -> float:
+        """
+        Estimate how long a new request from the current tenant would wait.
+
+        Only requests that would be served before it (smaller finish tags)
+        count as ahead, so a light tenant is not shed because of another
+        tenant's backlog.
+
+        Args:
+            queued: Requests ahead of the new one (default: computed from the
+                tenant's position in the fair queue)
+
+        Returns:
+            Expected wait in seconds (0 if a slot is free now)
+        """
+        if queued is None:
+            state = self._tenant_state(self._tenant_key(get_tenant()))
+            finish = max(self._virtual_time, state.last_finish) + 1.0 / state.weight
+            queued = sum(
+                1
+                for tag, _, _, waiter in self._queue
+                if tag <= finish and not waiter.done()
+            )
+        return super().estimate_wait(queued)
+
+    def get_tenant_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-tenant usage statistics.
+
+        Returns:
+            Mapping of tenant key to weight, quota usage, queue depth, granted
+            and rejected requests and average wait
+        """
+        cutoff = time.time() - self.quota_window
+        for state in self.tenants.values():
+            while state.window and state.window[0] <= cutoff:
+                state.window.popleft()
+        return {tenant: state.to_dict() for tenant, state in self.tenants.items()}
+
+    async def get_status_async(self) -> dict:
+        """
+        Get current rate limiter status, including per-tenant stats.
+
+        Returns:
+            Dictionary with current rate limiter state
+        """
+        status = await super().get_status_async()
+        status["tenants"] = self.get_tenant_stats()
+        return status
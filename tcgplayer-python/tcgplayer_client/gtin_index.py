@@ -0,0 +1,298 @@
+"""
+Local GTIN index for TCGPlayer Client.
+
+This module provides a persistent GTIN -> productId hash index so barcode
+lookups can be answered locally, only falling back to the API on a miss.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Extended data field names that carry a barcode in catalog product payloads
+GTIN_FIELD_NAMES = ("gtin", "upc", "ean")
+
+# Pending records written to disk in one append once this many are buffered
+DEFAULT_FLUSH_THRESHOLD = 64
+
+
+def normalize_gtin(gtin: Any) -> Optional[str]:
+    """
+    Normalize a GTIN/UPC/EAN to a canonical 13-digit string.
+
+    Args:
+        gtin: Raw barcode value (string or integer)
+
+    Returns:
+        Normalized GTIN, or None if the value contains no usable digits
+    """
+    if gtin is None:
+        return None
+    digits = "".join(ch for ch in str(gtin) if ch.isdigit())
+    if not digits or len(digits) > 14:
+        return None
+    # GTIN-14 with a zero indicator digit is the same item as its GTIN-13
+    if len(digits) == 14 and digits[0] == "0":
+        digits = digits[1:]
+    return digits.zfill(13)
+
+
+def product_id_from_response(response: Dict[str, Any]) -> Optional[int]:
+    """
+    Extract the product ID from a GTIN lookup response.
+
+    Args:
+        response: ``/catalog/products/gtin/{gtin}`` response payload
+
+    Returns:
+        Product ID of the first result, or None if there is none
+    """
+    results = response.get("results") or response.get("Results") or []
+    if not results or not isinstance(results[0], dict):
+        return None
+    product_id = results[0].get("productId")
+    return int(product_id) if product_id is not None else None
+
+
+class GTINIndex:
+    """Persistent GTIN -> productId hash index.
+
+    The index lives in memory as a dict and is persisted as an append-only
+    text file with one ``<gtin>\\t<productId>`` record per line. New records
+    are buffered in memory and appended in batches by ``flush_pending()``,
+    which does the file I/O in a worker thread so lookups on the event loop
+    never block on disk. Later records win on load; ``compact()`` rewrites
+    the file without superseded lines.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+    ) -> None:
+        """
+        Initialize the GTIN index.
+
+        Args:
+            path: File used to persist the index (in-memory only if None)
+            flush_threshold: Buffered records that trigger a batched append
+        """
+        self.path = Path(path) if path else None
+        self.flush_threshold = flush_threshold
+        self._entries: Dict[str, int] = {}
+        self._pending: List[Tuple[str, int]] = []
+        self._write_lock = threading.Lock()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_loaded(self) -> None:
+        """Load the index from disk on first use."""
+        if not self._loaded:
+            self._loaded = True
+            self.load()
+
+    def load(self) -> int:
+        """
+        Load index records from disk, replacing in-memory entries.
+
+        Returns:
+            Number of entries loaded
+        """
+        self._loaded = True
+        self._entries = {}
+        if self.path is not None and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    gtin, _, product_id = line.rstrip("\n").partition("\t")
+                    if gtin and product_id.isdigit():
+                        self._entries[gtin] = int(product_id)
+            logger.debug(
+                f"Loaded {len(self._entries)} GTIN index entries from {self.path}"
+            )
+        # Records not yet flushed are newer than anything on disk
+        self._entries.update(self._pending)
+        return len(self._entries)
+
+    def get(self, gtin: Any) -> Optional[int]:
+        """
+        Look up the productId for a GTIN.
+
+        Args:
+            gtin: GTIN/UPC/EAN to look up
+
+        Returns:
+            Product ID, or None if the GTIN is not indexed
+        """
+        self._ensure_loaded()
+        key = normalize_gtin(gtin)
+        product_id = self._entries.get(key) if key else None
+        if product_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return product_id
+
+    def add(self, gtin: Any, product_id: int, persist: bool = True) -> bool:
+        """
+        Add or update a single GTIN mapping.
+
+        Args:
+            gtin: GTIN/UPC/EAN value
+            product_id: Product ID the GTIN resolves to
+            persist: Whether to queue the record for the index file
+
+        Returns:
+            True if the index changed, False otherwise
+        """
+        self._ensure_loaded()
+        key = normalize_gtin(gtin)
+        if key is None or self._entries.get(key) == int(product_id):
+            return False
+
+        self._entries[key] = int(product_id)
+        if persist and self.path is not None:
+            self._pending.append((key, int(product_id)))
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of records buffered but not yet written to disk."""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Append all buffered records to the index file.
+
+        Returns:
+            Number of records written
+        """
+        # Swap the buffer out first so records added meanwhile wait for the
+        # next flush instead of being lost
+        records, self._pending = self._pending, []
+        if not records or self.path is None:
+            return 0
+
+        with self._write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{gtin}\t{product_id}\n" for gtin, product_id in records)
+        return len(records)
+
+    async def flush_pending(self, force: bool = False) -> int:
+        """
+        Write buffered records in a worker thread.
+
+        Args:
+            force: Flush even if fewer than ``flush_threshold`` are buffered
+
+        Returns:
+            Number of records written
+        """
+        if not self._pending or (not force and self.pending < self.flush_threshold):
+            return 0
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.flush)
+
+    def update_from_products(self, products: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index GTINs found in catalog product payloads.
+
+        Products are matched on top-level ``gtin``/``upc``/``ean`` keys and on
+        ``extendedData`` entries with one of those names, as returned by
+        catalog sync with extended fields enabled. New mappings are buffered
+        like any other record; call ``flush_pending()`` to write them.
+
+        Args:
+            products: Product dicts from catalog responses
+
+        Returns:
+            Number of new or changed mappings
+        """
+        self._ensure_loaded()
+        changed = 0
+        for product in products:
+            product_id = product.get("productId")
+            if product_id is None:
+                continue
+            for gtin in _extract_gtins(product):
+                if self.add(gtin, product_id):
+                    changed += 1
+        return changed
+
+    def record_response(self, gtin: Any, response: Dict[str, Any]) -> Optional[int]:
+        """
+        Write back the result of a ``/catalog/products/gtin/{gtin}`` call.
+
+        Args:
+            gtin: GTIN that was looked up
+            response: API response payload
+
+        Returns:
+            Product ID extracted from the response, or None if absent
+        """
+        product_id = product_id_from_response(response)
+        if product_id is not None:
+            self.add(gtin, product_id)
+        return product_id
+
+    def save(self) -> None:
+        """Rewrite the index file atomically from the in-memory entries."""
+        if self.path is None:
+            return
+
+        # Every buffered record is already in the entries being written
+        self._pending = []
+        with self._write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(
+                    f"{gtin}\t{product_id}\n"
+                    for gtin, product_id in self._entries.items()
+                )
+            os.replace(tmp_path, self.path)
+
+    def compact(self) -> None:
+        """Drop superseded records from the index file."""
+        self._ensure_loaded()
+        self.save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+            "path": str(self.path) if self.path else None,
+        }
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
+
+    def __contains__(self, gtin: Any) -> bool:
+        self._ensure_loaded()
+        key = normalize_gtin(gtin)
+        return key is not None and key in self._entries
+
+
+def _extract_gtins(product: Dict[str, Any]) -> Iterable[Any]:
+    """Yield raw barcode values carried by a product payload."""
+    for name in GTIN_FIELD_NAMES:
+        value = product.get(name)
+        if value:
+            yield value
+
+    for field in product.get("extendedData") or ():
+        name = str(field.get("name", "")).lower()
+        if name in GTIN_FIELD_NAMES and field.get("value"):
+            yield field["value"]
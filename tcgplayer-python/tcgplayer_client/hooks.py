@@ -0,0 +1,155 @@
+"""
+Request lifecycle hooks for TCGPlayer Client.
+
+Hooks let instrumentation and custom caching observe every API call without
+patching the client. Register an async (or plain) callable for an event and
+it is called with a ``HookContext`` describing that point in the request:
+
+- ``before_request``: a rate limiter slot was granted and an attempt is about
+  to be sent
+- ``after_response``: an attempt finished, with its status, size and duration
+  (or the error, e.g. a timeout)
+- ``on_retry``: a failed attempt will be retried after ``retry_delay``
+- ``on_cache_hit``: the response was served from the response cache
+- ``on_rate_limit_wait``: a rate limiter slot was granted after ``wait``
+  seconds
+
+Hooks run in registration order. An exception in a hook is logged and does
+not affect the request. Contexts are only built for events that have hooks,
+so unused events cost one attribute lookup.
+"""
+
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from .exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+BEFORE_REQUEST = "before_request"
+AFTER_RESPONSE = "after_response"
+ON_RETRY = "on_retry"
+ON_CACHE_HIT = "on_cache_hit"
+ON_RATE_LIMIT_WAIT = "on_rate_limit_wait"
+
+HOOK_EVENTS = (
+    BEFORE_REQUEST,
+    AFTER_RESPONSE,
+    ON_RETRY,
+    ON_CACHE_HIT,
+    ON_RATE_LIMIT_WAIT,
+)
+
+
+@dataclass
+class HookContext:
+    """What a hook is told about the request.
+
+    Fields that do not apply to an event are None (e.g. ``status`` before the
+    request is sent). Durations are in seconds.
+    """
+
+    event: str
+    endpoint: str
+    template: str
+    method: str
+    params: Optional[Dict[str, Any]] = None
+    attempt: Optional[int] = None  # 1-based
+    status: Optional[int] = None
+    duration: Optional[float] = None
+    wait: Optional[float] = None
+    bytes: Optional[int] = None
+    error: Optional[str] = None
+    retry_delay: Optional[float] = None
+    stale: bool = False
+
+
+Hook = Callable[[HookContext], Union[Awaitable[None], None]]
+
+
+class HookRegistry:
+    """Registered hooks per lifecycle event.
+
+    Each event's hooks are kept as a tuple attribute named after the event,
+    so callers can skip building a context with ``if hooks.on_retry:``.
+    """
+
+    before_request: Tuple[Hook, ...]
+    after_response: Tuple[Hook, ...]
+    on_retry: Tuple[Hook, ...]
+    on_cache_hit: Tuple[Hook, ...]
+    on_rate_limit_wait: Tuple[Hook, ...]
+
+    def __init__(self) -> None:
+        """Initialize with no hooks."""
+        for event in HOOK_EVENTS:
+            setattr(self, event, ())
+
+    def _check_event(self, event: str) -> None:
+        if event not in HOOK_EVENTS:
+            raise ValidationError(
+                f"Unknown hook event {event!r}; expected one of "
+                f"{', '.join(HOOK_EVENTS)}"
+            )
+
+    def register(self, event: str, hook: Hook) -> Hook:
+        """
+        Register a hook for an event.
+
+        Args:
+            event: One of ``HOOK_EVENTS``
+            hook: Callable taking a ``HookContext``; may be async
+
+        Returns:
+            The hook
+
+        Raises:
+            ValidationError: If the event is unknown
+        """
+        self._check_event(event)
+        setattr(self, event, getattr(self, event) + (hook,))
+        return hook
+
+    def unregister(self, event: str, hook: Hook) -> bool:
+        """
+        Remove a hook.
+
+        Args:
+            event: Event it was registered for
+            hook: The registered hook
+
+        Returns:
+            True if the hook was registered
+        """
+        self._check_event(event)
+        hooks = list(getattr(self, event))
+        if hook not in hooks:
+            return False
+        hooks.remove(hook)
+        setattr(self, event, tuple(hooks))
+        return True
+
+    def clear(self) -> None:
+        """Remove every hook."""
+        for event in HOOK_EVENTS:
+            setattr(self, event, ())
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, event) for event in HOOK_EVENTS)
+
+    async def emit(self, context: HookContext) -> None:
+        """
+        Call the hooks registered for ``context.event``.
+
+        Args:
+            context: Context passed to every hook
+        """
+        for hook in getattr(self, context.event):
+            try:
+                result = hook(context)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"{context.event} hook {hook!r} failed: {e}")
@@ -0,0 +1,545 @@
+"""
+Background jobs for TCGPlayer Client.
+
+This module runs long bulk operations (price syncs, set imports) as
+background jobs under the client's shared rate limiter. A job is planned
+into independent work items; completed items are checkpointed so a job can
+report progress and ETA, be cancelled, and resume after a restart without
+starting from zero.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .batching import DEFAULT_ID_BATCH_SIZE, chunked, unique_ids
+from .exceptions import ValidationError
+from .pricing_planner import plan_price_requests
+from .profiling import SamplingProfiler
+
+if TYPE_CHECKING:
+    from .client import TCGPlayerClient
+
+logger = logging.getLogger(__name__)
+
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+PlanFunc = Callable[[Dict[str, Any]], Awaitable[List[Any]]]
+StepFunc = Callable[[Any], Awaitable[List[Any]]]
+
+
+@dataclass
+class JobDefinition:
+    """How to plan a job kind into work items and run one item."""
+
+    plan: PlanFunc
+    step: StepFunc
+    concurrency: int = 4
+
+
+@dataclass
+class Job:
+    """State of a background job."""
+
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = PENDING
+    items: Optional[List[Any]] = None
+    completed: Set[int] = field(default_factory=set)
+    results: List[Any] = field(default_factory=list)
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # Items completed and seconds spent in the current run, for the ETA
+    _run_started: Optional[float] = None
+    _run_completed: int = 0
+    _last_saved: float = 0.0
+
+    @property
+    def total(self) -> Optional[int]:
+        """Number of work items (None until planned)."""
+        return None if self.items is None else len(self.items)
+
+    @property
+    def progress(self) -> float:
+        """Completed fraction of the job in [0, 1]."""
+        if self.status == SUCCEEDED:
+            return 1.0
+        if not self.items:
+            return 0.0
+        return len(self.completed) / len(self.items)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds remaining, from this run's completion rate."""
+        if self.status != RUNNING or not self.items or not self._run_completed:
+            return None
+        elapsed = time.monotonic() - (self._run_started or time.monotonic())
+        rate = self._run_completed / elapsed if elapsed > 0 else 0
+        remaining = len(self.items) - len(self.completed)
+        return remaining / rate if rate else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for status responses."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "total_items": self.total,
+            "completed_items": len(self.completed),
+            "progress": round(self.progress, 4),
+            "eta_seconds": self.eta_seconds,
+            "result_count": len(self.results),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def _checkpoint(self) -> Dict[str, Any]:
+        """State persisted between runs (results are stored separately)."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "items": self.items,
+            "completed": sorted(self.completed),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """Runs and tracks background jobs.
+
+    Jobs share the client's rate limiter with interactive requests; each job
+    runs up to its definition's ``concurrency`` items at a time. With a
+    ``state_dir`` every job's checkpoint is written to ``<id>.json`` and each
+    completed item's results are appended to ``<id>.ndjson`` as one
+    ``{"item": <index>, "rows": [...]}`` line, and ``resume()`` restarts jobs
+    that were pending or running when the process stopped. That line is what
+    marks an item complete, so a crash never runs an item twice or duplicates
+    its rows; the checkpoint is only rewritten every ``checkpoint_interval``
+    seconds while a job runs, and all file I/O during a run happens in a
+    worker thread. With a ``profile_dir``
+    each run is profiled and written to ``<id>.speedscope.json``. Only the
+    newest ``max_finished_jobs`` finished jobs (and their results and state
+    files) are kept.
+    """
+
+    def __init__(
+        self,
+        state_dir: Optional[str] = None,
+        max_running_jobs: int = 2,
+        profile_dir: Optional[str] = None,
+        max_finished_jobs: int = 100,
+        checkpoint_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the job manager.
+
+        Args:
+            state_dir: Directory for job checkpoints (None keeps jobs in memory)
+            max_running_jobs: Jobs allowed to run at the same time
+            profile_dir: Directory for job profiles (None disables profiling)
+            max_finished_jobs: Finished jobs kept before the oldest are evicted
+            checkpoint_interval: Minimum seconds between checkpoints of a
+                running job
+        """
+        self.state_dir = state_dir
+        self.profile_dir = profile_dir
+        self.definitions: Dict[str, JobDefinition] = {}
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.max_running_jobs = max_running_jobs
+        self.max_finished_jobs = max_finished_jobs
+        self.checkpoint_interval = checkpoint_interval
+        # Serializes checkpoint writes from the event loop and worker threads
+        self._write_lock = threading.Lock()
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    def register(self, kind: str, definition: JobDefinition) -> None:
+        """Register a job kind."""
+        self.definitions[kind] = definition
+
+    def _state_path(self, job_id: str, suffix: str) -> str:
+        return os.path.join(self.state_dir or "", f"{job_id}{suffix}")
+
+    def _save(self, job: Job) -> None:
+        """Write a job's checkpoint atomically."""
+        if not self.state_dir:
+            return
+        job._last_saved = time.monotonic()
+        self._write_checkpoint(job.id, job._checkpoint())
+
+    def _write_checkpoint(self, job_id: str, state: Dict[str, Any]) -> None:
+        path = self._state_path(job_id, ".json")
+        tmp_path = path + ".tmp"
+        with self._write_lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+
+    def _append_results(self, job_id: str, index: int, rows: List[Any]) -> None:
+        """Append a completed item's rows to a job's results file."""
+        record = json.dumps({"item": index, "rows": rows}, separators=(",", ":"))
+        with open(self._state_path(job_id, ".ndjson"), "a", encoding="utf-8") as f:
+            f.write(record + "\n")
+
+    async def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Job:
+        """
+        Create and start a job.
+
+        Args:
+            kind: Registered job kind
+            params: Job parameters passed to the plan function
+
+        Returns:
+            The new job
+
+        Raises:
+            ValidationError: If the kind is not registered
+        """
+        if kind not in self.definitions:
+            raise ValidationError(f"Unknown job kind: {kind}")
+        job = Job(id=uuid.uuid4().hex, kind=kind, params=dict(params or {}))
+        self.jobs[job.id] = job
+        self._save(job)
+        self._start(job)
+        return job
+
+    def _start(self, job: Job) -> None:
+        # Jobs outlive the request that created them: run in a fresh context
+        # so they do not inherit its deadline, call budget or tenant
+        self._tasks[job.id] = contextvars.Context().run(
+            asyncio.ensure_future, self._run(job)
+        )
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished jobs beyond ``max_finished_jobs``."""
+        finished = [j for j in self.jobs.values() if j.status in FINISHED_STATES]
+        excess = len(finished) - self.max_finished_jobs
+        if excess <= 0:
+            return
+        finished.sort(key=lambda j: j.finished_at or j.created_at)
+        for job in finished[:excess]:
+            del self.jobs[job.id]
+            self._tasks.pop(job.id, None)
+            if self.state_dir:
+                for suffix in (".json", ".ndjson"):
+                    try:
+                        os.remove(self._state_path(job.id, suffix))
+                    except FileNotFoundError:
+                        pass
+            logger.debug(f"Evicted finished job {job.id} ({job.kind})")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID."""
+        return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """List jobs, newest first."""
+        return sorted(self.jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    async def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a pending or running job.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            True if the job was cancelled, False if it was unknown or finished
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        job.status = CANCELLED
+        job.finished_at = time.time()
+        self._save(job)
+        self._evict_finished()
+        return True
+
+    async def _run(self, job: Job) -> None:
+        """Plan (if needed) and run a job's remaining items."""
+        definition = self.definitions[job.kind]
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_running_jobs)
+
+        async with self._slots:
+            profiler = SamplingProfiler() if self.profile_dir else None
+            if profiler:
+                profiler.start()
+            try:
+                job.status = RUNNING
+                job.started_at = job.started_at or time.time()
+                if job.items is None:
+                    job.items = list(await definition.plan(job.params))
+                self._save(job)
+                await self._run_items(job, definition)
+                job.status = SUCCEEDED
+            except asyncio.CancelledError:
+                if job.status != CANCELLED:
+                    # Shutdown: leave the job resumable
+                    self._save(job)
+                raise
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                job.status = FAILED
+                job.error = str(e)
+            finally:
+                if profiler:
+                    self._write_profile(job, profiler)
+            job.finished_at = time.time()
+            self._save(job)
+            logger.info(
+                f"Job {job.id} ({job.kind}) {job.status}: "
+                f"{len(job.completed)}/{job.total} items, "
+                f"{len(job.results)} results"
+            )
+        self._evict_finished()
+
+    def _write_profile(self, job: Job, profiler: SamplingProfiler) -> None:
+        """Stop a job's profiler and write its profile."""
+        profiler.stop()
+        path = os.path.join(self.profile_dir or "", f"{job.id}.speedscope.json")
+        try:
+            profiler.write(path)
+        except OSError as e:
+            logger.warning(f"Could not write profile of job {job.id}: {e}")
+
+    async def _run_items(self, job: Job, definition: JobDefinition) -> None:
+        """Run a job's incomplete items, checkpointing each as it finishes."""
+        items = job.items or []
+        pending = [i for i in range(len(items)) if i not in job.completed]
+        job._run_started = time.monotonic()
+        job._run_completed = 0
+        semaphore = asyncio.Semaphore(max(1, definition.concurrency))
+        loop = asyncio.get_running_loop()
+
+        async def run_item(index: int) -> None:
+            async with semaphore:
+                rows = await definition.step(items[index])
+            rows = list(rows or [])
+            job.results.extend(rows)
+            if self.state_dir:
+                # The results line is the completion record: write it before
+                # the item counts as done anywhere else
+                await loop.run_in_executor(
+                    None, self._append_results, job.id, index, rows
+                )
+            job.completed.add(index)
+            job._run_completed += 1
+            if (
+                self.state_dir
+                and time.monotonic() - job._last_saved >= self.checkpoint_interval
+            ):
+                job._last_saved = time.monotonic()
+                await loop.run_in_executor(
+                    None, self._write_checkpoint, job.id, job._checkpoint()
+                )
+
+        tasks = [asyncio.ensure_future(run_item(i)) for i in pending]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def resume(self) -> int:
+        """
+        Load checkpoints from ``state_dir`` and restart unfinished jobs.
+
+        Returns:
+            Number of jobs restarted
+        """
+        if not self.state_dir:
+            return 0
+        restarted = 0
+        for name in sorted(os.listdir(self.state_dir)):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.state_dir, name), encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable job checkpoint {name}: {e}")
+                continue
+            job = Job(
+                id=state["id"],
+                kind=state["kind"],
+                params=state.get("params") or {},
+                status=state.get("status", PENDING),
+                items=state.get("items"),
+                completed=set(state.get("completed") or []),
+                error=state.get("error"),
+                created_at=state.get("created_at", time.time()),
+                started_at=state.get("started_at"),
+                finished_at=state.get("finished_at"),
+            )
+            # Items with a results line finished even if the checkpoint
+            # was written before they did
+            job.results, done = self._load_results(job.id)
+            job.completed |= done
+            self.jobs[job.id] = job
+            if job.status not in FINISHED_STATES and job.kind in self.definitions:
+                self._start(job)
+                restarted += 1
+        self._evict_finished()
+        if restarted:
+            logger.info(f"Resumed {restarted} background jobs")
+        return restarted
+
+    def _load_results(self, job_id: str) -> Tuple[List[Any], Set[int]]:
+        """Read a job's results file; returns its rows and completed items."""
+        path = self._state_path(job_id, ".ndjson")
+        by_item: Dict[int, List[Any]] = {}
+        if not os.path.exists(path):
+            return [], set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line torn by a crash: its item simply runs again
+                    logger.warning(f"Skipping partial result line of job {job_id}")
+                    continue
+                by_item[int(record["item"])] = list(record.get("rows") or [])
+        rows = [row for item in sorted(by_item) for row in by_item[item]]
+        return rows, set(by_item)
+
+    async def shutdown(self) -> None:
+        """Stop running jobs, leaving them checkpointed for ``resume()``."""
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts by status."""
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"jobs": len(self.jobs), "by_status": counts}
+
+
+def _results(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return response.get("results") or response.get("Results") or []
+
+
+def sync_prices_job(client: "TCGPlayerClient") -> JobDefinition:
+    """
+    Job that refreshes prices for products, groups or a whole category.
+
+    Params (one of): ``productIds`` (optionally with a ``productGroups``
+    productId -> groupId map, used to plan group-level calls), ``groupIds``,
+    or ``categoryId``. Results are price rows.
+    """
+    pricing = client.endpoints.pricing
+    catalog = client.endpoints.catalog
+
+    async def plan(params: Dict[str, Any]) -> List[Any]:
+        if params.get("productIds"):
+            groups = {
+                int(k): int(v) for k, v in (params.get("productGroups") or {}).items()
+            }
+            pricing_plan = plan_price_requests(params["productIds"], groups)
+            return [{"groupId": g} for g in pricing_plan.group_ids] + [
+                {"productIds": batch} for batch in pricing_plan.product_batches
+            ]
+        if params.get("groupIds"):
+            return [{"groupId": g} for g in unique_ids(params["groupIds"])]
+        if params.get("categoryId"):
+            items = []
+            async for page in catalog.iter_groups(int(params["categoryId"])):
+                items.extend({"groupId": g["groupId"]} for g in page)
+            return items
+        raise ValidationError("sync-prices needs productIds, groupIds or categoryId")
+
+    async def step(item: Dict[str, Any]) -> List[Any]:
+        if "groupId" in item:
+            return _results(await pricing.get_product_prices_by_group(item["groupId"]))
+        return _results(await pricing.get_market_prices(item["productIds"]))
+
+    return JobDefinition(plan=plan, step=step)
+
+
+def import_set_job(
+    client: "TCGPlayerClient", batch_size: int = DEFAULT_ID_BATCH_SIZE
+) -> JobDefinition:
+    """
+    Job that imports a set (group): product details, SKUs and prices.
+
+    Params: ``groupId``. Results are product dicts with ``skus`` and
+    ``prices`` lists attached.
+    """
+    pricing = client.endpoints.pricing
+    catalog = client.endpoints.catalog
+
+    async def plan(params: Dict[str, Any]) -> List[Any]:
+        if not params.get("groupId"):
+            raise ValidationError("import-set needs groupId")
+        product_ids: List[int] = []
+        async for page in catalog.iter_products(group_id=int(params["groupId"])):
+            product_ids.extend(p["productId"] for p in page)
+        return list(chunked(unique_ids(product_ids), batch_size))
+
+    async def step(product_ids: List[int]) -> List[Any]:
+        details, skus, prices = await asyncio.gather(
+            catalog.get_product_details(product_ids),
+            catalog.get_skus(product_ids),
+            pricing.get_market_prices(product_ids),
+        )
+        by_product: Dict[int, Dict[str, Any]] = {}
+        for product in _results(details):
+            by_product[product["productId"]] = {**product, "skus": [], "prices": []}
+        for sku in _results(skus):
+            if sku.get("productId") in by_product:
+                by_product[sku["productId"]]["skus"].append(sku)
+        for row in _results(prices):
+            if row.get("productId") in by_product:
+                by_product[row["productId"]]["prices"].append(row)
+        return list(by_product.values())
+
+    return JobDefinition(plan=plan, step=step)
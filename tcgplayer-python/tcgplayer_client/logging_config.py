@@ -3,15 +3,22 @@ Enhanced logging configuration for TCGPlayer Client.
 
 This module provides structured logging with configurable log levels,
 formatters, and handlers for better debugging and monitoring.
+
+Hot-path log calls (per request, cache hit and rate limiter grant) use lazy
+%-style arguments and tag their records with a ``log_event`` name so they can
+be sampled per event with ``SamplingFilter``. ``TCGPlayerLogger.start_queue``
+moves handler I/O to a listener thread so logging never blocks the event loop.
 """
 
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Default logging configuration
 DEFAULT_LOG_LEVEL = "INFO"
@@ -26,6 +33,18 @@ DEFAULT_JSON_FORMAT = {
     "line": "%(lineno)d",
 }
 
+# Record attribute naming a sampled hot-path event
+SAMPLE_EVENT_ATTR = "log_event"
+
+# Hot-path events (``extra`` dicts are shared; logging only reads them)
+REQUEST_EVENT = {SAMPLE_EVENT_ATTR: "request"}
+RESPONSE_EVENT = {SAMPLE_EVENT_ATTR: "response"}
+CACHE_HIT_EVENT = {SAMPLE_EVENT_ATTR: "cache_hit"}
+RATE_LIMIT_WAIT_EVENT = {SAMPLE_EVENT_ATTR: "rate_limit_wait"}
+RATE_LIMIT_GRANT_EVENT = {SAMPLE_EVENT_ATTR: "rate_limit_grant"}
+
+_FIELD_PATTERN = re.compile(r"^%\((\w+)\)[sdfr]$")
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that supports both text and JSON output."""
@@ -49,6 +68,14 @@ class StructuredFormatter(logging.Formatter):
         super().__init__(fmt, datefmt)
         self.json_format = json_format
         self.json_fields = json_fields or DEFAULT_JSON_FORMAT
+        # Resolve "%(name)s" mappings once: (key, record attribute, literal)
+        self._json_plan: List[Tuple[str, Optional[str], str]] = []
+        for field, fmt in self.json_fields.items():
+            match = _FIELD_PATTERN.match(fmt)
+            self._json_plan.append((field, match.group(1) if match else None, fmt))
+        attributes = {attribute for _, attribute, _ in self._json_plan}
+        self._needs_message = "message" in attributes
+        self._needs_asctime = "asctime" in attributes
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record."""
@@ -58,21 +85,16 @@ class StructuredFormatter(logging.Formatter):
 
     def _format_json(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
-        log_data = {}
+        if self._needs_message:
+            record.message = record.getMessage()
+        if self._needs_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
 
-        for field, fmt in self.json_fields.items():
-            try:
-                if fmt.startswith("%(") and fmt.endswith(")s"):
-                    # Extract field name from format string
-                    field_name = fmt[2:-2]
-                    if hasattr(record, field_name):
-                        log_data[field] = getattr(record, field_name)
-                    else:
-                        log_data[field] = fmt
-                else:
-                    log_data[field] = fmt
-            except Exception:
-                log_data[field] = fmt
+        log_data: Dict[str, Any] = {}
+        for field, attribute, fmt in self._json_plan:
+            log_data[field] = (
+                getattr(record, attribute, fmt) if attribute is not None else fmt
+            )
 
         # Add extra fields if present
         if hasattr(record, "extra_fields"):
@@ -85,6 +107,79 @@ class StructuredFormatter(logging.Formatter):
         return json.dumps(log_data, default=str)
 
 
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of tagged hot-path records, per event.
+
+    Records logged with ``extra={"log_event": name}`` are kept at the rate
+    configured for ``name`` (0.0 drops all, 1.0 keeps all); untagged records
+    and events without a rate always pass. Sampling is deterministic: a rate
+    of 0.1 keeps exactly every tenth record of that event. A filter shared by
+    several handlers decides once per record, so every handler keeps the
+    same records.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Event name -> fraction of records to keep
+        """
+        super().__init__()
+        self.rates: Dict[str, float] = {}
+        self._credit: Dict[str, float] = {}
+        self.dropped: Dict[str, int] = {}
+        # Record attribute caching this filter's decision for the record
+        self._decision_attr = f"_sampled_{id(self):x}"
+        for event, rate in (rates or {}).items():
+            self.set_rate(event, rate)
+
+    def set_rate(self, event: str, rate: float) -> None:
+        """
+        Set the fraction of an event's records to keep.
+
+        Args:
+            event: Event name
+            rate: Fraction between 0.0 and 1.0
+
+        Raises:
+            ValueError: If the rate is outside 0.0-1.0
+        """
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate for {event} must be between 0 and 1")
+        self.rates[event] = rate
+        self._credit[event] = 0.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep a record."""
+        event = getattr(record, SAMPLE_EVENT_ATTR, None)
+        if event is None:
+            return True
+        rate = self.rates.get(event)
+        if rate is None or rate >= 1.0:
+            return True
+        decision = record.__dict__.get(self._decision_attr)
+        if decision is not None:
+            return decision
+        credit = self._credit[event] + rate
+        # Tolerance so e.g. ten additions of 0.1 reach a whole record
+        keep = credit >= 1.0 - 1e-9
+        if keep:
+            self._credit[event] = credit - 1.0
+        else:
+            self._credit[event] = credit
+            self.dropped[event] = self.dropped.get(event, 0) + 1
+        record.__dict__[self._decision_attr] = keep
+        return keep
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves all formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class TCGPlayerLogger:
     """Enhanced logger for TCGPlayer Client with structured logging support."""
 
@@ -100,6 +195,9 @@ class TCGPlayerLogger:
         """
         self.name = name
         self.logger = logging.getLogger(name)
+        self.sampling: Optional[SamplingFilter] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._queued_handlers: List[logging.Handler] = []
 
         # Set log level
         if level is not None:
@@ -192,6 +290,66 @@ class TCGPlayerLogger:
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
 
+    def set_sample_rates(self, rates: Dict[str, float]) -> SamplingFilter:
+        """
+        Sample hot-path events on this logger's handlers.
+
+        Args:
+            rates: Event name (``request``, ``response``, ``cache_hit``,
+                ``rate_limit_wait``, ``rate_limit_grant``) -> fraction kept
+
+        Returns:
+            The sampling filter (its ``dropped`` counts records sampled out)
+        """
+        if self.sampling is None:
+            self.sampling = SamplingFilter()
+            for handler in self.logger.handlers:
+                handler.addFilter(self.sampling)
+        for event, rate in rates.items():
+            self.sampling.set_rate(event, rate)
+        return self.sampling
+
+    def start_queue(self) -> None:
+        """
+        Move this logger's handlers behind a queue and a listener thread.
+
+        The logger then only enqueues records (after sampling); formatting
+        and I/O happen on the listener thread, off the event loop.
+        """
+        if self._listener is not None:
+            return
+        handlers = list(self.logger.handlers)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        queue_handler = _DeferredQueueHandler(log_queue)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+            if self.sampling is not None:
+                # Sample before enqueueing rather than on the listener thread
+                handler.removeFilter(self.sampling)
+        if self.sampling is not None:
+            queue_handler.addFilter(self.sampling)
+        self.logger.addHandler(queue_handler)
+        self._queued_handlers = handlers
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def stop_queue(self) -> None:
+        """Flush queued records and restore the handlers to the logger."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, _DeferredQueueHandler):
+                self.logger.removeHandler(handler)
+        for handler in self._queued_handlers:
+            if self.sampling is not None:
+                handler.addFilter(self.sampling)
+            self.logger.addHandler(handler)
+        self._queued_handlers = []
+
     def log_with_context(self, level: int, message: str, **extra_fields):
         """Log a message with extra context fields."""
         record = self.logger.makeRecord(self.name, level, "", 0, message, (), None)
@@ -246,6 +404,8 @@ def setup_logging(
     level: Optional[Union[str, int]] = None,
     log_file: Optional[Union[str, Path]] = None,
     json_format: bool = False,
+    sample_rates: Optional[Dict[str, float]] = None,
+    queued: bool = False,
 ) -> TCGPlayerLogger:
     """
     Set up logging for TCGPlayer Client.
@@ -255,6 +415,9 @@ def setup_logging(
         level: Log level (string or int)
         log_file: Optional log file path
         json_format: Whether to use JSON format for file logging
+        sample_rates: Fraction of records to keep per hot-path event
+        queued: Write logs from a listener thread (call ``stop_queue()`` on
+            shutdown to flush)
 
     Returns:
         Configured logger instance
@@ -269,6 +432,11 @@ def setup_logging(
     if log_file:
         logger.add_file_handler(log_file, json_format=json_format)
 
+    if sample_rates:
+        logger.set_sample_rates(sample_rates)
+    if queued:
+        logger.start_queue()
+
     return logger
 
 
@@ -0,0 +1,456 @@
+"""
+Metrics collection for TCGPlayer Client.
+
+This module provides lightweight counters, gauges and histograms keyed by
+label values, and renders them in the Prometheus text exposition format.
+Request metrics are labelled by endpoint template (``/catalog/products/{ids}``)
+rather than raw URL so label cardinality stays bounded.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds (5ms .. 30s)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+_ID_LIST_SEGMENT = re.compile(r"^\d+(,\d+)+$")
+
+LabelValues = Tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Reduce an API path to its template for use as a metric label.
+
+    Numeric path segments become ``{id}`` and comma-separated ID lists
+    become ``{ids}``; query strings are dropped.
+
+    Args:
+        endpoint: API endpoint path, e.g. ``/catalog/products/1,2,3``
+
+    Returns:
+        Endpoint template, e.g. ``/catalog/products/{ids}``
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = []
+    for segment in path.split("/"):
+        if _ID_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _ID_LIST_SEGMENT.match(segment):
+            segments.append("{ids}")
+        else:
+            segments.append(segment)
+    return "/".join(segments)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as ``{a="x",b="y"}`` (empty string if no labels)."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels samples are keyed by
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Build the label values tuple for a sample."""
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        """Render the metric's HELP, TYPE and sample lines."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        # Unlabelled metrics always expose a sample, starting at zero
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter for a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Set the counter from a running total kept elsewhere (collectors)."""
+        self._values[self._key(labels)] = float(value)
+
+    def get(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        """Drop all labelled samples (collectors re-set the live ones)."""
+        if self.labelnames:
+            self._values.clear()
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        # Unlabelled metrics always expose a sample, starting at zero
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set."""
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge for a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge for a label set."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        """Drop all labelled samples (collectors re-set the live ones)."""
+        if self.labelnames:
+            self._values.clear()
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels samples are keyed by
+            buckets: Sorted upper bounds of the buckets (``+Inf`` is implicit)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for a label set."""
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        # Counts are stored per bucket and made cumulative at render time
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def get_count(self, **labels: str) -> int:
+        """Get the number of observations for a label set."""
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def get_sum(self, **labels: str) -> float:
+        """Get the sum of observations for a label set."""
+        return self._sums.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        bucket_labels = self.labelnames + ("le",)
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, key + (bound,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together.
+
+    Collectors are callables run before each render; they copy totals kept
+    by other components (e.g. cache eviction counts or limiter queue depth)
+    into registered metrics so those components stay free of metric calls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric {metric.name} already registered")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))  # type: ignore
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(  # type: ignore
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callable that refreshes metrics before rendering."""
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Run all collectors."""
+        for collector in self._collectors:
+            collector()
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text (version 0.0.4)
+        """
+        self.collect()
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class ClientMetrics:
+    """Standard metrics recorded by ``TCGPlayerClient``.
+
+    Covers upstream request latency and outcomes per endpoint template,
+    response decode time, connection phase timings (when tracing is on),
+    retries, load shedding, in-flight requests, rate limiter wait and queue
+    depth, per-tenant usage, and response cache hits, misses and evictions.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """
+        Register the client metrics.
+
+        Args:
+            registry: Registry to register into (a new one if not given)
+        """
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.requests = r.counter(
+            "tcgplayer_client_requests_total",
+            "Upstream API responses by endpoint template, method and status.",
+            ("endpoint", "method", "status"),
+        )
+        self.request_duration = r.histogram(
+            "tcgplayer_client_request_duration_seconds",
+            "Upstream API latency per attempt, excluding rate limiter wait.",
+            ("endpoint", "method"),
+        )
+        self.decode_duration = r.histogram(
+            "tcgplayer_client_decode_duration_seconds",
+            "Time spent reading and JSON-decoding upstream responses.",
+            ("endpoint",),
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+        )
+        self.retries = r.counter(
+            "tcgplayer_client_retries_total",
+            "Upstream request retries by endpoint template and reason.",
+            ("endpoint", "reason"),
+        )
+        self.shed = r.counter(
+            "tcgplayer_client_shed_total",
+            "Requests shed by admission control, served stale or rejected.",
+            ("endpoint", "outcome"),
+        )
+        self.coalesced = r.counter(
+            "tcgplayer_client_coalesced_total",
+            "GET requests that joined an identical in-flight upstream fetch.",
+        )
+        self.withdrawn = r.counter(
+            "tcgplayer_client_withdrawn_total",
+            "Upstream fetches cancelled because every caller went away.",
+        )
+        self.phase_duration = r.histogram(
+            "tcgplayer_client_request_phase_seconds",
+            "Upstream request time by phase (queued, dns, connect, ttfb, "
+            "download, total); recorded when request tracing is enabled.",
+            ("phase",),
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        )
+        self.connections = r.counter(
+            "tcgplayer_client_connections_total",
+            "Upstream requests by connection kind (new or reused).",
+            ("kind",),
+        )
+        self.in_flight = r.gauge(
+            "tcgplayer_client_in_flight_requests",
+            "API requests currently waiting on the rate limiter or upstream.",
+        )
+        self.limiter_wait = r.histogram(
+            "tcgplayer_rate_limiter_wait_seconds",
+            "Time spent waiting for a rate limiter slot.",
+        )
+        self.limiter_queue_depth = r.gauge(
+            "tcgplayer_rate_limiter_queue_depth",
+            "Requests currently waiting for a rate limiter slot.",
+        )
+        self.limiter_window_requests = r.gauge(
+            "tcgplayer_rate_limiter_window_requests",
+            "Requests made within the current rate limit window.",
+        )
+        self.tenant_requests = r.counter(
+            "tcgplayer_tenant_requests_total",
+            "Rate limiter slots granted per tenant (fair queuing only).",
+            ("tenant",),
+        )
+        self.tenant_rejected = r.counter(
+            "tcgplayer_tenant_rejected_total",
+            "Requests rejected because the tenant's quota was used up.",
+            ("tenant",),
+        )
+        self.tenant_queue_depth = r.gauge(
+            "tcgplayer_tenant_queue_depth",
+            "Requests waiting for a rate limiter slot per tenant.",
+            ("tenant",),
+        )
+        self.cache_lookups = r.counter(
+            "tcgplayer_cache_lookups_total",
+            "Response cache lookups by result (hit or miss).",
+            ("result",),
+        )
+        self.cache_lookup_duration = r.histogram(
+            "tcgplayer_cache_lookup_duration_seconds",
+            "Time spent looking up the response cache.",
+            buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01),
+        )
+        self.cache_evictions = r.counter(
+            "tcgplayer_cache_evictions_total",
+            "Response cache entries removed by reason (size or expired).",
+            ("reason",),
+        )
+        self.cache_entries = r.gauge(
+            "tcgplayer_cache_entries",
+            "Entries currently held in the response cache.",
+        )
@@ -0,0 +1,327 @@
+"""
+Price change detection for TCGPlayer Client.
+
+This module compares successive price batches (``/pricing/group`` or SKU
+market prices) column-wise over aligned arrays and streams only the rows
+whose prices changed, with absolute and percentage deltas.
+"""
+
+import asyncio
+import logging
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+# Numeric price fields compared by default (group and SKU price payloads)
+DEFAULT_PRICE_FIELDS = (
+    "lowPrice",
+    "midPrice",
+    "highPrice",
+    "marketPrice",
+    "directLowPrice",
+    "lowestListingPrice",
+    "lowestShipping",
+)
+
+_NAN = float("nan")
+
+
+def price_row_key(row: Dict[str, Any]) -> Hashable:
+    """
+    Get the identity of a price row.
+
+    SKU rows are keyed by skuId; product rows by (productId, subTypeName),
+    since group pricing returns one row per printing sub-type.
+    """
+    sku_id = row.get("skuId")
+    if sku_id is not None:
+        return int(sku_id)
+    return (row.get("productId"), row.get("subTypeName"))
+
+
+def _as_float(value: Any) -> float:
+    """Convert a price value to float, mapping missing values to NaN."""
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+class PriceSnapshot:
+    """Column-oriented snapshot of a price batch.
+
+    Rows are stored once and each price field is held as an ``array('d')``
+    column aligned with ``keys``, so two snapshots are compared one column
+    at a time rather than dict by dict.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        fields: Sequence[str] = DEFAULT_PRICE_FIELDS,
+    ) -> None:
+        """
+        Build a snapshot from price rows.
+
+        Args:
+            rows: Price result rows from a pricing response
+            fields: Numeric fields to track
+        """
+        self.rows: List[Dict[str, Any]] = list(rows)
+        self.keys: List[Hashable] = [price_row_key(row) for row in self.rows]
+        self.index: Dict[Hashable, int] = {key: i for i, key in enumerate(self.keys)}
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.columns: Dict[str, array] = {
+            name: array("d", (_as_float(row.get(name)) for row in self.rows))
+            for name in self.fields
+        }
+
+    @classmethod
+    def from_response(
+        cls,
+        response: Dict[str, Any],
+        fields: Sequence[str] = DEFAULT_PRICE_FIELDS,
+    ) -> "PriceSnapshot":
+        """Build a snapshot from a pricing API response payload."""
+        return cls(response.get("results") or response.get("Results") or [], fields)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+@dataclass
+class PriceDelta:
+    """Change of a single price field."""
+
+    field: str
+    old: Optional[float]
+    new: Optional[float]
+    absolute: Optional[float]
+    percent: Optional[float]
+
+
+@dataclass
+class PriceChange:
+    """A price row whose tracked fields changed between snapshots."""
+
+    key: Hashable
+    row: Dict[str, Any]
+    deltas: Dict[str, PriceDelta] = field(default_factory=dict)
+    is_new: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "key": list(self.key) if isinstance(self.key, tuple) else self.key,
+            "row": self.row,
+            "is_new": self.is_new,
+            "deltas": {
+                name: {
+                    "old": d.old,
+                    "new": d.new,
+                    "absolute": d.absolute,
+                    "percent": d.percent,
+                }
+                for name, d in self.deltas.items()
+            },
+        }
+
+
+def _changed_mask(
+    old_col: Sequence[float],
+    new_col: Sequence[float],
+    min_abs_delta: float,
+    min_pct_delta: float,
+) -> List[bool]:
+    """Compare two aligned columns, returning a per-row changed mask."""
+    mask = []
+    append = mask.append
+    for a, b in zip(old_col, new_col):
+        if a == b:
+            append(False)
+        elif a != a or b != b:
+            # NaN on one or both sides: changed only if exactly one is missing
+            append((a != a) != (b != b))
+        else:
+            diff = abs(b - a)
+            append(
+                diff > min_abs_delta
+                and (not min_pct_delta or a == 0 or diff / abs(a) * 100 > min_pct_delta)
+            )
+    return mask
+
+
+def _delta(name: str, a: float, b: float) -> PriceDelta:
+    """Build a PriceDelta from two column values."""
+    old = None if math.isnan(a) else a
+    new = None if math.isnan(b) else b
+    if old is None or new is None:
+        return PriceDelta(name, old, new, None, None)
+    absolute = new - old
+    percent = (absolute / old * 100) if old else None
+    return PriceDelta(name, old, new, round(absolute, 4), percent)
+
+
+def diff_snapshots(
+    previous: Optional[PriceSnapshot],
+    current: PriceSnapshot,
+    min_abs_delta: float = 0.0,
+    min_pct_delta: float = 0.0,
+    include_new: bool = True,
+) -> List[PriceChange]:
+    """
+    Compute changed rows between two snapshots.
+
+    Args:
+        previous: Earlier snapshot (None treats every row as new)
+        current: Latest snapshot
+        min_abs_delta: Ignore changes whose absolute delta is not above this
+        min_pct_delta: Ignore changes whose percentage delta is not above this
+        include_new: Whether rows absent from ``previous`` are reported
+
+    Returns:
+        Changed rows in ``current`` order
+    """
+    if previous is None:
+        return (
+            [
+                PriceChange(key, row, is_new=True)
+                for key, row in zip(current.keys, current.rows)
+            ]
+            if include_new
+            else []
+        )
+
+    # Align previous columns to the current row order once; missing rows NaN
+    positions = [previous.index.get(key, -1) for key in current.keys]
+    changed_rows = set()
+    masks: Dict[str, List[bool]] = {}
+    aligned: Dict[str, List[float]] = {}
+    for name in current.fields:
+        prev_col = previous.columns.get(name)
+        if prev_col is None:
+            continue
+        old_col = [prev_col[p] if p >= 0 else _NAN for p in positions]
+        mask = _changed_mask(
+            old_col, current.columns[name], min_abs_delta, min_pct_delta
+        )
+        masks[name] = mask
+        aligned[name] = old_col
+        changed_rows.update(i for i, hit in enumerate(mask) if hit)
+    if include_new:
+        # New rows are reported even when they carry no prices at all
+        changed_rows.update(i for i, p in enumerate(positions) if p < 0)
+
+    changes: List[PriceChange] = []
+    for i in sorted(changed_rows):
+        is_new = positions[i] < 0
+        if is_new and not include_new:
+            continue
+        change = PriceChange(current.keys[i], current.rows[i], is_new=is_new)
+        for name, mask in masks.items():
+            if mask[i]:
+                change.deltas[name] = _delta(
+                    name, aligned[name][i], current.columns[name][i]
+                )
+        changes.append(change)
+
+    return changes
+
+
+class PriceChangeDetector:
+    """Tracks the last snapshot per scope and streams changes against it.
+
+    A scope is any hashable label for a price batch, e.g. ``("group", 3)``
+    for ``/pricing/group/3`` or ``"skus:collection-42"`` for a SKU batch.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = DEFAULT_PRICE_FIELDS,
+        min_abs_delta: float = 0.0,
+        min_pct_delta: float = 0.0,
+        include_new: bool = True,
+        yield_every: int = 500,
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            fields: Numeric fields to track
+            min_abs_delta: Minimum absolute change to report
+            min_pct_delta: Minimum percentage change to report
+            include_new: Whether rows with no previous snapshot are reported
+            yield_every: Rows emitted between event loop yields
+        """
+        self.fields = tuple(fields)
+        self.min_abs_delta = min_abs_delta
+        self.min_pct_delta = min_pct_delta
+        self.include_new = include_new
+        self.yield_every = yield_every
+        self._snapshots: Dict[Hashable, PriceSnapshot] = {}
+
+    def get_snapshot(self, scope: Hashable) -> Optional[PriceSnapshot]:
+        """Get the last snapshot recorded for a scope."""
+        return self._snapshots.get(scope)
+
+    def update(self, scope: Hashable, response: Dict[str, Any]) -> List[PriceChange]:
+        """
+        Record a new price batch for a scope and return its changes.
+
+        Args:
+            scope: Label identifying the price batch
+            response: Pricing API response payload
+
+        Returns:
+            Changed rows since the previous batch for this scope
+        """
+        current = PriceSnapshot.from_response(response, self.fields)
+        previous = self._snapshots.get(scope)
+        self._snapshots[scope] = current
+        return diff_snapshots(
+            previous,
+            current,
+            self.min_abs_delta,
+            self.min_pct_delta,
+            self.include_new,
+        )
+
+    async def changes(
+        self, scope: Hashable, response: Dict[str, Any]
+    ) -> AsyncIterator[PriceChange]:
+        """
+        Record a new price batch and stream its changed rows.
+
+        Args:
+            scope: Label identifying the price batch
+            response: Pricing API response payload
+
+        Yields:
+            Changed rows, yielding control to the event loop periodically
+        """
+        changes = self.update(scope, response)
+        if changes:
+            logger.debug(f"{len(changes)} price changes for scope {scope!r}")
+        for i, change in enumerate(changes, start=1):
+            yield change
+            if i % self.yield_every == 0:
+                await asyncio.sleep(0)
+
+    def forget(self, scope: Hashable) -> bool:
+        """Drop the stored snapshot for a scope."""
+        return self._snapshots.pop(scope, None) is not None
@@ -0,0 +1,144 @@
+"""
+Pricing request planner for TCGPlayer Client.
+
+This module chooses the cheapest mix of ``/pricing/group/{groupId}`` and
+batched ``/pricing/product/{ids}`` calls for refreshing prices of a set of
+products, and executes the resulting plan concurrently.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional
+
+from .batching import DEFAULT_ID_BATCH_SIZE, chunked, unique_ids
+
+if TYPE_CHECKING:
+    from .endpoints.pricing import PricingEndpoints
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PricingPlan:
+    """A set of pricing calls covering a target set of products."""
+
+    group_ids: List[int] = field(default_factory=list)
+    product_batches: List[List[int]] = field(default_factory=list)
+    target_ids: List[int] = field(default_factory=list)
+
+    @property
+    def api_calls(self) -> int:
+        """Number of upstream API calls the plan makes."""
+        return len(self.group_ids) + len(self.product_batches)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "group_ids": self.group_ids,
+            "product_batches": self.product_batches,
+            "target_count": len(self.target_ids),
+            "api_calls": self.api_calls,
+        }
+
+
+def plan_price_requests(
+    product_ids: Iterable[int],
+    product_groups: Mapping[int, int],
+    batch_size: int = DEFAULT_ID_BATCH_SIZE,
+) -> PricingPlan:
+    """
+    Plan the minimum number of pricing calls for a set of products.
+
+    A group call prices every product in a set for one request, while ID
+    batches cost one request per ``batch_size`` products from any sets. For a
+    fixed number ``m`` of group calls it is always best to take the ``m``
+    groups holding the most targets, so the optimum is found exactly by
+    evaluating ``m + ceil(remaining / batch_size)`` for every ``m``.
+
+    Args:
+        product_ids: Products whose prices are needed
+        product_groups: productId -> groupId mapping (unknown products are
+            always fetched by ID)
+        batch_size: Product IDs per ``/pricing/product`` call
+
+    Returns:
+        Pricing plan with group calls and product ID batches
+    """
+    targets = unique_ids(product_ids)
+
+    by_group: Dict[int, List[int]] = {}
+    ungrouped: List[int] = []
+    for product_id in targets:
+        group_id = product_groups.get(product_id)
+        if group_id is None:
+            ungrouped.append(product_id)
+        else:
+            by_group.setdefault(int(group_id), []).append(product_id)
+
+    ranked = sorted(by_group.items(), key=lambda item: len(item[1]), reverse=True)
+
+    remaining = len(targets)
+    best_m = 0
+    best_cost = -(-remaining // batch_size)
+    for m, (_, members) in enumerate(ranked, start=1):
+        remaining -= len(members)
+        cost = m + -(-remaining // batch_size)
+        if cost < best_cost:
+            best_m, best_cost = m, cost
+
+    group_ids = [group_id for group_id, _ in ranked[:best_m]]
+    by_id = ungrouped + [pid for _, members in ranked[best_m:] for pid in members]
+
+    plan = PricingPlan(
+        group_ids=group_ids,
+        product_batches=list(chunked(by_id, batch_size)),
+        target_ids=targets,
+    )
+    logger.debug(
+        f"Pricing plan for {len(targets)} products: {len(plan.group_ids)} group "
+        f"calls + {len(plan.product_batches)} ID batches"
+    )
+    return plan
+
+
+async def execute_pricing_plan(
+    pricing: "PricingEndpoints",
+    plan: PricingPlan,
+    max_concurrency: Optional[int] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Execute a pricing plan concurrently and merge the results.
+
+    Args:
+        pricing: Pricing endpoints to call
+        plan: Plan from ``plan_price_requests``
+        max_concurrency: Optional cap on in-flight calls (the client's rate
+            limiter always applies)
+
+    Returns:
+        productId -> list of price rows (one per sub-type, e.g. Normal/Foil),
+        restricted to the plan's target products
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def _run(coro):
+        if semaphore is None:
+            return await coro
+        async with semaphore:
+            return await coro
+
+    calls = [
+        _run(pricing.get_product_prices_by_group(group_id))
+        for group_id in plan.group_ids
+    ] + [_run(pricing.get_market_prices(batch)) for batch in plan.product_batches]
+    responses = await asyncio.gather(*calls)
+
+    wanted = set(plan.target_ids)
+    prices: Dict[int, List[Dict[str, Any]]] = {}
+    for response in responses:
+        for row in response.get("results") or response.get("Results") or []:
+            product_id = row.get("productId")
+            if product_id in wanted:
+                prices.setdefault(product_id, []).append(row)
+    return prices
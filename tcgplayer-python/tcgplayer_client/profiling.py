@@ -0,0 +1,280 @@
+"""
+Sampling profiler for TCGPlayer Client sessions and background jobs.
+
+A background thread samples the event loop thread's Python stack at a fixed
+interval, so CPU time (JSON decoding, validation, cache key hashing) shows up
+as stacks while time the loop spends waiting in its selector is counted as
+``[idle]``. On each tick it also records where every suspended asyncio task
+is awaiting, which attributes wall time to the rate limiter, network reads
+or sleeps. Results are written as collapsed stacks (for flamegraph.pl,
+inferno or speedscope) or as a speedscope JSON file with separate CPU and
+task wait profiles.
+
+Usage::
+
+    with SamplingProfiler() as profiler:
+        await run_sync()
+    profiler.write("sync.speedscope.json")
+
+Or set ``profile_path`` / ``TCGPLAYER_PROFILE_PATH`` to profile a client from
+``authenticate()`` to ``close()``. Only the standard library is used; the
+sampling thread costs roughly one stack walk per interval.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+from typing import Counter as CounterType
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.005  # seconds between samples
+IDLE_FRAME = ("[idle]", "", 0)
+WAIT_FRAME = ("[wait]", "", 0)
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+Stack = Tuple[Frame, ...]
+
+
+def _frame_key(code: CodeType, cache: Dict[CodeType, Frame]) -> Frame:
+    key = cache.get(code)
+    if key is None:
+        name = getattr(code, "co_qualname", code.co_name)
+        key = (name, code.co_filename, code.co_firstlineno)
+        cache[code] = key
+    return key
+
+
+def _frame_label(frame: Frame) -> str:
+    name, filename, line = frame
+    if not filename:
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """Whether the loop thread is blocked in its selector waiting for I/O."""
+    return frame.f_code.co_filename.endswith("selectors.py")
+
+
+class SamplingProfiler:
+    """Samples CPU stacks and asyncio task waits of one event loop thread.
+
+    Create and start it on the event loop thread. CPU samples cover everything
+    that thread runs, so concurrent jobs and requests appear in each other's
+    profiles; task waits cover every task of the loop.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        task_waits: bool = True,
+        max_depth: int = 128,
+    ) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            task_waits: Also sample where suspended asyncio tasks are awaiting
+            max_depth: Deepest stack recorded (outermost frames are dropped)
+        """
+        self.interval = interval
+        self.task_waits = task_waits
+        self.max_depth = max_depth
+        self.cpu: CounterType[Stack] = Counter()
+        self.waits: CounterType[Stack] = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._codes: Dict[CodeType, Frame] = {}
+        self._thread_id: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._started_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is running."""
+        return self._sampler is not None
+
+    def start(self) -> None:
+        """Start sampling the calling thread (and its running event loop)."""
+        if self._sampler is not None:
+            return
+        self._thread_id = threading.get_ident()
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._stopping.clear()
+        self._started_at = time.perf_counter()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="tcgplayer-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling; collected samples are kept."""
+        if self._sampler is None:
+            return
+        self._stopping.set()
+        self._sampler.join()
+        self._sampler = None
+        self.duration += time.perf_counter() - self._started_at
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _sample_loop(self) -> None:
+        while not self._stopping.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:  # never let a bad sample kill the thread
+                logger.debug(f"Profiler sample failed: {e}")
+
+    def _stack(self, frame: Optional[FrameType]) -> List[Frame]:
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            stack.append(_frame_key(frame.f_code, self._codes))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self._thread_id)  # type: ignore[arg-type]
+        if frame is None:
+            return
+        self.samples += 1
+        if _is_idle(frame):
+            self.cpu[(IDLE_FRAME,)] += 1
+        else:
+            self.cpu[tuple(self._stack(frame))] += 1
+        if self.task_waits and self._loop is not None:
+            self._sample_tasks(self._loop)
+
+    def _sample_tasks(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            tasks = asyncio.all_tasks(loop)
+        except RuntimeError:  # task set changed while copying it
+            return
+        running = asyncio.current_task(loop)
+        for task in tasks:
+            if task is running or task.done():
+                continue
+            # Follow the await chain from the task's coroutine down to the
+            # innermost suspended one (task.get_stack() stops at the first)
+            stack = [WAIT_FRAME]
+            coro: Any = task.get_coro()
+            while coro is not None and len(stack) <= self.max_depth:
+                frame = getattr(coro, "cr_frame", None) or getattr(
+                    coro, "gi_frame", None
+                )
+                if frame is None:
+                    break
+                stack.append(_frame_key(frame.f_code, self._codes))
+                coro = getattr(coro, "cr_await", None) or getattr(
+                    coro, "gi_yieldfrom", None
+                )
+            if len(stack) > 1:
+                self.waits[tuple(stack)] += 1
+
+    def collapsed(self, waits: bool = True) -> str:
+        """
+        Render samples in collapsed stack format ("a;b;c count" per line).
+
+        Args:
+            waits: Include task wait stacks (rooted at ``[wait]``)
+
+        Returns:
+            Collapsed stacks, heaviest first
+        """
+        counts = self.cpu + self.waits if waits else self.cpu
+        return "".join(
+            f"{';'.join(_frame_label(f) for f in stack)} {count}\n"
+            for stack, count in counts.most_common()
+        )
+
+    def to_speedscope(self, name: str = "tcgplayer_client") -> Dict[str, Any]:
+        """Render samples as a speedscope file with CPU and task wait profiles."""
+        frames: List[Dict[str, Any]] = []
+        index: Dict[Frame, int] = {}
+
+        def profile(title: str, counts: CounterType[Stack]) -> Dict[str, Any]:
+            samples = []
+            weights = []
+            for stack, count in counts.most_common():
+                ids = []
+                for frame in stack:
+                    if frame not in index:
+                        index[frame] = len(frames)
+                        entry: Dict[str, Any] = {"name": frame[0]}
+                        if frame[1]:
+                            entry.update(file=frame[1], line=frame[2])
+                        frames.append(entry)
+                    ids.append(index[frame])
+                samples.append(ids)
+                weights.append(round(count * self.interval, 6))
+            return {
+                "type": "sampled",
+                "name": title,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 6),
+                "samples": samples,
+                "weights": weights,
+            }
+
+        profiles = [profile("cpu", self.cpu)]
+        if self.waits:
+            profiles.append(profile("task waits", self.waits))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "tcgplayer_client",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def write(self, path: Union[str, Path]) -> None:
+        """
+        Write the profile; ``.json`` files get speedscope format, any other
+        extension collapsed stacks.
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        if path.suffix == ".json":
+            content = json.dumps(self.to_speedscope(path.stem))
+        else:
+            content = self.collapsed()
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+        logger.info(f"Wrote profile of {self.samples} samples to {path}")
+
+    def summary(self) -> Dict[str, Any]:
+        """Get sample counts and the share of time the loop was idle."""
+        idle = self.cpu.get((IDLE_FRAME,), 0)
+        return {
+            "samples": self.samples,
+            "duration_seconds": round(self.duration, 6),
+            "idle_fraction": round(idle / self.samples, 4) if self.samples else 0.0,
+            "wait_samples": sum(self.waits.values()),
+        }
@@ -6,7 +6,9 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Deque
+from typing import Deque, Optional
+
+from .logging_config import RATE_LIMIT_GRANT_EVENT, RATE_LIMIT_WAIT_EVENT
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,8 @@ class RateLimiter:
         self.time_window = time_window
         self.requests: Deque[float] = deque()
         self.lock = asyncio.Lock()
+        # Callers currently inside acquire(), i.e. queued for a slot
+        self.waiting = 0
 
         logger.info(
             f"Rate limiter configured: {max_requests} requests per {time_window} "
@@ -55,30 +59,78 @@ class RateLimiter:
 
         This method will block until a request slot is available.
         """
-        async with self.lock:
-            now = time.time()
-
-            # Remove expired requests
-            while self.requests and self.requests[0] <= now - self.time_window:
-                self.requests.popleft()
-
-            # If at rate limit, wait until we can make another request
-            if len(self.requests) >= self.max_requests:
-                wait_time = self.requests[0] - (now - self.time_window)
-                if wait_time > 0:
-                    logger.info(
-                        f"Rate limit reached. Waiting {wait_time:.2f} seconds..."
-                    )
-                    await asyncio.sleep(wait_time)
-                    now = time.time()
-
-            # Record this request
-            self.requests.append(now)
-            logger.debug(
-                f"Request allowed. Current rate: "
-                f"{len(self.requests)}/{self.max_requests} "
-                f"per {self.time_window}s"
-            )
+        self.waiting += 1
+        try:
+            async with self.lock:
+                now = time.time()
+
+                # Remove expired requests
+                while self.requests and self.requests[0] <= now - self.time_window:
+                    self.requests.popleft()
+
+                # If at rate limit, wait until we can make another request
+                if len(self.requests) >= self.max_requests:
+                    wait_time = self.requests[0] - (now - self.time_window)
+                    if wait_time > 0:
+                        logger.info(
+                            "Rate limit reached. Waiting %.2f seconds...",
+                            wait_time,
+                            extra=RATE_LIMIT_WAIT_EVENT,
+                        )
+                        await asyncio.sleep(wait_time)
+                        now = time.time()
+
+                # Record this request
+                self.requests.append(now)
+                logger.debug(
+                    "Request allowed. Current rate: %d/%d per %ss",
+                    len(self.requests),
+                    self.max_requests,
+                    self.time_window,
+                    extra=RATE_LIMIT_GRANT_EVENT,
+                )
+        finally:
+            self.waiting -= 1
+
+    def estimate_wait(self, queued: Optional[int] = None) -> float:
+        """
+        Estimate how long a new request would wait for a slot.
+
+        Requests already queued take the next free slots in order; a slot
+        frees when the request that used it leaves the sliding window.
+
+        Args:
+            queued: Requests ahead of the new one (default: current waiters)
+
+        Returns:
+            Expected wait in seconds (0 if a slot is free now)
+        """
+        ahead = self.waiting if queued is None else queued
+        now = time.time()
+        window = [t for t in self.requests if t > now - self.time_window]
+        free = self.max_requests - len(window)
+        if ahead < free:
+            return 0.0
+        # Slot k (0-based, after the free ones) reuses window[k % max] one or
+        # more windows later; slots past the window's end are the free ones,
+        # taken now by the requests ahead and released a window from now
+        k = ahead - max(free, 0)
+        cycles, index = divmod(k, self.max_requests)
+        if index < len(window):
+            release = window[index] + self.time_window * (cycles + 1)
+        else:
+            release = now + self.time_window * (cycles + 1)
+        return max(0.0, release - now)
+
+    def window_count(self) -> int:
+        """
+        Get the number of requests in the current window without locking.
+
+        Returns:
+            Requests recorded within the last ``time_window`` seconds
+        """
+        cutoff = time.time() - self.time_window
+        return sum(1 for t in self.requests if t > cutoff)
 
     def get_status(self) -> dict:
         """
@@ -99,6 +151,8 @@ class RateLimiter:
                     "max_requests_per_window": max_requests,
                     "time_window_seconds": time_window,
                     "remaining_requests": max(0, max_requests - current_requests),
+                    "queued_requests": self.waiting,
+                    "estimated_wait_seconds": self.estimate_wait(),
                     "rate_limit_reset_in_seconds": (
                         time_window if current_requests >= max_requests else 0
                     ),
@@ -141,6 +195,8 @@ class RateLimiter:
                 "max_requests_per_window": max_requests,
                 "time_window_seconds": time_window,
                 "remaining_requests": max(0, max_requests - current_requests),
+                "queued_requests": self.waiting,
+                "estimated_wait_seconds": self.estimate_wait(),
                 "rate_limit_reset_in_seconds": (
                     time_window if current_requests >= max_requests else 0
                 ),
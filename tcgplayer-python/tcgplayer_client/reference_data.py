@@ -0,0 +1,289 @@
+"""
+Reference data registry for TCGPlayer Client.
+
+This module provides a registry that loads rarely-changing catalog reference
+data (categories, conditions, languages, rarities, printings) once and keeps
+it as frozen id <-> name lookup tables with synchronous accessors.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .endpoints.catalog import CatalogEndpoints
+
+logger = logging.getLogger(__name__)
+
+# Default refresh interval for reference data (24 hours)
+DEFAULT_REFRESH_INTERVAL = 24 * 60 * 60
+
+# kind -> (id field, name fields in order of preference)
+REFERENCE_FIELDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "categories": ("categoryId", ("name", "displayName")),
+    "conditions": ("conditionId", ("name", "abbreviation")),
+    "languages": ("languageId", ("name", "abbr")),
+    "rarities": ("rarityId", ("displayText", "dbValue")),
+    "printings": ("printingId", ("name",)),
+}
+
+
+class LookupTable:
+    """Immutable id <-> name lookup table.
+
+    Names are interned and exposed through read-only mapping proxies; name
+    lookups are case-insensitive and also match secondary names such as
+    abbreviations.
+    """
+
+    __slots__ = ("kind", "by_id", "by_name")
+
+    def __init__(self, kind: str, response: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Build a lookup table from a catalog response.
+
+        Args:
+            kind: Reference data kind (a key of ``REFERENCE_FIELDS``)
+            response: Catalog API response payload
+        """
+        id_field, name_fields = REFERENCE_FIELDS[kind]
+        by_id: Dict[int, str] = {}
+        by_name: Dict[str, int] = {}
+
+        results = (response or {}).get("results") or (response or {}).get("Results")
+        for item in results or []:
+            item_id = item.get(id_field)
+            names = [str(item[f]).strip() for f in name_fields if item.get(f)]
+            if item_id is None or not names:
+                continue
+            item_id = int(item_id)
+            by_id[item_id] = sys.intern(names[0])
+            for name in names:
+                by_name.setdefault(sys.intern(name.lower()), item_id)
+
+        self.kind = kind
+        self.by_id: Mapping[int, str] = MappingProxyType(by_id)
+        self.by_name: Mapping[str, int] = MappingProxyType(by_name)
+
+    def name(self, item_id: int) -> Optional[str]:
+        """Get the name for an ID."""
+        return self.by_id.get(item_id)
+
+    def id(self, name: str) -> Optional[int]:
+        """Get the ID for a name (case-insensitive)."""
+        return self.by_name.get(name.strip().lower())
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.by_id
+
+
+class ReferenceData:
+    """Registry of preloaded catalog reference data.
+
+    Global tables (categories, conditions, languages, rarities) are loaded
+    together by ``load()``, typically at service startup. Per-category
+    printings and rarities are loaded lazily by ``ensure_category()``. All
+    lookup methods are synchronous dict reads and never touch the event loop.
+    """
+
+    GLOBAL_KINDS = ("categories", "conditions", "languages", "rarities")
+
+    def __init__(
+        self,
+        catalog: "CatalogEndpoints",
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            catalog: Catalog endpoints used to load reference data
+            refresh_interval: Seconds before loaded tables are refreshed
+        """
+        self.catalog = catalog
+        self.refresh_interval = refresh_interval
+        self._tables: Dict[str, LookupTable] = {
+            kind: LookupTable(kind) for kind in self.GLOBAL_KINDS
+        }
+        self._category_tables: Dict[Tuple[int, str], LookupTable] = {}
+        self._category_loaded_at: Dict[int, float] = {}
+        self._category_locks: Dict[int, asyncio.Lock] = {}
+        self._loaded_at: Optional[float] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the global tables have been loaded."""
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        """Whether the global tables are older than the refresh interval."""
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.refresh_interval
+        )
+
+    async def load(self) -> None:
+        """Load (or reload) all global reference tables concurrently."""
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            responses = await asyncio.gather(
+                self.catalog.get_categories(),
+                self.catalog.get_condition_names(),
+                self.catalog.get_language_names(),
+                self.catalog.get_rarities(),
+            )
+            # Swap whole tables so readers never see a partial update
+            self._tables = {
+                kind: LookupTable(kind, response)
+                for kind, response in zip(self.GLOBAL_KINDS, responses)
+            }
+            self._loaded_at = time.monotonic()
+
+        logger.info(
+            "Reference data loaded: "
+            + ", ".join(f"{len(t)} {kind}" for kind, t in self._tables.items())
+        )
+
+    async def ensure_loaded(self) -> None:
+        """Load global tables if they are missing or stale."""
+        if self.is_stale():
+            await self.load()
+
+    async def ensure_category(self, category_id: int) -> None:
+        """
+        Load per-category printings and rarities if missing or stale.
+
+        Args:
+            category_id: Category whose reference data is needed
+        """
+        loaded_at = self._category_loaded_at.get(category_id)
+        if loaded_at is not None and (
+            time.monotonic() - loaded_at <= self.refresh_interval
+        ):
+            return
+
+        lock = self._category_locks.setdefault(category_id, asyncio.Lock())
+        async with lock:
+            # Another task may have loaded it while we waited
+            loaded_at = self._category_loaded_at.get(category_id)
+            if loaded_at is not None and (
+                time.monotonic() - loaded_at <= self.refresh_interval
+            ):
+                return
+
+            printings, rarities = await asyncio.gather(
+                self.catalog.get_category_printings(category_id),
+                self.catalog.get_category_rarities(category_id),
+            )
+            self._category_tables[(category_id, "printings")] = LookupTable(
+                "printings", printings
+            )
+            self._category_tables[(category_id, "rarities")] = LookupTable(
+                "rarities", rarities
+            )
+            self._category_loaded_at[category_id] = time.monotonic()
+
+    def start_refresh_task(self) -> None:
+        """Start a background task that refreshes stale tables."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def refresh_loop():
+            while True:
+                await asyncio.sleep(self.refresh_interval)
+                try:
+                    await self.load()
+                    # Drop category tables so they reload lazily on next use
+                    self._category_loaded_at.clear()
+                except Exception as e:
+                    logger.warning(f"Reference data refresh failed: {e}")
+
+        self._refresh_task = asyncio.create_task(refresh_loop())
+
+    def stop_refresh_task(self) -> None:
+        """Stop the background refresh task."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+    def table(self, kind: str, category_id: Optional[int] = None) -> LookupTable:
+        """
+        Get a lookup table.
+
+        Args:
+            kind: Reference data kind
+            category_id: Category for per-category tables (printings, and
+                rarities when a category-specific table has been loaded)
+
+        Returns:
+            Lookup table (empty if not loaded)
+        """
+        if category_id is not None:
+            table = self._category_tables.get((category_id, kind))
+            if table is not None:
+                return table
+        return self._tables.get(kind) or LookupTable(kind)
+
+    def category_name(self, category_id: int) -> Optional[str]:
+        """Get a category name by ID."""
+        return self._tables["categories"].name(category_id)
+
+    def category_id(self, name: str) -> Optional[int]:
+        """Get a category ID by name."""
+        return self._tables["categories"].id(name)
+
+    def condition_name(self, condition_id: int) -> Optional[str]:
+        """Get a condition name by ID."""
+        return self._tables["conditions"].name(condition_id)
+
+    def condition_id(self, name: str) -> Optional[int]:
+        """Get a condition ID by name or abbreviation."""
+        return self._tables["conditions"].id(name)
+
+    def language_name(self, language_id: int) -> Optional[str]:
+        """Get a language name by ID."""
+        return self._tables["languages"].name(language_id)
+
+    def language_id(self, name: str) -> Optional[int]:
+        """Get a language ID by name or abbreviation."""
+        return self._tables["languages"].id(name)
+
+    def rarity_name(
+        self, rarity_id: int, category_id: Optional[int] = None
+    ) -> Optional[str]:
+        """Get a rarity name by ID."""
+        return self.table("rarities", category_id).name(rarity_id)
+
+    def rarity_id(self, name: str, category_id: Optional[int] = None) -> Optional[int]:
+        """Get a rarity ID by name."""
+        return self.table("rarities", category_id).id(name)
+
+    def printing_name(self, category_id: int, printing_id: int) -> Optional[str]:
+        """Get a printing name by ID for a loaded category."""
+        return self.table("printings", category_id).name(printing_id)
+
+    def printing_id(self, category_id: int, name: str) -> Optional[int]:
+        """Get a printing ID by name for a loaded category."""
+        return self.table("printings", category_id).id(name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            "loaded": self.is_loaded,
+            "age_seconds": (
+                time.monotonic() - self._loaded_at if self._loaded_at else None
+            ),
+            "refresh_interval": self.refresh_interval,
+            "tables": {kind: len(t) for kind, t in self._tables.items()},
+            "categories_loaded": sorted(self._category_loaded_at),
+        }
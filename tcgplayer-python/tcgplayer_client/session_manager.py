@@ -8,13 +8,38 @@ timeout configuration, and automatic cleanup.
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, List, Optional
 
 import aiohttp
 
+from .tracing import RequestTiming, TimingSink, create_trace_config, finish_timing
+
 logger = logging.getLogger(__name__)
 
 
+class Transport:
+    """Provides the session requests are sent through.
+
+    The default (no transport) is a pooled aiohttp session. A transport can
+    wrap that session (e.g. to record responses) or replace it entirely with
+    any object offering aiohttp-style ``get``/``post``/``put`` context
+    managers and a ``closed`` attribute (see ``cassette.py``).
+    """
+
+    async def open(self, manager: "SessionManager") -> Any:
+        """
+        Get the session to send a request through.
+
+        Args:
+            manager: Session manager (``get_http_session()`` gives the real
+                aiohttp session)
+
+        Returns:
+            Session-like object
+        """
+        raise NotImplementedError
+
+
 class SessionManager:
     """Manages HTTP sessions with connection pooling and automatic cleanup."""
 
@@ -55,6 +80,8 @@ class SessionManager:
         self._connector = connector  # Use provided connector if available
         self._session: Optional[aiohttp.ClientSession] = None
         self._lock = asyncio.Lock()
+        self._timing_sinks: List[TimingSink] = []
+        self.transport: Optional[Transport] = None
 
         logger.info(
             f"Session manager initialized with max_connections={max_connections}, "
@@ -84,7 +111,68 @@ class SessionManager:
 
         return self._connector
 
-    async def get_session(self) -> aiohttp.ClientSession:
+    def add_timing_sink(self, sink: TimingSink) -> None:
+        """
+        Send per-request phase timings to a sink.
+
+        Tracing is only installed when a session is created, so sinks must be
+        added before the first request (or the session is recreated).
+
+        Args:
+            sink: Callable receiving each finished ``RequestTiming``
+        """
+        self._timing_sinks.append(sink)
+
+    @property
+    def tracing_enabled(self) -> bool:
+        """Whether requests are timed."""
+        return bool(self._timing_sinks)
+
+    def start_timing(self, method: str, path: str) -> Optional[RequestTiming]:
+        """
+        Start timing a request, if tracing is enabled.
+
+        Pass the result as ``trace_request_ctx`` to the session request.
+
+        Args:
+            method: HTTP method
+            path: Path to report (e.g. an endpoint template)
+
+        Returns:
+            Timing to fill in, or None when tracing is disabled
+        """
+        if not self._timing_sinks:
+            return None
+        return RequestTiming(method=method, path=path)
+
+    def finish_timing(self, timing: Optional[RequestTiming]) -> None:
+        """
+        Finish a request's timing and send it to the sinks.
+
+        Args:
+            timing: Timing from ``start_timing`` (None is ignored)
+        """
+        if timing is None:
+            return
+        finish_timing(timing)
+        for sink in self._timing_sinks:
+            try:
+                sink(timing)
+            except Exception as e:
+                logger.warning(f"Timing sink failed: {e}")
+
+    async def get_session(self) -> Any:
+        """
+        Get the session to send requests through.
+
+        Returns:
+            The transport's session if one is set, else the HTTP client session
+        """
+        if self.transport is not None:
+            return await self.transport.open(self)
+        return await self.get_http_session()
+
+    async def get_http_session(self) -> aiohttp.ClientSession:
         """
         Get or create an HTTP session.
 
@@ -102,6 +190,9 @@ class SessionManager:
                             "Accept": "application/json",
                             "Accept-Encoding": "gzip, deflate",
                         },
+                        trace_configs=(
+                            [create_trace_config()] if self._timing_sinks else None
+                        ),
                     )
                     logger.debug("Created new HTTP session")
 
@@ -0,0 +1,298 @@
+"""
+SKU resolution index for TCGPlayer Client.
+
+This module provides a compact (product, condition, printing, language) ->
+skuId index built from catalog SKU data, so pricing a specific copy does not
+require fetching and scanning a product's SKU list every time.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .batching import DEFAULT_ID_BATCH_SIZE, chunked, unique_ids
+from .exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from .endpoints.catalog import CatalogEndpoints
+
+logger = logging.getLogger(__name__)
+
+# Bit layout of a packed SKU key (high to low):
+# productId (31 bits) | conditionId (8) | printingId (16) | languageId (8)
+_CONDITION_BITS = 8
+_PRINTING_BITS = 16
+_LANGUAGE_BITS = 8
+_PRINTING_SHIFT = _LANGUAGE_BITS
+_CONDITION_SHIFT = _PRINTING_SHIFT + _PRINTING_BITS
+_PRODUCT_SHIFT = _CONDITION_SHIFT + _CONDITION_BITS
+_MAX_PRODUCT_ID = (1 << (63 - _PRODUCT_SHIFT)) - 1
+
+SKUSpec = Tuple[int, Union[int, str], Union[int, str], Union[int, str]]
+
+
+def pack_sku_key(
+    product_id: int, condition_id: int, printing_id: int, language_id: int
+) -> int:
+    """
+    Pack SKU attributes into a single 63-bit integer key.
+
+    Args:
+        product_id: Product ID
+        condition_id: Condition ID
+        printing_id: Printing ID
+        language_id: Language ID
+
+    Returns:
+        Packed integer key
+
+    Raises:
+        ValidationError: If an attribute does not fit its bit field
+    """
+    if not 0 <= product_id <= _MAX_PRODUCT_ID:
+        raise ValidationError(f"product_id out of range for SKU key: {product_id}")
+    if not 0 <= condition_id < (1 << _CONDITION_BITS):
+        raise ValidationError(f"condition_id out of range for SKU key: {condition_id}")
+    if not 0 <= printing_id < (1 << _PRINTING_BITS):
+        raise ValidationError(f"printing_id out of range for SKU key: {printing_id}")
+    if not 0 <= language_id < (1 << _LANGUAGE_BITS):
+        raise ValidationError(f"language_id out of range for SKU key: {language_id}")
+    return (
+        (product_id << _PRODUCT_SHIFT)
+        | (condition_id << _CONDITION_SHIFT)
+        | (printing_id << _PRINTING_SHIFT)
+        | language_id
+    )
+
+
+def _name_table(response: Dict[str, Any], id_field: str) -> Dict[str, int]:
+    """Build a case-insensitive name/abbreviation -> ID table from a response."""
+    table: Dict[str, int] = {}
+    for item in response.get("results") or response.get("Results") or []:
+        item_id = item.get(id_field)
+        if item_id is None:
+            continue
+        for field in ("name", "abbreviation", "abbr"):
+            value = item.get(field)
+            if value:
+                table[str(value).strip().lower()] = int(item_id)
+    return table
+
+
+class SKUIndex:
+    """Compact SKU resolution index.
+
+    Each (product, condition, printing, language) combination is packed into
+    a single 63-bit integer, so the index is one flat ``int -> int`` hash
+    table instead of a dict of tuples or per-product SKU lists. Lookups are a
+    single dict probe, and batch resolution packs keys inline so a whole
+    collection resolves without per-card API calls or list scans.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty SKU index."""
+        self._skus: Dict[int, int] = {}
+        self.condition_ids: Dict[str, int] = {}
+        self.language_ids: Dict[str, int] = {}
+        self.printing_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._skus)
+
+    def set_condition_names(self, response: Dict[str, Any]) -> None:
+        """Load condition name -> ID mappings from ``get_condition_names``."""
+        self.condition_ids = _name_table(response, "conditionId")
+
+    def set_language_names(self, response: Dict[str, Any]) -> None:
+        """Load language name -> ID mappings from ``get_language_names``."""
+        self.language_ids = _name_table(response, "languageId")
+
+    def set_printing_names(self, response: Dict[str, Any]) -> None:
+        """Load printing name -> ID mappings from a printings response."""
+        self.printing_ids = _name_table(response, "printingId")
+
+    def add_skus(self, skus: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add SKU records from a ``get_skus`` response.
+
+        Args:
+            skus: SKU dicts with skuId, productId, conditionId, printingId and
+                languageId fields
+
+        Returns:
+            Number of SKUs added
+        """
+        added = 0
+        for sku in skus:
+            try:
+                key = pack_sku_key(
+                    int(sku["productId"]),
+                    int(sku.get("conditionId") or 0),
+                    int(sku.get("printingId") or 0),
+                    int(sku.get("languageId") or 0),
+                )
+                self._skus[key] = int(sku["skuId"])
+            except (KeyError, TypeError, ValueError, ValidationError) as e:
+                logger.debug(f"Skipping unindexable SKU {sku!r}: {e}")
+                continue
+            added += 1
+        return added
+
+    def _lookup_id(self, value: Union[int, str], table: Dict[str, int]) -> int:
+        """Translate a name to its ID using a name table; IDs pass through."""
+        if isinstance(value, int):
+            return value
+        key = str(value).strip().lower()
+        if key.isdigit():
+            return int(key)
+        try:
+            return table[key]
+        except KeyError:
+            raise ValidationError(f"Unknown name: {value!r}")
+
+    def key_for(
+        self,
+        product_id: int,
+        condition: Union[int, str],
+        printing: Union[int, str],
+        language: Union[int, str],
+    ) -> int:
+        """
+        Build the packed key for a SKU specification.
+
+        Conditions, printings and languages may be given as IDs or as names
+        (e.g. ``"Near Mint"``, ``"Foil"``, ``"English"``).
+        """
+        return pack_sku_key(
+            int(product_id),
+            self._lookup_id(condition, self.condition_ids),
+            self._lookup_id(printing, self.printing_ids),
+            self._lookup_id(language, self.language_ids),
+        )
+
+    def resolve(
+        self,
+        product_id: int,
+        condition: Union[int, str],
+        printing: Union[int, str],
+        language: Union[int, str] = 1,
+    ) -> Optional[int]:
+        """
+        Resolve a single copy specification to its SKU ID.
+
+        Args:
+            product_id: Product ID
+            condition: Condition ID or name
+            printing: Printing ID or name
+            language: Language ID or name (default: 1, English)
+
+        Returns:
+            SKU ID, or None if the combination is not indexed
+        """
+        return self._skus.get(self.key_for(product_id, condition, printing, language))
+
+    def resolve_many(self, specs: Iterable[SKUSpec]) -> List[Optional[int]]:
+        """
+        Resolve many copy specifications at once, e.g. a whole collection.
+
+        Unlike ``resolve``, an unknown condition, printing or language name
+        does not raise: that copy resolves to None like any other unindexed
+        combination, so one bad row does not fail a whole collection.
+
+        Args:
+            specs: (product_id, condition, printing, language) tuples
+
+        Returns:
+            SKU IDs (or None for unknown combinations or names) in input order
+        """
+        get = self._skus.get
+        lookup = self._lookup_id
+        conditions = self.condition_ids
+        printings = self.printing_ids
+        languages = self.language_ids
+
+        results: List[Optional[int]] = []
+        append = results.append
+        for product_id, condition, printing, language in specs:
+            # Inline packing: this loop is the hot path for collection pricing
+            try:
+                if type(condition) is not int:
+                    condition = lookup(condition, conditions)
+                if type(printing) is not int:
+                    printing = lookup(printing, printings)
+                if type(language) is not int:
+                    language = lookup(language, languages)
+            except ValidationError:
+                append(None)
+                continue
+            if (
+                product_id < 0
+                or product_id > _MAX_PRODUCT_ID
+                or (condition | language) >> 8
+                or printing >> 16
+            ):
+                append(None)
+                continue
+            key = (
+                (product_id << _PRODUCT_SHIFT)
+                | (condition << _CONDITION_SHIFT)
+                | (printing << _PRINTING_SHIFT)
+                | language
+            )
+            append(get(key))
+        return results
+
+    async def load_from_catalog(
+        self,
+        catalog: "CatalogEndpoints",
+        product_ids: Iterable[int],
+        batch_size: int = DEFAULT_ID_BATCH_SIZE,
+        category_id: Optional[int] = None,
+    ) -> int:
+        """
+        Populate the index from the catalog API.
+
+        Fetches condition and language names (and, for a category, printing
+        names) plus SKUs for all products, with SKU requests batched into
+        comma-joined ID lists and issued concurrently under the client's rate
+        limiter.
+
+        Args:
+            catalog: Catalog endpoints to fetch from
+            product_ids: Products whose SKUs should be indexed
+            batch_size: Product IDs per ``get_skus`` request
+            category_id: Category whose printing names should be loaded
+                (printings are defined per category; None leaves them as-is)
+
+        Returns:
+            Number of SKUs added
+        """
+        batches = list(chunked(unique_ids(product_ids), batch_size))
+        names = [catalog.get_condition_names(), catalog.get_language_names()]
+        if category_id is not None:
+            names.append(catalog.get_category_printings(category_id))
+        responses = await asyncio.gather(
+            *names, *(catalog.get_skus(batch) for batch in batches)
+        )
+        self.set_condition_names(responses[0])
+        self.set_language_names(responses[1])
+        if category_id is not None:
+            self.set_printing_names(responses[2])
+        sku_responses = responses[len(names) :]
+
+        added = 0
+        for response in sku_responses:
+            added += self.add_skus(
+                response.get("results") or response.get("Results") or []
+            )
+        logger.info(f"SKU index loaded {added} SKUs for {len(batches)} batches")
+        return added
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "entries": len(self._skus),
+            "conditions": len(self.condition_ids),
+            "languages": len(self.language_ids),
+            "printings": len(self.printing_ids),
+        }
@@ -0,0 +1,242 @@
+"""
+Connection-level request timing for TCGPlayer Client.
+
+This module wires an ``aiohttp.TraceConfig`` into the client session so each
+upstream request is broken into phases: waiting for a pooled connection, DNS,
+connecting (TCP and TLS handshake, which aiohttp reports together), time to
+first byte, and body download, plus whether the connection was new or
+reused. Finished timings are passed to pluggable sinks. Without sinks no
+trace config is installed, so tracing costs nothing when disabled.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from .metrics import ClientMetrics
+
+PHASES = ("queued", "dns", "connect", "ttfb", "download", "total")
+
+
+@dataclass
+class RequestTiming:
+    """Phase timings of one upstream request, in seconds.
+
+    Phases that did not happen (e.g. DNS on a reused connection) are None.
+    """
+
+    method: str = ""
+    path: str = ""
+    status: Optional[int] = None
+    error: Optional[str] = None
+    reused: Optional[bool] = None
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    total: Optional[float] = None
+    # Raw event times (event loop clock) while the request is running
+    _start: float = 0.0
+    _ready: Optional[float] = None
+    _headers: Optional[float] = None
+
+    def phases(self) -> Dict[str, float]:
+        """Get the phases that were measured."""
+        return {
+            phase: value
+            for phase in PHASES
+            if (value := getattr(self, phase)) is not None
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging or serialization."""
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "error": self.error,
+            "reused": self.reused,
+            **{phase: getattr(self, phase) for phase in PHASES},
+        }
+
+
+TimingSink = Callable[[RequestTiming], None]
+
+
+def _now() -> float:
+    return asyncio.get_running_loop().time()
+
+
+def _timing(ctx: SimpleNamespace) -> Optional[RequestTiming]:
+    """The RequestTiming a traced request carries, if any."""
+    timing = getattr(ctx, "trace_request_ctx", None)
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_request_start(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing._start = _now()
+        timing.method = timing.method or params.method
+        timing.path = timing.path or params.url.path
+
+
+async def _on_queued_start(session, ctx, params) -> None:
+    ctx.queued_at = _now()
+
+
+async def _on_queued_end(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing.queued = _now() - ctx.queued_at
+
+
+async def _on_create_start(session, ctx, params) -> None:
+    ctx.create_at = _now()
+
+
+async def _on_create_end(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing._ready = _now()
+        timing.reused = False
+        # DNS resolution happens inside connection creation
+        timing.connect = timing._ready - ctx.create_at - (timing.dns or 0.0)
+
+
+async def _on_reuseconn(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing._ready = _now()
+        timing.reused = True
+
+
+async def _on_dns_start(session, ctx, params) -> None:
+    ctx.dns_at = _now()
+
+
+async def _on_dns_end(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing.dns = _now() - ctx.dns_at
+
+
+async def _on_request_end(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing._headers = _now()
+        timing.status = params.response.status
+        timing.ttfb = timing._headers - (timing._ready or timing._start)
+
+
+async def _on_request_exception(session, ctx, params) -> None:
+    timing = _timing(ctx)
+    if timing is not None:
+        timing.error = type(params.exception).__name__
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Create a trace config that fills in each request's ``RequestTiming``.
+
+    Requests opt in by passing a ``RequestTiming`` as ``trace_request_ctx``;
+    others are ignored.
+
+    Returns:
+        Trace config to pass to ``aiohttp.ClientSession(trace_configs=...)``
+    """
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_queued_start.append(_on_queued_start)
+    config.on_connection_queued_end.append(_on_queued_end)
+    config.on_connection_create_start.append(_on_create_start)
+    config.on_connection_create_end.append(_on_create_end)
+    config.on_connection_reuseconn.append(_on_reuseconn)
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_request_end.append(_on_request_end)
+    config.on_request_exception.append(_on_request_exception)
+    return config
+
+
+def finish_timing(timing: RequestTiming) -> RequestTiming:
+    """Close a timing once its response body has been read (or failed)."""
+    end = _now()
+    if timing._headers is not None:
+        timing.download = end - timing._headers
+    timing.total = end - timing._start if timing._start else None
+    return timing
+
+
+class TimingRecorder:
+    """Sink that keeps recent timings and summarizes them by phase."""
+
+    def __init__(self, max_records: int = 1000) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            max_records: Most recent timings to keep
+        """
+        self.records: Deque[RequestTiming] = deque(maxlen=max_records)
+
+    def __call__(self, timing: RequestTiming) -> None:
+        self.records.append(timing)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded timings.
+
+        Returns:
+            Request count, connection reuse ratio, and per-phase count, mean
+            and p95 in milliseconds
+        """
+        records = list(self.records)
+        phases: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+        for timing in records:
+            for phase, value in timing.phases().items():
+                phases[phase].append(value)
+        connected = [t.reused for t in records if t.reused is not None]
+
+        def describe(values: List[float]) -> Dict[str, Any]:
+            ordered = sorted(values)
+            return {
+                "count": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 3),
+            }
+
+        return {
+            "requests": len(records),
+            "reuse_ratio": (
+                round(sum(connected) / len(connected), 4) if connected else None
+            ),
+            "phases": {
+                phase: describe(values) for phase, values in phases.items() if values
+            },
+        }
+
+
+class MetricsTimingSink:
+    """Sink that records phase timings into ``ClientMetrics``."""
+
+    def __init__(self, metrics: "ClientMetrics") -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            metrics: Client metrics to record into
+        """
+        self.metrics = metrics
+
+    def __call__(self, timing: RequestTiming) -> None:
+        for phase, value in timing.phases().items():
+            self.metrics.phase_duration.observe(value, phase=phase)
+        if timing.reused is not None:
+            self.metrics.connections.inc(kind="reused" if timing.reused else "new")
@@ -0,0 +1,209 @@
+"""
+Unit tests for the offline benchmark harness.
+"""
+
+import tracemalloc
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from benchmarks.faults import run_fault_benchmarks
+from benchmarks.limiter import hammer, max_in_window
+from benchmarks.run import compare, percentile, run_benchmarks
+from benchmarks.soak import evaluate, growth_sites, run_soak
+from tcgplayer_client.fair_queue import FairRateLimiter
+from tcgplayer_client.rate_limiter import RateLimiter
+
+
+class TestPercentile:
+    """Test cases for nearest-rank percentiles."""
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles of a known series."""
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+
+class TestFakeServer:
+    """Test cases for the fake TCGPlayer API."""
+
+    def test_peak_window_requests(self):
+        """Test the busiest-window count used for rate compliance."""
+        server = FakeTCGPlayer(FakeServerConfig(products_per_group=1))
+        server.request_log = [(t, "/x", 200) for t in (0.0, 0.5, 0.9, 1.2, 3.0)]
+
+        assert server.peak_window_requests(1.0) == 3
+
+
+class TestRunBenchmarks:
+    """Test cases for running scenarios end to end."""
+
+    @pytest.mark.asyncio
+    async def test_catalog_walk_report(self):
+        """Test that a scenario reports operations, calls and latency."""
+        config = FakeServerConfig(
+            latency_ms=0,
+            latency_jitter_ms=0,
+            groups_per_category=2,
+            products_per_group=150,
+        )
+
+        report = await run_benchmarks(["catalog_walk"], config, scale=0.5)
+
+        result = report["scenarios"]["catalog_walk"]
+        assert result["operations"] == 1
+        # One groups listing plus two pages of products
+        assert result["api_calls"] == 3
+        assert result["calls_by_endpoint"] == {
+            "/catalog/groups": 1,
+            "/catalog/products": 2,
+        }
+        assert result["errors"] == {}
+        assert result["latency_ms"]["p50"] > 0
+        assert result["peak_window_requests"] <= 10
+
+    def test_compare_flags_regressions(self):
+        """Test that comparing reports labels changes better or worse."""
+        baseline = {"scenarios": {"walk": {"achieved_rps": 10.0}}}
+        report = {"scenarios": {"walk": {"achieved_rps": 8.0}}}
+
+        lines = compare(report, baseline)
+
+        assert len(lines) == 1
+        assert "achieved_rps" in lines[0] and "worse" in lines[0]
+
+
+class TestFaultBenchmarks:
+    """Test cases for retry policies under injected faults."""
+
+    @pytest.mark.asyncio
+    async def test_retries_trade_budget_for_goodput(self):
+        """Test that retrying resets costs attempts but saves operations."""
+        config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+
+        report = await run_fault_benchmarks(
+            ["flaky_network"],
+            ["no_retry", "persistent"],
+            config,
+            operations=40,
+            time_scale=0.01,
+        )
+
+        no_retry = report["results"]["flaky_network"]["no_retry"]
+        # Five attempts: concurrent operations share one seeded fault stream,
+        # so three resets in a row for one operation do happen now and then
+        persistent = report["results"]["flaky_network"]["persistent"]
+        assert no_retry["succeeded"] < persistent["succeeded"] == 40
+        assert no_retry["wasted_attempts"] == sum(no_retry["injected"].values())
+        assert persistent["upstream_attempts"] > 40
+        assert persistent["backoff_seconds"] > 0
+        assert report["profiles"]["flaky_network"]["retried_by_client"] is True
+
+    @pytest.mark.asyncio
+    async def test_status_faults_not_retried(self):
+        """Test that 5xx profiles fail alike under every policy and say so."""
+        config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+
+        report = await run_fault_benchmarks(
+            ["outage_bursts"],
+            ["no_retry", "persistent"],
+            config,
+            operations=40,
+            time_scale=0.01,
+            seed=3,
+        )
+
+        results = report["results"]["outage_bursts"]
+        assert results["no_retry"]["succeeded"] < 40
+        assert results["no_retry"]["succeeded"] == results["persistent"]["succeeded"]
+        assert results["persistent"]["backoff_seconds"] == 0
+        assert report["profiles"]["outage_bursts"]["retried_by_client"] is False
+
+
+class TestSoak:
+    """Test cases for the memory soak harness."""
+
+    def test_growth_sites_find_leak(self):
+        """Test that a growing allocation is reported at its source."""
+        leak = []
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.take_snapshot()
+            leak.extend(bytearray(1024) for _ in range(200))
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        top = growth_sites(baseline, snapshot, limit=1)[0]
+
+        assert "test_benchmarks.py:" in top["site"]
+        assert top["size_diff_kb"] >= 200
+
+    def test_evaluate_thresholds(self):
+        """Test that growth above a threshold fails the run."""
+        samples = [
+            {"traced_mb": 10.0, "rss_mb": 100.0, "requests": 0},
+            {"traced_mb": 13.0, "rss_mb": 150.0, "requests": 1000},
+        ]
+
+        passed = evaluate(samples, max_growth_mb=5, max_rss_growth_mb=0)
+        failed = evaluate(samples, max_growth_mb=2, max_rss_growth_mb=40)
+
+        assert passed["passed"] and passed["traced_kb_per_1k_requests"] == 3072
+        assert not failed["passed"] and len(failed["failures"]) == 2
+        assert not evaluate(samples[:1], 5, 0)["passed"]
+
+    @pytest.mark.asyncio
+    async def test_short_soak_report(self):
+        """Test a short soak against the service routes."""
+        report = await run_soak(
+            duration=1.0,
+            interval=0.3,
+            warmup=0.2,
+            time_scale=0.01,
+            users=2,
+            server_config=FakeServerConfig(latency_ms=0, latency_jitter_ms=0),
+        )
+
+        assert report["requests"] > 0
+        assert set(report["statuses"]) == {"200"}
+        assert len(report["samples"]) >= 2
+        assert report["samples"][0]["objects"]["ClientSession"] == 1
+        assert report["growth"]["passed"]
+
+
+class TestLimiterCompliance:
+    """Verify that no sliding window ever holds more grants than allowed."""
+
+    def test_max_in_window_is_half_open(self):
+        """Test that a grant exactly one window later is not counted."""
+        assert max_in_window([0.0, 1.0, 2.0], 1.0) == 1
+        assert max_in_window([0.0, 0.5, 1.0], 1.0) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limiter_class", [RateLimiter, FairRateLimiter])
+    async def test_concurrent_acquires_never_exceed_limit(self, limiter_class):
+        """Test every window while hundreds of tasks hammer acquire()."""
+        limiter = limiter_class(max_requests=10, time_window=0.01)
+
+        result = await hammer(limiter, tasks=300)
+
+        assert result["compliance"]["violations"] == 0
+        assert result["compliance"]["max_grants_in_window"] <= 10
+        assert result["fifo_inversions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tenant_shares_follow_weights(self):
+        """Test that backlogged tenants get slots in proportion to weight."""
+        weights = {"bulk": 1.0, "vip": 3.0}
+        limiter = FairRateLimiter(10, 0.01, weights=weights)
+
+        result = await hammer(limiter, tasks=200, tenants=weights)
+
+        assert result["compliance"]["violations"] == 0
+        assert result["tenants"]["vip"]["share"] == pytest.approx(0.75, abs=0.05)
+        assert result["jain_index"] > 0.95
@@ -0,0 +1,135 @@
+"""
+Unit tests for API call budgets.
+"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.budget import budget_scope, get_budget
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import BudgetExceededError
+
+
+class TestBudgetScope:
+    """Test cases for budget scopes."""
+
+    def test_nested_scopes_roll_up(self):
+        """Test that inner costs also count towards enclosing budgets."""
+        with budget_scope("import") as outer:
+            with budget_scope("step") as inner:
+                assert get_budget() is inner
+                inner.record_call(0.25)
+                inner.record_bytes(100)
+            outer.record_cache_hit()
+            assert get_budget() is outer
+        assert get_budget() is None
+
+        assert (inner.upstream_calls, inner.bytes, inner.cache_hits) == (1, 100, 0)
+        assert (outer.upstream_calls, outer.bytes, outer.cache_hits) == (1, 100, 1)
+        assert outer.limiter_wait == 0.25
+
+    def test_enclosing_limit_enforced(self):
+        """Test that an outer limit rejects calls made in an inner scope."""
+        with budget_scope("deck-check", limit=1) as outer:
+            with budget_scope("card") as inner:
+                inner.check("/x")
+                inner.record_call()
+                with pytest.raises(BudgetExceededError) as exc:
+                    inner.check("/y")
+
+        assert exc.value.name == "deck-check"
+        assert outer.remaining == 0
+
+
+class TestClientBudget:
+    """Test cases for budgets of client requests."""
+
+    @pytest.mark.asyncio
+    async def test_counts_calls_hits_coalesced_and_bytes(self):
+        """Test the cost of a small operation against a fake API."""
+        config = FakeServerConfig(latency_ms=20, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = TCGPlayerClient(
+                config=ClientConfig(
+                    base_url=server.base_url, client_id="id", client_secret="secret"
+                )
+            )
+            await client.authenticate()
+            catalog = client.endpoints.catalog
+            try:
+                with budget_scope("dashboard", limit=1) as budget:
+                    # Two identical concurrent calls share one fetch
+                    await asyncio.gather(
+                        catalog.get_categories(), catalog.get_categories()
+                    )
+                    await catalog.get_categories()
+                    with pytest.raises(BudgetExceededError):
+                        await catalog.get_product_details([1])
+            finally:
+                await client.close()
+
+        assert budget.upstream_calls == 1
+        assert budget.coalesced == 1
+        assert budget.cache_hits == 1
+        assert budget.bytes > 0
+        assert server.api_calls() == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_holds_under_concurrency(self):
+        """Test that concurrent distinct calls cannot overshoot the limit."""
+        config = FakeServerConfig(latency_ms=20, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = TCGPlayerClient(
+                config=ClientConfig(
+                    base_url=server.base_url,
+                    client_id="id",
+                    client_secret="secret",
+                    enable_caching=False,
+                ),
+                max_requests_per_second=2,
+            )
+            await client.authenticate()
+            catalog = client.endpoints.catalog
+            product_ids = list(server.products)[:12]
+            try:
+                with budget_scope("burst", limit=2) as budget:
+                    results = await asyncio.gather(
+                        *(catalog.get_product_details([p]) for p in product_ids),
+                        return_exceptions=True,
+                    )
+            finally:
+                await client.close()
+
+        rejected = [r for r in results if isinstance(r, BudgetExceededError)]
+        assert len(rejected) == len(product_ids) - 2
+        assert budget.upstream_calls == 2
+        assert budget.reserved == 0
+        assert server.api_calls() == 2
+
+    @pytest.mark.asyncio
+    async def test_joined_caller_not_rejected(self):
+        """Test that joining an in-flight fetch is free even at the limit."""
+        config = FakeServerConfig(latency_ms=20, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = TCGPlayerClient(
+                config=ClientConfig(
+                    base_url=server.base_url, client_id="id", client_secret="secret"
+                )
+            )
+            await client.authenticate()
+            catalog = client.endpoints.catalog
+            try:
+                with budget_scope("dashboard", limit=1) as budget:
+                    first = asyncio.ensure_future(catalog.get_categories())
+                    await asyncio.sleep(0.005)
+                    # The limit is fully reserved by the in-flight fetch
+                    await asyncio.gather(first, catalog.get_categories())
+            finally:
+                await client.close()
+
+        assert budget.upstream_calls == 1
+        assert budget.coalesced == 1
+        assert server.api_calls() == 1
@@ -0,0 +1,137 @@
+"""
+Unit tests for request deadlines and coalescing.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from tcgplayer_client.cancellation import (
+    RequestCoalescer,
+    deadline_scope,
+    get_deadline,
+    remaining_time,
+)
+from tcgplayer_client.exceptions import OverloadedError, TimeoutError
+from tcgplayer_client.rate_limiter import RateLimiter
+
+
+class TestDeadlineScope:
+    """Test cases for ambient request deadlines."""
+
+    def test_no_deadline_by_default(self):
+        """Test that requests are unbounded outside a scope."""
+        assert get_deadline() is None
+        assert remaining_time() is None
+
+    def test_nested_scopes_only_shorten(self):
+        """Test that an inner scope cannot extend the outer deadline."""
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(10.0) as inner:
+                assert inner == outer
+            with deadline_scope(0.5) as inner:
+                assert inner < outer
+                assert 0 < remaining_time() <= 0.5
+            assert get_deadline() == outer
+        assert get_deadline() is None
+
+
+class TestRequestCoalescer:
+    """Test cases for RequestCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_fetch(self):
+        """Test that concurrent callers with the same key share one fetch."""
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"results": [1]}
+
+        results = await asyncio.gather(*(coalescer.run("key", fetch) for _ in range(3)))
+
+        assert calls == 1
+        assert results == [{"results": [1]}] * 3
+        assert coalescer.get_stats() == {
+            "in_flight": 0,
+            "coalesced": 2,
+            "withdrawn": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_fetch_survives_while_a_caller_remains(self):
+        """Test that one caller cancelling does not cancel a shared fetch."""
+        coalescer = RequestCoalescer()
+        started = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(coalescer.run("key", fetch))
+        second = asyncio.ensure_future(coalescer.run("key", fetch))
+        await started.wait()
+        first.cancel()
+
+        assert await second == "done"
+        assert first.cancelled()
+        assert coalescer.withdrawn == 0
+
+    @pytest.mark.asyncio
+    async def test_last_caller_leaving_releases_limiter_slot(self):
+        """Test that an abandoned fetch is withdrawn from the limiter queue."""
+        limiter = RateLimiter(max_requests=1, time_window=1.0)
+        await limiter.acquire()
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            await limiter.acquire()
+            return "sent"
+
+        caller = asyncio.ensure_future(coalescer.run("key", fetch))
+        await asyncio.sleep(0.01)
+        assert limiter.waiting == 1
+
+        caller.cancel()
+        await asyncio.sleep(0.01)
+
+        assert limiter.waiting == 0
+        assert len(limiter.requests) == 1
+        assert coalescer.withdrawn == 1
+        assert len(coalescer) == 0
+
+
+class TestClientDeadlines:
+    """Test cases for deadlines in TCGPlayerClient requests."""
+
+    @pytest.mark.asyncio
+    async def test_passed_deadline_raises(self, tcgplayer_client):
+        """Test that a request is not sent once its deadline has passed."""
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+
+        with pytest.raises(TimeoutError):
+            await tcgplayer_client._make_api_request(
+                "/catalog/categories", deadline=time.monotonic() - 1
+            )
+
+        tcgplayer_client.rate_limiter.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_deadline_is_shed(self, tcgplayer_client):
+        """Test that a request that cannot get a slot in time is rejected."""
+        limiter = RateLimiter(max_requests=1, time_window=1.0)
+        await limiter.acquire()
+        tcgplayer_client.rate_limiter = limiter
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+
+        with deadline_scope(0.2):
+            with pytest.raises(OverloadedError):
+                await tcgplayer_client._make_api_request("/catalog/categories")
+
+        assert limiter.waiting == 0
@@ -0,0 +1,143 @@
+"""
+Unit tests for cassette record and replay.
+"""
+
+import time
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.cassette import (
+    Cassette,
+    Interaction,
+    record_session,
+    replay_session,
+    request_key,
+)
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import CassetteMissError, ConfigurationError
+
+GROUPS = {"categoryId": 1, "limit": 5}
+
+
+def _client(base_url, **overrides):
+    return TCGPlayerClient(
+        config=ClientConfig(
+            base_url=base_url,
+            client_id="id",
+            client_secret="secret",
+            enable_caching=False,
+            **overrides,
+        )
+    )
+
+
+async def _record(path, latency_ms=0):
+    config = FakeServerConfig(latency_ms=latency_ms, latency_jitter_ms=0)
+    async with FakeTCGPlayer(config) as server:
+        client = _client(server.base_url)
+        await client.authenticate()
+        try:
+            async with record_session(client, path) as cassette:
+                categories = await client.endpoints.catalog.get_categories()
+                groups = await client._make_api_request("/catalog/groups", GROUPS)
+        finally:
+            await client.close()
+    return cassette, categories, groups
+
+
+class TestRequestKey:
+    """Test cases for matching requests."""
+
+    def test_host_and_query_order_ignored(self):
+        """Test that requests match regardless of host and query order."""
+        assert request_key("get", "https://a.example/x?b=2&a=1") == request_key(
+            "GET", "http://localhost:1234/x?a=1&b=2"
+        )
+        assert request_key("POST", "/x", {"a": 1}) != request_key("POST", "/x")
+
+
+class TestCassette:
+    """Test cases for the cassette store."""
+
+    def test_repeats_play_in_order_then_last(self, tmp_path):
+        """Test that identical requests replay in order, surviving a save."""
+        cassette = Cassette(
+            [
+                Interaction("GET", "/x", 200, b'{"n": 1}'),
+                Interaction("GET", "/x", 200, b'{"n": 2}'),
+                Interaction("GET", "/bin", 200, b"\xff\x00"),
+            ]
+        )
+        cassette.save(tmp_path / "c.json")
+        loaded = Cassette.load(tmp_path / "c.json")
+
+        bodies = [loaded.match("GET", "/x").body for _ in range(3)]
+
+        assert bodies == [b'{"n": 1}', b'{"n": 2}', b'{"n": 2}']
+        assert loaded.match("GET", "/bin").body == b"\xff\x00"
+        assert loaded.match("GET", "/x", repeat=False) is None
+
+
+class TestRecordReplay:
+    """Test cases for recording a session and replaying it offline."""
+
+    @pytest.mark.asyncio
+    async def test_replay_matches_recording(self, tmp_path):
+        """Test that replay returns the recorded data with no server."""
+        path = tmp_path / "session.json"
+        cassette, categories, groups = await _record(path)
+        assert len(cassette) == 2
+        assert cassette.interactions[0].path == "/catalog/categories"
+
+        client = _client("http://127.0.0.1:1")
+        transport = replay_session(client, path)
+        await client.authenticate()
+        try:
+            assert await client.endpoints.catalog.get_categories() == categories
+            # Same query with parameters in another order
+            params = dict(reversed(list(GROUPS.items())))
+            assert await client._make_api_request("/catalog/groups", params) == groups
+            with pytest.raises(CassetteMissError):
+                await client.endpoints.catalog.get_category_details(1)
+        finally:
+            await client.close()
+        assert transport.replayed == 2
+
+    @pytest.mark.asyncio
+    async def test_realtime_replay_reproduces_latency(self, tmp_path):
+        """Test that realtime replay waits the recorded elapsed time."""
+        path = tmp_path / "slow.json"
+        cassette, _, _ = await _record(path, latency_ms=50)
+        assert cassette.interactions[0].elapsed >= 0.05
+
+        client = _client("http://127.0.0.1:1")
+        replay_session(client, path, realtime=True)
+        await client.authenticate()
+        try:
+            start = time.perf_counter()
+            await client.endpoints.catalog.get_categories()
+            assert time.perf_counter() - start >= 0.05
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_mock_responses_config_selects_replay(self, tmp_path):
+        """Test that mock_responses with a cassette_path replays it."""
+        path = tmp_path / "session.json"
+        _, categories, _ = await _record(path)
+
+        client = _client(
+            "http://127.0.0.1:1", mock_responses=True, cassette_path=str(path)
+        )
+        await client.authenticate()
+        try:
+            assert await client.endpoints.catalog.get_categories() == categories
+        finally:
+            await client.close()
+
+    def test_mock_responses_requires_cassette(self):
+        """Test that replay mode without a cassette is rejected."""
+        with pytest.raises(ConfigurationError):
+            ClientConfig(mock_responses=True)
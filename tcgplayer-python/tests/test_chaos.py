@@ -0,0 +1,108 @@
+"""
+Unit tests for fault injection.
+"""
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.chaos import FaultConfig, FaultInjectionTransport, inject_faults
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import (
+    APIError,
+    ConfigurationError,
+    NetworkError,
+    RateLimitError,
+)
+
+
+def _client(base_url, max_retries=3):
+    return TCGPlayerClient(
+        config=ClientConfig(
+            base_url=base_url,
+            client_id="id",
+            client_secret="secret",
+            enable_caching=False,
+        ),
+        max_retries=max_retries,
+        base_delay=0.001,
+    )
+
+
+async def _categories(faults, max_retries=3):
+    config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+    async with FakeTCGPlayer(config) as server:
+        client = _client(server.base_url, max_retries)
+        transport = inject_faults(client, faults)
+        await client.authenticate()
+        try:
+            return await client.endpoints.catalog.get_categories(), transport
+        finally:
+            await client.close()
+
+
+class TestFaultSelection:
+    """Test cases for choosing faults."""
+
+    def test_bursts_fail_consecutive_requests(self):
+        """Test that a started burst fails the following requests too."""
+        transport = FaultInjectionTransport(FaultConfig(burst_rate=1, burst_length=3))
+
+        first = transport._fault()
+        transport.config.burst_rate = 0
+        rest = [transport._fault() for _ in range(3)]
+
+        assert [first] + rest == ["5xx", "5xx", "5xx", None]
+
+    def test_same_seed_same_faults(self):
+        """Test that a seed makes the fault sequence reproducible."""
+        config = FaultConfig(reset_rate=0.3, rate_429=0.3, seed=7)
+        first = FaultInjectionTransport(config)
+        second = FaultInjectionTransport(config)
+
+        assert [first._fault() for _ in range(50)] == [
+            second._fault() for _ in range(50)
+        ]
+
+    def test_invalid_rate_rejected(self):
+        """Test that rates outside 0..1 are rejected."""
+        with pytest.raises(ConfigurationError):
+            FaultConfig(reset_rate=1.5)
+
+
+class TestInjectedFaults:
+    """Test cases for faults seen by the client."""
+
+    @pytest.mark.asyncio
+    async def test_reset_retried_until_exhausted(self):
+        """Test that injected resets go through the client's retry loop."""
+        with pytest.raises(NetworkError):
+            await _categories(FaultConfig(reset_rate=1), max_retries=2)
+
+    @pytest.mark.asyncio
+    async def test_timeout_then_success(self):
+        """Test that a retry after an injected timeout reaches the API."""
+        # Seed 3 times out the first attempt only
+        faults = FaultConfig(timeout_rate=0.5, timeout_ms=1, seed=3)
+
+        result, transport = await _categories(faults)
+
+        assert result["success"]
+        assert transport.injected["timeout"] == 1
+        assert transport.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_429_carries_retry_after(self):
+        """Test that an injected 429 surfaces its Retry-After."""
+        with pytest.raises(RateLimitError) as exc:
+            await _categories(FaultConfig(rate_429=1, retry_after=7))
+
+        assert exc.value.retry_after == 7
+
+    @pytest.mark.asyncio
+    async def test_server_error_status(self):
+        """Test that burst responses use the configured status."""
+        with pytest.raises(APIError) as exc:
+            await _categories(FaultConfig(burst_rate=1, burst_status=502))
+
+        assert exc.value.status_code == 502
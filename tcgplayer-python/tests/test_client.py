@@ -2,13 +2,22 @@
 Unit tests for the main TCGPlayerClient class.
 """
 
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.cache import UNDECODED, ResponseCache
 from tcgplayer_client.exceptions import (
     AuthenticationError,
+    OverloadedError,
     RateLimitError,
 )
+from tcgplayer_client.rate_limiter import RateLimiter
+
+from .conftest import MockAsyncContextManager
 
 
 class TestTCGPlayerClient:
@@ -161,3 +170,120 @@ class TestTCGPlayerClient:
         # Note: The current implementation doesn't customize repr
         # This test verifies the basic object representation
         assert "TCGPlayerClient" in repr_str
+
+
+class TestRawResponses:
+    """Test cases for raw (undecoded) response pass-through."""
+
+    @pytest.mark.asyncio
+    async def test_raw_body_served_from_cache(self, tcgplayer_client):
+        """Test that a raw fetch caches only the original bytes."""
+        body = b'{"success": true, "results": [{"categoryId": 1}]}'
+        response = AsyncMock()
+        response.status = 200
+        response.read = AsyncMock(return_value=body)
+
+        session = MagicMock()
+        session.get = MagicMock(return_value=MockAsyncContextManager(response))
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+        tcgplayer_client.auth.get_access_token = MagicMock(return_value="token")
+        tcgplayer_client.session_manager.get_session = AsyncMock(return_value=session)
+
+        raw = await tcgplayer_client._make_api_request("/catalog/categories", raw=True)
+        again = await tcgplayer_client._make_api_request(
+            "/catalog/categories", raw=True
+        )
+        parsed = await tcgplayer_client._make_api_request("/catalog/categories")
+        entry = await tcgplayer_client.response_cache.get_cached_entry(
+            "/catalog/categories"
+        )
+
+        assert raw.body is body and again.body is body
+        assert raw.etag == again.etag
+        assert raw.etag.startswith('"') and len(raw.etag) == 34
+        # Parsed hits decode the kept bytes; the entry holds them only once
+        assert parsed == {"success": True, "results": [{"categoryId": 1}]}
+        assert entry.value is UNDECODED
+        session.get.assert_called_once()
+        await tcgplayer_client.close()
+
+    @pytest.mark.asyncio
+    async def test_parsed_fetch_caches_only_value(self, tcgplayer_client):
+        """Test that a parsed fetch drops the body and re-encodes raw hits."""
+        body = b'{"success": true, "results": [{"categoryId": 1}]}'
+        response = AsyncMock()
+        response.status = 200
+        response.read = AsyncMock(return_value=body)
+
+        session = MagicMock()
+        session.get = MagicMock(return_value=MockAsyncContextManager(response))
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+        tcgplayer_client.auth.get_access_token = MagicMock(return_value="token")
+        tcgplayer_client.session_manager.get_session = AsyncMock(return_value=session)
+
+        parsed = await tcgplayer_client._make_api_request("/catalog/categories")
+        raw = await tcgplayer_client._make_api_request("/catalog/categories", raw=True)
+        entry = await tcgplayer_client.response_cache.get_cached_entry(
+            "/catalog/categories"
+        )
+
+        assert entry.raw is None
+        assert entry.size == len(body)
+        assert json.loads(raw.body) == parsed
+        session.get.assert_called_once()
+        await tcgplayer_client.close()
+
+
+class TestAdmissionControl:
+    """Test cases for load shedding when the limiter backlog is too deep."""
+
+    def _saturate(self, client):
+        limiter = RateLimiter(max_requests=10, time_window=1.0)
+        limiter.requests.extend([time.time()] * 10)
+        limiter.waiting = 30
+        client.rate_limiter = limiter
+
+    @pytest.mark.asyncio
+    async def test_rejected_when_wait_too_long(self, tcgplayer_client):
+        """Test that a request is rejected with a retry hint."""
+        self._saturate(tcgplayer_client)
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+
+        with pytest.raises(OverloadedError) as exc_info:
+            await tcgplayer_client._make_api_request("/catalog/categories", max_wait=1)
+
+        assert exc_info.value.retry_after > 1
+        assert (
+            tcgplayer_client.metrics.shed.get(
+                endpoint="/catalog/categories", outcome="rejected"
+            )
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_when_wait_too_long(self, tcgplayer_client):
+        """Test that a recently expired response is served instead of queueing."""
+        tcgplayer_client.response_cache = ResponseCache(stale_ttl=60)
+        await tcgplayer_client.response_cache.cache_response(
+            "/catalog/categories", response={"results": [1]}, custom_ttl=1
+        )
+        entry = await tcgplayer_client.response_cache.get_cached_entry(
+            "/catalog/categories"
+        )
+        entry.timestamp -= 10
+        self._saturate(tcgplayer_client)
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+
+        result = await tcgplayer_client._make_api_request(
+            "/catalog/categories", max_wait=1
+        )
+        # Without admission control the stale entry is not returned
+        assert (
+            await tcgplayer_client.response_cache.get_cached_entry(
+                "/catalog/categories"
+            )
+            is None
+        )
+
+        assert result == {"results": [1]}
+        await tcgplayer_client.close()
@@ -6,7 +6,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tcgplayer_client import TCGPlayerClient, ValidationError
+from tcgplayer_client.budget import budget_scope
 from tcgplayer_client.endpoints.catalog import CatalogEndpoints
+from tcgplayer_client.hooks import ON_CACHE_HIT
 
 
 class TestCatalogEndpoints:
@@ -325,3 +328,86 @@ class TestCatalogEndpoints:
         # Note: The current implementation doesn't customize repr
         # This test verifies the basic object representation
         assert "CatalogEndpoints" in repr_str
+
+
+class TestCatalogGroupsByIds:
+    """Test cases for batched group lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_groups_by_ids_batches_and_orders(self):
+        """Test chunked fetching and request-order results."""
+        mock_client = MagicMock()
+        mock_client.response_cache = None
+
+        async def fake_request(endpoint, use_cache=True):
+            ids = [int(x) for x in endpoint.rsplit("/", 1)[1].split(",")]
+            return {"results": [{"groupId": gid} for gid in reversed(ids)]}
+
+        mock_client._make_api_request = AsyncMock(side_effect=fake_request)
+        catalog = CatalogEndpoints(mock_client)
+
+        result = await catalog.get_groups_by_ids([5, 3, 5, 9], batch_size=2)
+
+        assert [g["groupId"] for g in result["results"]] == [5, 3, 9]
+        endpoints = sorted(c.args[0] for c in mock_client._make_api_request.mock_calls)
+        assert endpoints == ["/catalog/groups/5,3", "/catalog/groups/9"]
+
+    @pytest.mark.asyncio
+    async def test_get_groups_by_ids_caches_per_group(self):
+        """Test that groups are cached individually and hits are accounted."""
+        client = TCGPlayerClient()
+        client._make_api_request = AsyncMock(
+            return_value={"results": [{"groupId": 1}, {"groupId": 2}]}
+        )
+        hits = []
+        client.add_hook(ON_CACHE_HIT, hits.append)
+        catalog = CatalogEndpoints(client)
+
+        await catalog.get_groups_by_ids([1, 2])
+        client._make_api_request.return_value = {"results": [{"groupId": 3}]}
+        with budget_scope() as budget:
+            result = await catalog.get_groups_by_ids([2, 3, 1])
+
+        assert [g["groupId"] for g in result["results"]] == [2, 3, 1]
+        client._make_api_request.assert_called_with(
+            "/catalog/groups/3", use_cache=False
+        )
+        assert budget.cache_hits == 2
+        assert [h.endpoint for h in hits] == ["/catalog/groups/2", "/catalog/groups/1"]
+        assert client.metrics.cache_lookups.get(result="hit") == 2
+        assert client.metrics.cache_lookups.get(result="miss") == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_groups_by_ids_rejects_bad_batch_size(self):
+        """Test that a non-positive batch size is a validation error."""
+        mock_client = MagicMock()
+        mock_client.response_cache = None
+        catalog = CatalogEndpoints(mock_client)
+
+        with pytest.raises(ValidationError):
+            await catalog.get_groups_by_ids([1], batch_size=0)
+
+
+class TestCatalogPagination:
+    """Test cases for paginated catalog iteration."""
+
+    @pytest.mark.asyncio
+    async def test_iter_products_pages_until_exhausted(self):
+        """Test that pages are requested with offsets until the listing ends."""
+        mock_client = MagicMock()
+
+        async def fake_request(endpoint, params=None, use_cache=True):
+            offset, limit = params["offset"], params["limit"]
+            items = [{"productId": i} for i in range(5)][offset : offset + limit]
+            return {"results": items, "totalItems": 5}
+
+        mock_client._make_api_request = AsyncMock(side_effect=fake_request)
+        catalog = CatalogEndpoints(mock_client)
+
+        pages = [page async for page in catalog.iter_products(group_id=7, page_size=2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        last_call = mock_client._make_api_request.call_args
+        assert last_call.kwargs["params"] == {"groupId": 7, "limit": 2, "offset": 4}
+        assert last_call.kwargs["use_cache"] is False
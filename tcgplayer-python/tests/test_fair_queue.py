@@ -0,0 +1,178 @@
+"""
+Unit tests for per-tenant fair queuing.
+"""
+
+import asyncio
+
+import pytest
+
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import QuotaExceededError
+from tcgplayer_client.fair_queue import FairRateLimiter, get_tenant, tenant_scope
+
+
+async def _acquire_as(limiter, tenant, order):
+    with tenant_scope(tenant):
+        await limiter.acquire()
+    order.append(tenant)
+
+
+async def _fill(limiter):
+    """Use up the current window so later requests queue."""
+    for _ in range(limiter.max_requests):
+        await limiter.acquire()
+
+
+class TestTenantScope:
+    """Test cases for the ambient tenant."""
+
+    def test_default_tenant(self):
+        """Test that requests outside a scope use the default tenant."""
+        assert get_tenant() == "default"
+        with tenant_scope("alice"):
+            assert get_tenant() == "alice"
+        with tenant_scope(None):
+            assert get_tenant() == "default"
+
+
+class TestFairRateLimiter:
+    """Test cases for FairRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_single_tenant_is_fifo(self):
+        """Test that one tenant's requests are granted in arrival order."""
+        limiter = FairRateLimiter(max_requests=2, time_window=0.05)
+        order = []
+
+        async def acquire(i):
+            await limiter.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(acquire(i) for i in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+        assert limiter.tenants["default"].granted == 5
+
+    @pytest.mark.asyncio
+    async def test_idle_tenant_not_starved_by_backlog(self):
+        """Test that a new tenant's request goes ahead of another's backlog."""
+        limiter = FairRateLimiter(max_requests=1, time_window=0.02)
+        await _fill(limiter)
+        order = []
+
+        bulk = [
+            asyncio.ensure_future(_acquire_as(limiter, "bulk", order)) for _ in range(8)
+        ]
+        await asyncio.sleep(0)
+        await _acquire_as(limiter, "user", order)
+
+        assert order.index("user") <= 1
+        await asyncio.gather(*bulk)
+
+    @pytest.mark.asyncio
+    async def test_weights_share_slots(self):
+        """Test that backlogged tenants get slots in proportion to weight."""
+        limiter = FairRateLimiter(
+            max_requests=1, time_window=0.01, weights={"vip": 2.0}
+        )
+        await _fill(limiter)
+        order = []
+
+        await asyncio.gather(
+            *(_acquire_as(limiter, "bulk", order) for _ in range(6)),
+            *(_acquire_as(limiter, "vip", order) for _ in range(6)),
+        )
+
+        assert order[:6].count("vip") == 4
+
+    @pytest.mark.asyncio
+    async def test_quota_rejects_excess_requests(self):
+        """Test that a tenant over its quota is rejected, others are not."""
+        limiter = FairRateLimiter(max_requests=10, quota=2, quota_window=60)
+
+        with tenant_scope("alice"):
+            await limiter.acquire()
+            await limiter.acquire()
+            with pytest.raises(QuotaExceededError) as exc_info:
+                await limiter.acquire()
+        with tenant_scope("bob"):
+            await limiter.acquire()
+
+        assert exc_info.value.retry_after >= 59
+        stats = limiter.get_tenant_stats()
+        assert stats["alice"]["quota_used"] == 2
+        assert stats["alice"]["rejected"] == 1
+        assert stats["bob"]["granted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_withdrawn_request_releases_place(self):
+        """Test that a cancelled waiter does not consume a slot."""
+        limiter = FairRateLimiter(max_requests=1, time_window=0.05)
+        await _fill(limiter)
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert limiter.waiting == 1
+        waiter.cancel()
+        await asyncio.sleep(0.06)
+
+        assert limiter.waiting == 0
+        assert limiter.tenants["default"].granted == 1
+        assert limiter.window_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_estimate_wait_is_per_tenant(self):
+        """Test that another tenant's backlog does not count as ahead."""
+        limiter = FairRateLimiter(max_requests=1, time_window=1.0)
+        await _fill(limiter)
+        with tenant_scope("bulk"):
+            bulk = [asyncio.ensure_future(limiter.acquire()) for _ in range(5)]
+            await asyncio.sleep(0)
+            bulk_wait = limiter.estimate_wait()
+        with tenant_scope("user"):
+            user_wait = limiter.estimate_wait()
+
+        assert user_wait < bulk_wait
+        assert user_wait <= 2.0
+        for task in bulk:
+            task.cancel()
+        await asyncio.gather(*bulk, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_tenants_bounded(self):
+        """Test that idle tenants are forgotten and overflow uses the default."""
+        limiter = FairRateLimiter(max_requests=100, max_tenants=3, quota=5)
+        for name in ("a", "b", "c"):
+            with tenant_scope(name):
+                await limiter.acquire()
+        assert set(limiter.tenants) == {"a", "b", "c"}
+
+        # Tenants with quota usage in the window are kept; the next one folds
+        with tenant_scope("d"):
+            await limiter.acquire()
+        assert set(limiter.tenants) == {"a", "b", "c", "default"}
+        assert limiter.tenants["default"].granted == 1
+
+        # Once idle they are forgotten to make room
+        limiter.quota_window = 0.01
+        await asyncio.sleep(0.02)
+        with tenant_scope("e"):
+            await limiter.acquire()
+        assert set(limiter.tenants) == {"default", "e"}
+
+
+class TestClientFairQueuing:
+    """Test cases for fair queuing configuration in TCGPlayerClient."""
+
+    def test_config_enables_fair_limiter(self):
+        """Test that fair_queuing selects FairRateLimiter with tenant settings."""
+        config = ClientConfig(
+            fair_queuing=True, tenant_weights={"app": 3.0}, tenant_quota=100
+        )
+
+        client = TCGPlayerClient(config=config)
+
+        assert isinstance(client.rate_limiter, FairRateLimiter)
+        assert client.rate_limiter.weights == {"app": 3.0}
+        assert client.rate_limiter.quota == 100
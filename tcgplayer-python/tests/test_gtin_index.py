@@ -0,0 +1,156 @@
+"""
+Unit tests for the local GTIN index.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tcgplayer_client.endpoints.catalog import CatalogEndpoints
+from tcgplayer_client.gtin_index import GTINIndex, normalize_gtin
+
+
+class TestNormalizeGtin:
+    """Test cases for GTIN normalization."""
+
+    def test_pads_upc_to_13_digits(self):
+        """Test that a 12-digit UPC is padded to GTIN-13."""
+        assert normalize_gtin("820650853029") == "0820650853029"
+
+    def test_strips_non_digits_and_indicator(self):
+        """Test that separators and a zero GTIN-14 indicator are dropped."""
+        assert normalize_gtin("0-0820650-853029") == "0820650853029"
+
+    def test_rejects_unusable_values(self):
+        """Test that empty or oversized values are rejected."""
+        assert normalize_gtin(None) is None
+        assert normalize_gtin("abc") is None
+        assert normalize_gtin("1" * 15) is None
+
+
+class TestGTINIndex:
+    """Test cases for GTINIndex class."""
+
+    def test_add_and_get(self):
+        """Test in-memory add and lookup."""
+        index = GTINIndex()
+
+        assert index.add("820650853029", 42) is True
+        assert index.add("0820650853029", 42) is False
+        assert index.get("820650853029") == 42
+        assert index.get("1234567890123") is None
+        assert index.get_stats()["hits"] == 1
+        assert index.get_stats()["misses"] == 1
+
+    def test_persistence_roundtrip(self, tmp_path):
+        """Test that appended records survive a reload."""
+        path = tmp_path / "gtin.idx"
+        index = GTINIndex(path)
+        index.add("1234567890123", 1)
+        index.add("1234567890123", 2)
+        assert index.flush() == 2
+
+        reloaded = GTINIndex(path)
+        assert reloaded.get("1234567890123") == 2
+        assert len(path.read_text().splitlines()) == 2
+
+        reloaded.compact()
+        assert path.read_text() == "1234567890123\t2\n"
+
+    def test_update_from_products(self, tmp_path):
+        """Test building the index from catalog product payloads."""
+        index = GTINIndex(tmp_path / "gtin.idx")
+        products = [
+            {"productId": 1, "extendedData": [{"name": "UPC", "value": "111"}]},
+            {"productId": 2, "gtin": "2222222222222"},
+            {"productId": 3, "extendedData": [{"name": "Rarity", "value": "R"}]},
+        ]
+
+        assert index.update_from_products(products) == 2
+        assert index.pending == 2
+        index.flush()
+        assert GTINIndex(tmp_path / "gtin.idx").get("111") == 1
+        assert index.get("2222222222222") == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_pending_batches_writes(self, tmp_path):
+        """Test that records reach disk in batches of ``flush_threshold``."""
+        path = tmp_path / "gtin.idx"
+        index = GTINIndex(path, flush_threshold=3)
+        index.add("1", 1)
+        index.add("2", 2)
+
+        assert await index.flush_pending() == 0
+        assert not path.exists()
+
+        index.add("3", 3)
+        assert await index.flush_pending() == 3
+        index.add("4", 4)
+        assert await index.flush_pending(force=True) == 1
+        assert len(path.read_text().splitlines()) == 4
+        assert index.pending == 0
+
+    def test_load_keeps_unflushed_records(self, tmp_path):
+        """Test that reloading from disk does not drop buffered records."""
+        index = GTINIndex(tmp_path / "gtin.idx")
+        index.add("1", 1)
+
+        index.load()
+        assert index.get("1") == 1
+
+
+class TestCatalogGtinLookup:
+    """Test cases for GTIN lookups through CatalogEndpoints."""
+
+    @pytest.mark.asyncio
+    async def test_index_hit_skips_api(self):
+        """Test that an indexed GTIN is answered without an API request."""
+        mock_client = MagicMock()
+        mock_client.gtin_index = GTINIndex()
+        mock_client.gtin_index.add("1234567890123", 77)
+        mock_client._make_api_request = AsyncMock()
+
+        catalog = CatalogEndpoints(mock_client)
+        assert await catalog.get_product_id_by_gtin("1234567890123") == 77
+        mock_client._make_api_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_miss_falls_back_and_writes_back(self, tmp_path):
+        """Test that a miss calls the API and records the result."""
+        mock_client = MagicMock()
+        mock_client.gtin_index = GTINIndex(tmp_path / "gtin.idx", flush_threshold=1)
+        mock_client._make_api_request = AsyncMock(
+            return_value={"success": True, "results": [{"productId": 99}]}
+        )
+
+        catalog = CatalogEndpoints(mock_client)
+        assert await catalog.get_product_id_by_gtin("1234567890123") == 99
+        assert await catalog.get_product_id_by_gtin("1234567890123") == 99
+
+        mock_client._make_api_request.assert_called_once_with(
+            "/catalog/products/gtin/1234567890123"
+        )
+        assert GTINIndex(tmp_path / "gtin.idx").get("1234567890123") == 99
+
+    @pytest.mark.asyncio
+    async def test_catalog_sync_builds_index(self, tmp_path):
+        """Test that iterating products indexes their GTINs without lookups."""
+        mock_client = MagicMock()
+        mock_client.gtin_index = GTINIndex(tmp_path / "gtin.idx")
+        mock_client._make_api_request = AsyncMock(
+            return_value={
+                "results": [
+                    {"productId": 5, "extendedData": [{"name": "UPC", "value": "5"}]},
+                    {"productId": 6, "gtin": "6"},
+                ]
+            }
+        )
+
+        catalog = CatalogEndpoints(mock_client)
+        async for _ in catalog.iter_products(group_id=1, page_size=10):
+            pass
+
+        # The last page is written out even below the flush threshold
+        assert GTINIndex(tmp_path / "gtin.idx").get("5") == 5
+        assert await catalog.get_product_id_by_gtin("6") == 6
+        assert mock_client._make_api_request.call_count == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for request lifecycle hooks.
+"""
+
+import time
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import NetworkError, ValidationError
+from tcgplayer_client.hooks import HookContext, HookRegistry
+
+
+def _client(base_url, **kwargs):
+    config = ClientConfig(base_url=base_url, client_id="id", client_secret="secret")
+    return TCGPlayerClient(config=config, **kwargs)
+
+
+class TestHookRegistry:
+    """Test cases for registering and emitting hooks."""
+
+    def test_unknown_event_rejected(self):
+        """Test that registering for an unknown event raises."""
+        with pytest.raises(ValidationError):
+            HookRegistry().register("on_everything", lambda ctx: None)
+
+    @pytest.mark.asyncio
+    async def test_sync_and_async_hooks_in_order(self):
+        """Test that hooks run in registration order, sync or async."""
+        registry = HookRegistry()
+        calls = []
+
+        async def first(ctx):
+            calls.append(("first", ctx.endpoint))
+
+        registry.register("on_retry", first)
+        registry.register("on_retry", lambda ctx: calls.append(("second", ctx.attempt)))
+
+        await registry.emit(HookContext("on_retry", "/x", "/x", "GET", attempt=2))
+
+        assert calls == [("first", "/x"), ("second", 2)]
+        assert registry.unregister("on_retry", first)
+        assert not registry.unregister("on_retry", first)
+        assert len(registry.on_retry) == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_hook_is_isolated(self):
+        """Test that a raising hook does not stop later hooks."""
+        registry = HookRegistry()
+        calls = []
+
+        def broken(ctx):
+            raise RuntimeError("boom")
+
+        registry.register("on_cache_hit", broken)
+        registry.register("on_cache_hit", calls.append)
+
+        await registry.emit(HookContext("on_cache_hit", "/x", "/x", "GET"))
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatch_overhead(self):
+        """Test that a dozen no-op hooks cost microseconds per emit."""
+        registry = HookRegistry()
+
+        async def noop(ctx):
+            pass
+
+        for _ in range(12):
+            registry.register("after_response", noop)
+        context = HookContext("after_response", "/x", "/x", "GET")
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            await registry.emit(context)
+        per_emit = (time.perf_counter() - start) / 1000
+
+        assert per_emit < 0.001
+
+
+class TestClientHooks:
+    """Test cases for hooks fired by TCGPlayerClient."""
+
+    @pytest.mark.asyncio
+    async def test_request_lifecycle(self):
+        """Test the events and contexts of a fetched then cached request."""
+        events = []
+        config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = _client(server.base_url)
+            for event in (
+                "on_rate_limit_wait",
+                "before_request",
+                "after_response",
+                "on_cache_hit",
+            ):
+                client.add_hook(event, events.append)
+            await client.authenticate()
+            try:
+                await client.endpoints.catalog.get_categories()
+                await client.endpoints.catalog.get_categories()
+            finally:
+                await client.close()
+
+        assert [ctx.event for ctx in events] == [
+            "on_rate_limit_wait",
+            "before_request",
+            "after_response",
+            "on_cache_hit",
+        ]
+        response = events[2]
+        assert response.template == "/catalog/categories"
+        assert response.attempt == 1
+        assert response.status == 200
+        assert response.bytes > 0
+        assert response.duration > 0
+        assert response.error is None
+        assert events[3].bytes == response.bytes
+
+    @pytest.mark.asyncio
+    async def test_retry_hooks_on_network_error(self):
+        """Test on_retry and failed after_response contexts."""
+        retries, responses = [], []
+        client = _client("http://127.0.0.1:1", max_retries=2, base_delay=0.001)
+        client.add_hook("on_retry", retries.append)
+        client.add_hook("after_response", responses.append)
+        client.auth.is_authenticated = lambda: True
+        client.auth.get_access_token = lambda: "token"
+        try:
+            with pytest.raises(NetworkError):
+                await client._make_api_request("/catalog/categories")
+        finally:
+            await client.close()
+
+        assert [ctx.attempt for ctx in retries] == [1]
+        assert retries[0].retry_delay == 0.001
+        assert retries[0].error == "ClientConnectorError"
+        assert [ctx.attempt for ctx in responses] == [1, 2]
+        assert all(ctx.status is None and ctx.error for ctx in responses)
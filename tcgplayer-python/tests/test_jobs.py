@@ -0,0 +1,270 @@
+"""
+Unit tests for background jobs.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tcgplayer_client.budget import budget_scope, get_budget
+from tcgplayer_client.cancellation import deadline_scope, get_deadline
+from tcgplayer_client.exceptions import ValidationError
+from tcgplayer_client.jobs import (
+    CANCELLED,
+    FAILED,
+    RUNNING,
+    SUCCEEDED,
+    JobDefinition,
+    JobManager,
+    sync_prices_job,
+)
+
+
+def _definition(items, step, concurrency=4):
+    async def plan(params):
+        return list(items)
+
+    return JobDefinition(plan=plan, step=step, concurrency=concurrency)
+
+
+async def _wait_for(job, *statuses):
+    for _ in range(200):
+        if job.status in statuses:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job stayed {job.status}")
+
+
+class TestJobManager:
+    """Test cases for JobManager."""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_all_items(self):
+        """Test that a job runs every planned item and collects results."""
+        manager = JobManager()
+
+        async def step(item):
+            return [{"item": item}]
+
+        manager.register("double", _definition(range(5), step))
+        job = await manager.submit("double")
+        await _wait_for(job, SUCCEEDED)
+
+        assert sorted(r["item"] for r in job.results) == [0, 1, 2, 3, 4]
+        status = job.to_dict()
+        assert status["progress"] == 1.0
+        assert status["completed_items"] == status["total_items"] == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_rejected(self):
+        """Test that submitting an unregistered kind raises."""
+        with pytest.raises(ValidationError):
+            await JobManager().submit("missing")
+
+    @pytest.mark.asyncio
+    async def test_failed_step_marks_job_failed(self):
+        """Test that a step error fails the job with its message."""
+        manager = JobManager()
+
+        async def step(item):
+            raise RuntimeError("upstream down")
+
+        manager.register("broken", _definition([1], step))
+        job = await manager.submit("broken")
+        await _wait_for(job, FAILED)
+
+        assert job.error == "upstream down"
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_job(self):
+        """Test that cancelling a job stops its remaining items."""
+        manager = JobManager()
+        release = asyncio.Event()
+
+        async def step(item):
+            await release.wait()
+            return [item]
+
+        manager.register("slow", _definition(range(3), step, concurrency=1))
+        job = await manager.submit("slow")
+        await _wait_for(job, RUNNING)
+
+        assert await manager.cancel(job.id) is True
+        assert job.status == CANCELLED
+        assert job.results == []
+        assert await manager.cancel(job.id) is False
+
+    @pytest.mark.asyncio
+    async def test_job_ignores_request_deadline(self):
+        """Test that a job does not inherit the submitting request's deadline."""
+        manager = JobManager()
+        seen = []
+
+        async def step(item):
+            seen.append(get_deadline())
+            return []
+
+        manager.register("check", _definition([1], step))
+        with deadline_scope(0.5):
+            job = await manager.submit("check")
+        await _wait_for(job, SUCCEEDED)
+
+        assert seen == [None]
+
+    @pytest.mark.asyncio
+    async def test_job_ignores_request_budget(self):
+        """Test that a job is not charged to the submitting request's budget."""
+        manager = JobManager()
+        seen = []
+
+        async def step(item):
+            seen.append(get_budget())
+            return []
+
+        manager.register("check", _definition([1, 2, 3], step))
+        with budget_scope("/jobs/check", limit=2):
+            job = await manager.submit("check")
+        await _wait_for(job, SUCCEEDED)
+
+        assert seen == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_oldest_finished_jobs_evicted(self, tmp_path):
+        """Test that only the newest finished jobs and their files are kept."""
+        manager = JobManager(state_dir=str(tmp_path), max_finished_jobs=2)
+
+        async def step(item):
+            return [{"item": item}]
+
+        manager.register("sync", _definition([1], step))
+        done = []
+        for _ in range(3):
+            job = await manager.submit("sync")
+            await _wait_for(job, SUCCEEDED)
+            done.append(job)
+        await asyncio.sleep(0)
+
+        assert [j.id for j in manager.list_jobs()] == [done[2].id, done[1].id]
+        assert manager.get(done[0].id) is None
+        assert not (tmp_path / f"{done[0].id}.json").exists()
+        assert not (tmp_path / f"{done[0].id}.ndjson").exists()
+        assert (tmp_path / f"{done[2].id}.ndjson").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_items(self, tmp_path):
+        """Test that a resumed job only runs items not yet checkpointed."""
+        gate = asyncio.Event()
+        calls = []
+
+        async def step(item):
+            calls.append(item)
+            if item > 0:
+                await gate.wait()
+            return [{"item": item}]
+
+        first = JobManager(state_dir=str(tmp_path))
+        first.register("sync", _definition(range(3), step, concurrency=1))
+        job = await first.submit("sync")
+        for _ in range(200):
+            if job.completed:
+                break
+            await asyncio.sleep(0.01)
+        await first.shutdown()
+        assert job.completed == {0}
+
+        calls.clear()
+        gate.set()
+        second = JobManager(state_dir=str(tmp_path))
+        second.register("sync", _definition(range(3), step, concurrency=1))
+        assert await second.resume() == 1
+        resumed = second.get(job.id)
+        await _wait_for(resumed, SUCCEEDED)
+
+        assert calls == [1, 2]
+        assert [r["item"] for r in resumed.results] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_resume_trusts_results_over_stale_checkpoint(self, tmp_path):
+        """Test that an item written before a crash is neither rerun nor doubled."""
+        calls = []
+
+        async def step(item):
+            calls.append(item)
+            return [{"item": item}]
+
+        (tmp_path / "job1.json").write_text(
+            json.dumps(
+                {"id": "job1", "kind": "sync", "status": RUNNING, "items": [0, 1, 2]}
+            )
+        )
+        # Item 0 finished after the last checkpoint; item 1 was torn mid-write
+        (tmp_path / "job1.ndjson").write_text(
+            '{"item":0,"rows":[{"item":0}]}\n{"item":1,"ro'
+        )
+
+        manager = JobManager(state_dir=str(tmp_path))
+        manager.register("sync", _definition(range(3), step))
+        assert await manager.resume() == 1
+        resumed = manager.get("job1")
+        await _wait_for(resumed, SUCCEEDED)
+
+        assert sorted(calls) == [1, 2]
+        assert sorted(r["item"] for r in resumed.results) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_throttled_while_running(self, tmp_path):
+        """Test that items do not each rewrite the checkpoint."""
+        manager = JobManager(state_dir=str(tmp_path), checkpoint_interval=60)
+        writes = []
+        write_checkpoint = manager._write_checkpoint
+
+        def counting_write(job_id, state):
+            writes.append(len(state["completed"]))
+            write_checkpoint(job_id, state)
+
+        manager._write_checkpoint = counting_write
+
+        async def step(item):
+            return [{"item": item}]
+
+        manager.register("sync", _definition(range(20), step))
+        job = await manager.submit("sync")
+        await _wait_for(job, SUCCEEDED)
+
+        # Submitted, planned and finished; none per item
+        assert writes == [0, 0, 20]
+        assert len((tmp_path / f"{job.id}.ndjson").read_text().splitlines()) == 20
+
+
+class TestSyncPricesJob:
+    """Test cases for the sync-prices job definition."""
+
+    @pytest.mark.asyncio
+    async def test_plan_uses_group_calls_and_batches(self, tcgplayer_client):
+        """Test that product IDs are planned into group calls and ID batches."""
+        definition = sync_prices_job(tcgplayer_client)
+
+        items = await definition.plan(
+            {
+                "productIds": list(range(1, 62)),
+                "productGroups": {str(i): 10 for i in range(1, 61)},
+            }
+        )
+
+        assert items == [{"groupId": 10}, {"productIds": [61]}]
+
+    @pytest.mark.asyncio
+    async def test_step_fetches_group_prices(self, tcgplayer_client):
+        """Test that a group item fetches prices for the whole group."""
+        pricing = tcgplayer_client.endpoints.pricing
+        pricing.get_product_prices_by_group = AsyncMock(
+            return_value={"results": [{"productId": 1, "marketPrice": 2.5}]}
+        )
+        definition = sync_prices_job(tcgplayer_client)
+
+        rows = await definition.step({"groupId": 10})
+
+        assert rows == [{"productId": 1, "marketPrice": 2.5}]
+        pricing.get_product_prices_by_group.assert_awaited_once_with(10)
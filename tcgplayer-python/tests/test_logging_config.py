@@ -0,0 +1,126 @@
+"""
+Unit tests for structured, sampled and queued logging.
+"""
+
+import json
+import logging
+import threading
+
+from tcgplayer_client.logging_config import (
+    CACHE_HIT_EVENT,
+    SamplingFilter,
+    StructuredFormatter,
+    TCGPlayerLogger,
+)
+
+
+class _Collect(logging.Handler):
+    """Handler keeping formatted records and the thread that wrote them."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+def _record(msg="Cache hit for %s", args=("/catalog/categories",), extra=None):
+    record = logging.LogRecord(
+        "tcgplayer_client", logging.INFO, "x.py", 7, msg, args, None
+    )
+    record.__dict__.update(extra or {})
+    return record
+
+
+class TestStructuredFormatter:
+    """Test cases for JSON output."""
+
+    def test_json_resolves_message_and_fields(self):
+        """Test that lazy arguments, time and line number are rendered."""
+        formatter = StructuredFormatter(json_format=True)
+
+        data = json.loads(formatter.format(_record()))
+
+        assert data["message"] == "Cache hit for /catalog/categories"
+        assert data["level"] == "INFO"
+        assert data["line"] == 7
+        assert not data["timestamp"].startswith("%(")
+
+    def test_extra_fields_included(self):
+        """Test that extra_fields from log_with_context are merged in."""
+        formatter = StructuredFormatter(json_format=True)
+
+        data = json.loads(formatter.format(_record(extra={"extra_fields": {"a": 1}})))
+
+        assert data["a"] == 1
+
+
+class TestSamplingFilter:
+    """Test cases for per-event sampling."""
+
+    def test_keeps_configured_fraction(self):
+        """Test that a rate of 0.1 keeps every tenth tagged record."""
+        sampling = SamplingFilter({"cache_hit": 0.1})
+
+        kept = sum(sampling.filter(_record(extra=CACHE_HIT_EVENT)) for _ in range(100))
+
+        assert kept == 10
+        assert sampling.dropped["cache_hit"] == 90
+
+    def test_untagged_and_unconfigured_pass(self):
+        """Test that only events with a rate are sampled."""
+        sampling = SamplingFilter({"request": 0.0})
+
+        assert sampling.filter(_record())
+        assert sampling.filter(_record(extra=CACHE_HIT_EVENT))
+        assert not sampling.filter(_record(extra={"log_event": "request"}))
+
+    def test_shared_filter_decides_once_per_record(self):
+        """Test that handlers sharing the filter keep the same records."""
+        logger = logging.getLogger("tcgplayer_client.test_shared_sampling")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handlers = [_Collect() for _ in range(3)]
+        for handler in handlers:
+            logger.addHandler(handler)
+        wrapped = TCGPlayerLogger(logger.name)
+        sampling = wrapped.set_sample_rates({"cache_hit": 0.5})
+
+        for i in range(10):
+            logger.info("Cache hit %d", i, extra=CACHE_HIT_EVENT)
+
+        expected = [f"Cache hit {i}" for i in range(1, 10, 2)]
+        assert all(handler.lines == expected for handler in handlers)
+        assert sampling.dropped["cache_hit"] == 5
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+
+class TestQueuedLogging:
+    """Test cases for moving handler I/O to a listener thread."""
+
+    def test_records_written_by_listener_thread(self):
+        """Test that queued records are sampled, then written off-thread."""
+        logger = logging.getLogger("tcgplayer_client.test_queue")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        collect = _Collect()
+        logger.addHandler(collect)
+        wrapped = TCGPlayerLogger(logger.name)
+        wrapped.set_sample_rates({"cache_hit": 0.5})
+
+        wrapped.start_queue()
+        try:
+            for _ in range(4):
+                logger.info("Cache hit for %s", "/x", extra=CACHE_HIT_EVENT)
+            logger.info("Closed")
+        finally:
+            wrapped.stop_queue()
+
+        assert collect.lines == ["Cache hit for /x", "Cache hit for /x", "Closed"]
+        assert threading.current_thread().name not in collect.threads
+        assert logger.handlers == [collect]
+        logger.removeHandler(collect)
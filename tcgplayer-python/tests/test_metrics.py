@@ -0,0 +1,146 @@
+"""
+Unit tests for the metrics module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tcgplayer_client.metrics import MetricsRegistry, endpoint_template
+from tcgplayer_client.rate_limiter import RateLimiter
+
+from .conftest import MockAsyncContextManager
+
+
+class TestEndpointTemplate:
+    """Test cases for endpoint templating."""
+
+    def test_ids_replaced(self):
+        """Test that numeric segments and ID lists become placeholders."""
+        assert endpoint_template("/catalog/products/1,2,3") == "/catalog/products/{ids}"
+        assert endpoint_template("/pricing/group/42") == "/pricing/group/{id}"
+        assert (
+            endpoint_template("/catalog/categories/1/printings")
+            == "/catalog/categories/{id}/printings"
+        )
+
+    def test_query_dropped(self):
+        """Test that query strings do not reach the label."""
+        assert endpoint_template("/catalog/groups?categoryId=3") == "/catalog/groups"
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry rendering."""
+
+    def test_counter_and_gauge_render(self):
+        """Test Prometheus text output for counters and gauges."""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits.", ("result",))
+        gauge = registry.gauge("depth", "Depth.")
+        counter.inc(result="hit")
+        counter.inc(2, result="miss")
+        gauge.set(3)
+
+        text = registry.render()
+
+        assert "# TYPE hits_total counter" in text
+        assert 'hits_total{result="hit"} 1' in text
+        assert 'hits_total{result="miss"} 2' in text
+        assert "# TYPE depth gauge" in text
+        assert "\ndepth 3\n" in text
+
+    def test_clear_drops_labelled_samples(self):
+        """Test that clearing keeps only series that are set again."""
+        registry = MetricsRegistry()
+        counter = registry.counter("tenant_total", "Per tenant.", ("tenant",))
+        counter.set_total(4, tenant="alice")
+        counter.set_total(2, tenant="bob")
+
+        counter.clear()
+        counter.set_total(5, tenant="alice")
+        text = registry.render()
+
+        assert 'tenant_total{tenant="alice"} 5' in text
+        assert "bob" not in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram bucket, sum and count lines."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        text = registry.render()
+
+        assert 'latency_bucket{le="0.1"} 1' in text
+        assert 'latency_bucket{le="1"} 2' in text
+        assert 'latency_bucket{le="+Inf"} 3' in text
+        assert "latency_sum 5.55" in text
+        assert "latency_count 3" in text
+
+    def test_labels_validated(self):
+        """Test that samples must use the declared label names."""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("endpoint",))
+
+        with pytest.raises(ValueError):
+            counter.inc(route="/x")
+
+    def test_registration_is_idempotent(self):
+        """Test that re-registering a name returns the existing metric."""
+        registry = MetricsRegistry()
+
+        first = registry.counter("requests_total", "Requests.")
+        second = registry.counter("requests_total", "Requests.")
+
+        assert first is second
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests.")
+
+    def test_collectors_run_before_render(self):
+        """Test that collectors refresh metrics at render time."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_depth", "Queue depth.")
+        state = {"depth": 0}
+        registry.add_collector(lambda: gauge.set(state["depth"]))
+
+        state["depth"] = 7
+
+        assert "queue_depth 7" in registry.render()
+
+
+class TestClientMetrics:
+    """Test cases for metrics recorded by TCGPlayerClient."""
+
+    @pytest.mark.asyncio
+    async def test_request_and_cache_metrics(self, tcgplayer_client):
+        """Test that requests, latency and cache lookups are recorded."""
+        response = AsyncMock()
+        response.status = 200
+        response.read = AsyncMock(return_value=b'{"results": []}')
+
+        session = MagicMock()
+        session.get = MagicMock(return_value=MockAsyncContextManager(response))
+        tcgplayer_client.rate_limiter = RateLimiter()
+        tcgplayer_client.auth.is_authenticated = MagicMock(return_value=True)
+        tcgplayer_client.auth.get_access_token = MagicMock(return_value="token")
+        tcgplayer_client.session_manager.get_session = AsyncMock(return_value=session)
+
+        await tcgplayer_client._make_api_request("/catalog/products/1,2")
+        await tcgplayer_client._make_api_request("/catalog/products/1,2")
+
+        metrics = tcgplayer_client.metrics
+        template = "/catalog/products/{ids}"
+        assert metrics.requests.get(endpoint=template, method="GET", status="200") == 1
+        assert metrics.request_duration.get_count(endpoint=template, method="GET") == 1
+        assert metrics.decode_duration.get_count(endpoint=template) == 1
+        assert metrics.cache_lookups.get(result="miss") == 1
+        assert metrics.cache_lookups.get(result="hit") == 1
+        assert metrics.limiter_wait.get_count() == 1
+        assert metrics.in_flight.get() == 0
+
+        text = metrics.registry.render()
+        assert "tcgplayer_rate_limiter_window_requests 1" in text
+        assert "tcgplayer_cache_entries 1" in text
+        await tcgplayer_client.close()
@@ -0,0 +1,109 @@
+"""
+Unit tests for price change detection.
+"""
+
+import pytest
+
+from tcgplayer_client.price_changes import (
+    PriceChangeDetector,
+    PriceSnapshot,
+    diff_snapshots,
+)
+
+
+def group_response(*rows):
+    """Build a /pricing/group style response."""
+    return {"success": True, "results": list(rows)}
+
+
+class TestDiffSnapshots:
+    """Test cases for diff_snapshots."""
+
+    def test_only_changed_rows_reported(self):
+        """Test that unchanged rows are skipped and deltas computed."""
+        previous = PriceSnapshot(
+            [
+                {"productId": 1, "subTypeName": "Normal", "marketPrice": 10.0},
+                {"productId": 1, "subTypeName": "Foil", "marketPrice": 20.0},
+                {"productId": 2, "subTypeName": "Normal", "marketPrice": 5.0},
+            ]
+        )
+        current = PriceSnapshot(
+            [
+                {"productId": 2, "subTypeName": "Normal", "marketPrice": 5.0},
+                {"productId": 1, "subTypeName": "Foil", "marketPrice": 25.0},
+                {"productId": 1, "subTypeName": "Normal", "marketPrice": 10.0},
+            ]
+        )
+
+        changes = diff_snapshots(previous, current)
+
+        assert len(changes) == 1
+        delta = changes[0].deltas["marketPrice"]
+        assert changes[0].key == (1, "Foil")
+        assert (delta.old, delta.new, delta.absolute) == (20.0, 25.0, 5.0)
+        assert delta.percent == pytest.approx(25.0)
+
+    def test_thresholds_and_missing_prices(self):
+        """Test noise thresholds and prices appearing or disappearing."""
+        previous = PriceSnapshot(
+            [
+                {"skuId": 1, "marketPrice": 10.0},
+                {"skuId": 2, "marketPrice": 10.0},
+                {"skuId": 3, "marketPrice": None},
+            ]
+        )
+        current = PriceSnapshot(
+            [
+                {"skuId": 1, "marketPrice": 10.01},
+                {"skuId": 2, "marketPrice": None},
+                {"skuId": 3, "marketPrice": 4.0},
+                {"skuId": 4},
+            ]
+        )
+
+        changes = diff_snapshots(previous, current, min_abs_delta=0.05)
+
+        assert [c.key for c in changes] == [2, 3, 4]
+        assert changes[0].deltas["marketPrice"].new is None
+        assert changes[1].deltas["marketPrice"].absolute is None
+        assert changes[2].is_new
+
+        assert [c.key for c in diff_snapshots(previous, current, 0.05, 0, False)] == [
+            2,
+            3,
+        ]
+
+
+class TestPriceChangeDetector:
+    """Test cases for PriceChangeDetector."""
+
+    @pytest.mark.asyncio
+    async def test_streams_changes_between_batches(self):
+        """Test streaming changes against the previous batch per scope."""
+        detector = PriceChangeDetector(include_new=False)
+        scope = ("group", 3)
+
+        first = [
+            c
+            async for c in detector.changes(
+                scope,
+                group_response(
+                    {"productId": 1, "subTypeName": "Normal", "lowPrice": 1.0}
+                ),
+            )
+        ]
+        second = [
+            c
+            async for c in detector.changes(
+                scope,
+                group_response(
+                    {"productId": 1, "subTypeName": "Normal", "lowPrice": 1.5}
+                ),
+            )
+        ]
+
+        assert first == []
+        assert len(second) == 1
+        assert second[0].to_dict()["deltas"]["lowPrice"]["absolute"] == 0.5
+        assert detector.forget(scope) is True
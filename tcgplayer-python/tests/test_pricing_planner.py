@@ -0,0 +1,73 @@
+"""
+Unit tests for the pricing request planner.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tcgplayer_client.endpoints.pricing import PricingEndpoints
+from tcgplayer_client.pricing_planner import plan_price_requests
+
+
+class TestPlanPriceRequests:
+    """Test cases for plan_price_requests."""
+
+    def test_clustered_ids_use_group_calls(self):
+        """Test that products clustered into few sets are priced by group."""
+        product_groups = {pid: 1 + pid // 500 for pid in range(5000)}
+        plan = plan_price_requests(range(5000), product_groups)
+
+        assert plan.api_calls == 10
+        assert sorted(plan.group_ids) == list(range(1, 11))
+        assert plan.product_batches == []
+
+    def test_scattered_ids_use_batches(self):
+        """Test that products spread over many sets are batched by ID."""
+        product_groups = {pid: pid for pid in range(100)}
+        plan = plan_price_requests(range(100), product_groups, batch_size=25)
+
+        assert plan.group_ids == []
+        assert plan.api_calls == 4
+
+    def test_mixed_plan_is_minimal(self):
+        """Test a mix of one dense group and scattered leftovers."""
+        product_groups = {pid: 7 for pid in range(60)}
+        product_groups.update({pid: pid for pid in range(60, 70)})
+        plan = plan_price_requests(list(range(70)) + [999], product_groups, 25)
+
+        assert plan.group_ids == [7]
+        assert [len(b) for b in plan.product_batches] == [11]
+        assert 999 in plan.product_batches[0]
+        assert plan.api_calls == 2
+
+
+class TestGetPricesPlanned:
+    """Test cases for PricingEndpoints.get_prices_planned."""
+
+    @pytest.mark.asyncio
+    async def test_merges_and_filters_results(self):
+        """Test that group and batch results merge into one target map."""
+        mock_client = MagicMock()
+
+        async def fake_request(endpoint):
+            if endpoint == "/pricing/group/7":
+                return {
+                    "results": [
+                        {"productId": pid, "subTypeName": "Normal"} for pid in range(60)
+                    ]
+                    + [{"productId": 500, "subTypeName": "Normal"}]
+                }
+            ids = [int(x) for x in endpoint.rsplit("/", 1)[1].split(",")]
+            return {"results": [{"productId": pid} for pid in ids]}
+
+        mock_client._make_api_request = AsyncMock(side_effect=fake_request)
+        pricing = PricingEndpoints(mock_client)
+
+        product_groups = {pid: 7 for pid in range(60)}
+        prices = await pricing.get_prices_planned(
+            list(range(30)) + [900, 901], product_groups, batch_size=10
+        )
+
+        assert sorted(prices) == list(range(30)) + [900, 901]
+        assert mock_client._make_api_request.call_count == 2
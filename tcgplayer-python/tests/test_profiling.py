@@ -0,0 +1,132 @@
+"""
+Unit tests for the sampling profiler.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.exceptions import ConfigurationError
+from tcgplayer_client.jobs import SUCCEEDED, JobDefinition, JobManager
+from tcgplayer_client.profiling import SamplingProfiler
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+async def _parked(event):
+    await _waiting(event)
+
+
+async def _waiting(event):
+    await event.wait()
+
+
+class TestSamplingProfiler:
+    """Test cases for sampling CPU stacks and task waits."""
+
+    @pytest.mark.asyncio
+    async def test_attributes_cpu_idle_and_waits(self):
+        """Test that busy code, idle loop time and awaits are all sampled."""
+        event = asyncio.Event()
+        parked = asyncio.ensure_future(_parked(event))
+
+        with SamplingProfiler(interval=0.001) as profiler:
+            _busy(0.05)
+            await asyncio.sleep(0.05)
+        event.set()
+        await parked
+
+        collapsed = profiler.collapsed()
+        cpu = profiler.collapsed(waits=False)
+        assert "_busy (test_profiling.py:" in cpu
+        assert "[idle]" in cpu
+        assert ";_parked (test_profiling.py:" in collapsed
+        assert "_waiting (test_profiling.py:" in collapsed
+        assert "[wait]" not in cpu
+        summary = profiler.summary()
+        assert summary["samples"] > 0
+        assert 0 < summary["idle_fraction"] < 1
+
+    @pytest.mark.asyncio
+    async def test_write_formats(self, tmp_path):
+        """Test that .json gets speedscope format and other paths collapsed."""
+        with SamplingProfiler(interval=0.001) as profiler:
+            _busy(0.02)
+            await asyncio.sleep(0.01)
+
+        profiler.write(tmp_path / "run.speedscope.json")
+        profiler.write(tmp_path / "run.folded")
+
+        data = json.loads((tmp_path / "run.speedscope.json").read_text())
+        assert data["profiles"][0]["type"] == "sampled"
+        frames = data["shared"]["frames"]
+        for profile in data["profiles"]:
+            assert len(profile["samples"]) == len(profile["weights"])
+            assert all(i < len(frames) for s in profile["samples"] for i in s)
+        line = (tmp_path / "run.folded").read_text().splitlines()[0]
+        assert line.rsplit(" ", 1)[1].isdigit()
+
+
+class TestProfilingMode:
+    """Test cases for config and job profiling."""
+
+    @pytest.mark.asyncio
+    async def test_client_profile_path(self, tmp_path):
+        """Test that a profiled client writes its profile on close."""
+        path = tmp_path / "client.txt"
+        config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = TCGPlayerClient(
+                config=ClientConfig(
+                    base_url=server.base_url,
+                    client_id="id",
+                    client_secret="secret",
+                    profile_path=str(path),
+                    profile_interval=0.001,
+                )
+            )
+            await client.authenticate()
+            try:
+                await client.endpoints.catalog.get_categories()
+                await asyncio.sleep(0.01)
+            finally:
+                await client.close()
+
+        assert not client.profiler.running
+        assert path.read_text()
+
+    def test_profile_interval_validated(self):
+        """Test that a non-positive sampling interval is rejected."""
+        with pytest.raises(ConfigurationError):
+            ClientConfig(profile_interval=0)
+
+    @pytest.mark.asyncio
+    async def test_job_profile_written(self, tmp_path):
+        """Test that each job run writes a speedscope profile."""
+        manager = JobManager(profile_dir=str(tmp_path))
+
+        async def plan(params):
+            return [1, 2]
+
+        async def step(item):
+            await asyncio.sleep(0.01)
+            return [item]
+
+        manager.register("sleepy", JobDefinition(plan=plan, step=step))
+        job = await manager.submit("sleepy")
+        for _ in range(200):
+            if job.status == SUCCEEDED:
+                break
+            await asyncio.sleep(0.01)
+
+        data = json.loads((tmp_path / f"{job.id}.speedscope.json").read_text())
+        assert data["exporter"] == "tcgplayer_client"
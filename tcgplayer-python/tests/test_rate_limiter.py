@@ -3,6 +3,7 @@ Unit tests for the RateLimiter class.
 """
 
 import asyncio
+import time
 
 import pytest
 
@@ -189,3 +190,34 @@ class TestRateLimiter:
         # This test verifies the basic functionality
         await limiter.acquire()
         assert len(limiter.requests) == 1
+
+    def test_estimate_wait_free_slot(self):
+        """Test that no wait is estimated while slots are free."""
+        limiter = RateLimiter(max_requests=5, time_window=1.0)
+        limiter.requests.extend([time.time()] * 4)
+
+        assert limiter.estimate_wait() == 0.0
+
+    def test_estimate_wait_with_backlog(self):
+        """Test that queued requests push the estimate out by whole windows."""
+        limiter = RateLimiter(max_requests=10, time_window=1.0)
+        limiter.requests.extend([time.time()] * 10)
+        limiter.waiting = 25
+
+        # 10 slots free after 1s, 20 after 2s, the 26th request gets one at 3s
+        assert 2.9 < limiter.estimate_wait() <= 3.0
+
+    def test_estimate_wait_partial_window(self):
+        """Test that the estimate never drops as more requests queue ahead."""
+        limiter = RateLimiter(max_requests=10, time_window=1.0)
+        limiter.requests.extend([time.time() - 0.5] * 5)
+
+        waits = [limiter.estimate_wait(queued) for queued in range(31)]
+
+        assert waits[4] == 0.0
+        assert 0.4 < waits[5] <= 0.5
+        # The 5 free slots are taken now and only come back after a window
+        assert 0.9 < waits[10] <= 1.0
+        assert 0.9 < waits[14] <= 1.0
+        assert 1.4 < waits[15] <= 1.5
+        assert all(a <= b + 0.01 for a, b in zip(waits, waits[1:]))
@@ -0,0 +1,86 @@
+"""
+Unit tests for the reference data registry.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tcgplayer_client.reference_data import LookupTable, ReferenceData
+
+
+def make_catalog():
+    """Mock catalog endpoints returning small reference payloads."""
+    catalog = MagicMock()
+    catalog.get_categories = AsyncMock(
+        return_value={"results": [{"categoryId": 1, "name": "Magic"}]}
+    )
+    catalog.get_condition_names = AsyncMock(
+        return_value={
+            "results": [{"conditionId": 1, "name": "Near Mint", "abbreviation": "NM"}]
+        }
+    )
+    catalog.get_language_names = AsyncMock(
+        return_value={"results": [{"languageId": 1, "name": "English", "abbr": "EN"}]}
+    )
+    catalog.get_rarities = AsyncMock(
+        return_value={"results": [{"rarityId": 4, "displayText": "Rare"}]}
+    )
+    catalog.get_category_printings = AsyncMock(
+        return_value={"results": [{"printingId": 2, "name": "Foil"}]}
+    )
+    catalog.get_category_rarities = AsyncMock(
+        return_value={"results": [{"rarityId": 9, "displayText": "Mythic"}]}
+    )
+    return catalog
+
+
+class TestLookupTable:
+    """Test cases for LookupTable class."""
+
+    def test_frozen_bidirectional_lookup(self):
+        """Test id/name lookups and immutability."""
+        table = LookupTable(
+            "conditions",
+            {"results": [{"conditionId": 3, "name": "Damaged", "abbreviation": "DMG"}]},
+        )
+
+        assert table.name(3) == "Damaged"
+        assert table.id("damaged") == 3
+        assert table.id(" DMG ") == 3
+        with pytest.raises(TypeError):
+            table.by_id[4] = "Other"
+
+
+class TestReferenceData:
+    """Test cases for ReferenceData class."""
+
+    @pytest.mark.asyncio
+    async def test_load_once_and_sync_lookups(self):
+        """Test that global tables load once and answer synchronously."""
+        catalog = make_catalog()
+        reference = ReferenceData(catalog)
+
+        assert reference.is_stale()
+        await reference.ensure_loaded()
+        await reference.ensure_loaded()
+
+        catalog.get_categories.assert_called_once()
+        assert reference.category_name(1) == "Magic"
+        assert reference.condition_id("NM") == 1
+        assert reference.language_name(1) == "English"
+        assert reference.rarity_id("rare") == 4
+
+    @pytest.mark.asyncio
+    async def test_lazy_category_tables(self):
+        """Test per-category printings and rarities load lazily once."""
+        catalog = make_catalog()
+        reference = ReferenceData(catalog)
+
+        assert reference.printing_id(1, "Foil") is None
+        await reference.ensure_category(1)
+        await reference.ensure_category(1)
+
+        catalog.get_category_printings.assert_called_once_with(1)
+        assert reference.printing_id(1, "foil") == 2
+        assert reference.rarity_name(9, category_id=1) == "Mythic"
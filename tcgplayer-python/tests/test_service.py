@@ -0,0 +1,277 @@
+"""
+Unit tests for the FastAPI service's batch, export, conditional response and
+cost header routes.
+"""
+
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.chaos import FaultConfig, inject_faults
+from tcgplayer_client.config import ClientConfig
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("fastapi")
+
+from benchmarks.scenarios import _load_service  # noqa: E402
+
+
+@asynccontextmanager
+async def _service(faults=None, gzip_min_size=None):
+    """Run the service app against the fake API; yields (http, server)."""
+    config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+    async with FakeTCGPlayer(config) as server:
+        client = TCGPlayerClient(
+            config=ClientConfig(
+                base_url=server.base_url, client_id="id", client_secret="secret"
+            )
+        )
+        await client.authenticate()
+        if faults is not None:
+            inject_faults(client, faults)
+        service = _load_service(client)
+        if gzip_min_size is not None:
+            service.GZIP_MIN_SIZE = gzip_min_size
+        transport = httpx.ASGITransport(app=service.app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://service"
+            ) as http:
+                yield http, server
+        finally:
+            await client.close()
+
+
+class TestBatch:
+    """Test cases for POST /batch."""
+
+    @pytest.mark.asyncio
+    async def test_identical_sub_requests_run_once(self):
+        """Test that duplicates share one upstream call and keep their ids."""
+        async with _service() as (http, server):
+            response = await http.post(
+                "/batch",
+                json={
+                    "requests": [
+                        {"id": "a", "path": "/categories"},
+                        {"id": "b", "path": "/categories"},
+                    ]
+                },
+            )
+
+        data = response.json()
+        assert data["deduplicated"] == 1
+        assert [r["id"] for r in data["results"]] == ["a", "b"]
+        assert all(r["status"] == 200 for r in data["results"])
+        # The raw pass-through route is embedded as parsed JSON
+        assert data["results"][0]["body"]["results"]
+        assert server.api_calls() == 1
+
+    @pytest.mark.asyncio
+    async def test_parameter_errors_reported_per_item(self):
+        """Test that unknown and missing parameters fail only their item."""
+        async with _service() as (http, _):
+            response = await http.post(
+                "/batch",
+                json={
+                    "requests": [
+                        {"path": "/categories", "params": {"bogus": 1}},
+                        {"path": "/media"},
+                        {"path": "/nowhere"},
+                    ]
+                },
+            )
+
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == [400, 400, 404]
+        assert "bogus" in results[0]["body"]["detail"]
+        assert "productId" in results[1]["body"]["detail"]
+
+    @pytest.mark.asyncio
+    async def test_text_route_embedded_as_string(self):
+        """Test that a non-JSON route such as /metrics is returned as text."""
+        async with _service() as (http, _):
+            response = await http.post(
+                "/batch", json={"requests": [{"path": "/metrics"}]}
+            )
+
+        result = response.json()["results"][0]
+        assert result["status"] == 200
+        assert "# TYPE" in result["body"]
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+# Every upstream request answered 500 (the client does not retry those)
+_OUTAGE = FaultConfig(burst_rate=1.0, burst_length=1000, burst_status=500)
+
+
+class TestExports:
+    """Test cases for the streamed NDJSON exports."""
+
+    @pytest.mark.asyncio
+    async def test_products_streamed_one_per_line(self):
+        """Test that every product of a group is exported across pages."""
+        async with _service() as (http, server):
+            group_id = next(iter(server.groups))
+            # Three pages, the last one short
+            page_size = len(server.group_products[group_id]) // 3 + 1
+            response = await http.get(
+                "/export/products", params={"groupId": group_id, "pageSize": page_size}
+            )
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = _lines(response)
+        assert [r["productId"] for r in rows] == server.group_products[group_id]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "route, params",
+        [
+            ("/export/products", {}),
+            ("/export/products", {"groupId": -1}),
+            ("/export/products", {"groupId": 101, "pageSize": 0}),
+            ("/export/prices", {}),
+            ("/export/prices", {"categoryId": 0}),
+        ],
+    )
+    async def test_bad_parameters_rejected(self, route, params):
+        """Test that invalid filters get a 400 instead of an empty export."""
+        async with _service() as (http, _):
+            response = await http.get(route, params=params)
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_failed_export_reported_inline(self):
+        """Test that an upstream failure ends the stream with an error line."""
+        async with _service(_OUTAGE) as (http, server):
+            group_id = next(iter(server.groups))
+            products = await http.get("/export/products", params={"groupId": group_id})
+            prices = await http.get("/export/prices", params={"groupId": group_id})
+            walk = await http.get("/export/prices", params={"categoryId": 1})
+
+        assert products.status_code == 200
+        assert "error" in _lines(products)[-1]
+        assert _lines(prices)[0]["groupId"] == group_id
+        assert "error" in _lines(prices)[0]
+        assert "error" in _lines(walk)[-1]
+
+    @pytest.mark.asyncio
+    async def test_prices_bypass_cache(self):
+        """Test that price exports tag rows and are not cached."""
+        async with _service() as (http, server):
+            group_id = next(iter(server.groups))
+            first = await http.get("/export/prices", params={"groupId": group_id})
+            calls = server.api_calls()
+            await http.get("/export/prices", params={"groupId": group_id})
+
+            assert server.api_calls() == calls + 1
+        rows = _lines(first)
+        assert rows and all(r["groupId"] == group_id for r in rows)
+
+
+def _varies_on_encoding(response):
+    # CORS adds Origin to the same header
+    return "Accept-Encoding" in [v.strip() for v in response.headers["vary"].split(",")]
+
+
+class TestConditionalResponses:
+    """Test cases for ETag, If-None-Match and gzip on raw pass-through routes."""
+
+    @pytest.mark.asyncio
+    async def test_etag_and_vary_headers(self):
+        """Test that the ETag is stable across calls and Vary is set."""
+        async with _service() as (http, _):
+            first = await http.get("/categories")
+            second = await http.get("/categories")
+
+        assert first.status_code == 200
+        assert first.headers["etag"].startswith('"')
+        assert first.headers["etag"] == second.headers["etag"]
+        assert _varies_on_encoding(first)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            "{etag}",
+            "W/{etag}",
+            "*",
+            '"other", {etag}',
+            "{gzip_etag}",
+        ],
+    )
+    async def test_matching_if_none_match_is_304(self, if_none_match):
+        """Test that strong, weak, wildcard and gzip ETags all revalidate."""
+        async with _service() as (http, server):
+            etag = (await http.get("/categories")).headers["etag"]
+            header = if_none_match.format(etag=etag, gzip_etag=etag[:-1] + '-gzip"')
+            response = await http.get("/categories", headers={"If-None-Match": header})
+
+            assert server.api_calls() == 1
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert _varies_on_encoding(response)
+
+    @pytest.mark.asyncio
+    async def test_stale_if_none_match_gets_body(self):
+        """Test that a non-matching ETag gets the full response."""
+        async with _service() as (http, _):
+            response = await http.get(
+                "/categories", headers={"If-None-Match": '"stale"'}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["results"]
+
+    @pytest.mark.asyncio
+    async def test_gzip_at_or_above_min_size(self):
+        """Test that large bodies are gzipped under their own ETag."""
+        async with _service(gzip_min_size=1) as (http, _):
+            plain = await http.get(
+                "/categories", headers={"Accept-Encoding": "identity"}
+            )
+            gzipped = await http.get("/categories", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in plain.headers
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+        assert _varies_on_encoding(gzipped)
+        # httpx decodes the body: same JSON either way
+        assert gzipped.json() == plain.json()
+
+    @pytest.mark.asyncio
+    async def test_identity_below_min_size(self):
+        """Test that small bodies are sent uncompressed even if gzip is accepted."""
+        async with _service(gzip_min_size=10**9) as (http, _):
+            response = await http.get(
+                "/categories", headers={"Accept-Encoding": "gzip"}
+            )
+
+        assert "content-encoding" not in response.headers
+        assert not response.headers["etag"].endswith('-gzip"')
+        assert response.json()["results"]
+
+
+class TestCostHeaders:
+    """Test cases for the upstream cost response headers."""
+
+    @pytest.mark.asyncio
+    async def test_reported_except_for_streamed_exports(self):
+        """Test that only responses sent after their calls carry cost headers."""
+        async with _service() as (http, server):
+            categories = await http.get("/categories")
+            group_id = next(iter(server.groups))
+            export = await http.get("/export/products", params={"groupId": group_id})
+
+        assert categories.headers["x-upstream-calls"] == "1"
+        assert export.status_code == 200
+        assert export.text
+        assert "x-upstream-calls" not in export.headers
@@ -0,0 +1,149 @@
+"""
+Unit tests for the SKU resolution index.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tcgplayer_client.exceptions import ValidationError
+from tcgplayer_client.sku_index import SKUIndex, pack_sku_key
+
+CONDITIONS = {
+    "success": True,
+    "results": [
+        {"conditionId": 1, "name": "Near Mint", "abbreviation": "NM"},
+        {"conditionId": 2, "name": "Lightly Played", "abbreviation": "LP"},
+    ],
+}
+LANGUAGES = {
+    "success": True,
+    "results": [
+        {"languageId": 1, "name": "English", "abbr": "EN"},
+        {"languageId": 7, "name": "Japanese", "abbr": "JP"},
+    ],
+}
+PRINTINGS = {
+    "success": True,
+    "results": [
+        {"printingId": 1, "name": "Normal"},
+        {"printingId": 2, "name": "Foil"},
+    ],
+}
+SKUS = [
+    {
+        "skuId": 1001,
+        "productId": 10,
+        "conditionId": 1,
+        "printingId": 1,
+        "languageId": 1,
+    },
+    {
+        "skuId": 1002,
+        "productId": 10,
+        "conditionId": 2,
+        "printingId": 1,
+        "languageId": 1,
+    },
+    {
+        "skuId": 1003,
+        "productId": 10,
+        "conditionId": 1,
+        "printingId": 2,
+        "languageId": 7,
+    },
+    {
+        "skuId": 2001,
+        "productId": 20,
+        "conditionId": 1,
+        "printingId": 1,
+        "languageId": 1,
+    },
+]
+
+
+@pytest.fixture
+def sku_index():
+    """SKU index populated with sample data."""
+    index = SKUIndex()
+    index.set_condition_names(CONDITIONS)
+    index.set_language_names(LANGUAGES)
+    index.add_skus(SKUS)
+    return index
+
+
+class TestPackSkuKey:
+    """Test cases for SKU key packing."""
+
+    def test_keys_are_distinct(self):
+        """Test that each attribute contributes to the key."""
+        keys = {
+            pack_sku_key(1, 1, 1, 1),
+            pack_sku_key(2, 1, 1, 1),
+            pack_sku_key(1, 2, 1, 1),
+            pack_sku_key(1, 1, 2, 1),
+            pack_sku_key(1, 1, 1, 2),
+        }
+        assert len(keys) == 5
+
+    def test_out_of_range_rejected(self):
+        """Test that attributes that overflow their field are rejected."""
+        with pytest.raises(ValidationError):
+            pack_sku_key(1, 256, 1, 1)
+        with pytest.raises(ValidationError):
+            pack_sku_key(-1, 1, 1, 1)
+
+
+class TestSKUIndex:
+    """Test cases for SKUIndex class."""
+
+    def test_resolve_by_id_and_name(self, sku_index):
+        """Test resolving with IDs and with condition/language names."""
+        assert len(sku_index) == 4
+        assert sku_index.resolve(10, 2, 1, 1) == 1002
+        assert sku_index.resolve(10, "Near Mint", 2, "Japanese") == 1003
+        assert sku_index.resolve(10, "nm", 1, "EN") == 1001
+        assert sku_index.resolve(20, 2, 1, 1) is None
+
+    def test_resolve_unknown_name(self, sku_index):
+        """Test that unknown names raise ValidationError."""
+        with pytest.raises(ValidationError):
+            sku_index.resolve(10, "Mint-ish", 1, 1)
+
+    def test_resolve_many(self, sku_index):
+        """Test batch resolution preserves input order."""
+        specs = [
+            (20, 1, 1, 1),
+            (10, "LP", 1, "English"),
+            (10, 300, 1, 1),
+            (99, 1, 1, 1),
+        ]
+        assert sku_index.resolve_many(specs) == [2001, 1002, None, None]
+
+    def test_resolve_many_unknown_name(self, sku_index):
+        """Test that an unknown name resolves to None instead of raising."""
+        specs = [(10, "Mint-ish", 1, 1), (10, 1, "Holo", 1), (20, 1, 1, 1)]
+
+        assert sku_index.resolve_many(specs) == [None, None, 2001]
+
+    @pytest.mark.asyncio
+    async def test_load_from_catalog(self):
+        """Test populating the index with batched catalog requests."""
+        catalog = MagicMock()
+        catalog.get_condition_names = AsyncMock(return_value=CONDITIONS)
+        catalog.get_language_names = AsyncMock(return_value=LANGUAGES)
+        catalog.get_category_printings = AsyncMock(return_value=PRINTINGS)
+        catalog.get_skus = AsyncMock(
+            side_effect=[{"results": SKUS[:3]}, {"results": SKUS[3:]}]
+        )
+
+        index = SKUIndex()
+        added = await index.load_from_catalog(
+            catalog, [10, 10, 20], batch_size=1, category_id=1
+        )
+
+        assert added == 4
+        assert [c.args[0] for c in catalog.get_skus.call_args_list] == [[10], [20]]
+        catalog.get_category_printings.assert_awaited_once_with(1)
+        assert index.resolve(20, "Near Mint", "Normal", "English") == 2001
+        assert index.resolve(10, "NM", "Foil", "JP") == 1003
@@ -0,0 +1,159 @@
+"""
+Unit tests for connection-level request timing.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from benchmarks.fake_server import FakeServerConfig, FakeTCGPlayer
+from tcgplayer_client import TCGPlayerClient
+from tcgplayer_client.config import ClientConfig
+from tcgplayer_client.metrics import ClientMetrics
+from tcgplayer_client.session_manager import SessionManager
+from tcgplayer_client.tracing import (
+    MetricsTimingSink,
+    RequestTiming,
+    TimingRecorder,
+)
+
+
+@asynccontextmanager
+async def serve():
+    """Run a local HTTP server answering every GET with a small JSON body."""
+
+    async def handle(request):
+        return web.json_response({"success": True, "results": [1, 2, 3]})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+async def _timed_get(manager, url, path="/catalog/categories"):
+    timing = manager.start_timing("GET", path)
+    session = await manager.get_session()
+    try:
+        async with session.get(url + path, trace_request_ctx=timing) as response:
+            await response.read()
+    finally:
+        manager.finish_timing(timing)
+    return timing
+
+
+class TestSessionTracing:
+    """Test cases for tracing requests made through SessionManager."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_sinks(self):
+        """Test that no trace config or timing is created without sinks."""
+        manager = SessionManager()
+        async with serve() as server_url:
+            session = await manager.get_session()
+
+            assert manager.start_timing("GET", "/x") is None
+            assert not session.trace_configs
+            assert await _timed_get(manager, server_url) is None
+            await manager.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_phases_and_connection_reuse(self):
+        """Test phase timings, and that the second request reuses the socket."""
+        manager = SessionManager()
+        recorder = TimingRecorder()
+        manager.add_timing_sink(recorder)
+        async with serve() as server_url:
+            first = await _timed_get(manager, server_url)
+            second = await _timed_get(manager, server_url)
+            await manager.cleanup()
+
+        assert list(recorder.records) == [first, second]
+        assert first.reused is False
+        assert first.connect is not None
+        assert second.reused is True
+        assert second.connect is None
+        for timing in (first, second):
+            assert timing.path == "/catalog/categories"
+            assert timing.status == 200
+            assert timing.ttfb is not None and timing.download is not None
+            assert timing.total >= timing.ttfb
+
+        summary = recorder.summary()
+        assert summary["requests"] == 2
+        assert summary["reuse_ratio"] == 0.5
+        assert summary["phases"]["connect"]["count"] == 1
+        assert summary["phases"]["total"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_sink_does_not_break_requests(self):
+        """Test that an exception in one sink is logged, not raised."""
+        manager = SessionManager()
+        recorder = TimingRecorder()
+
+        def broken(timing):
+            raise ValueError("boom")
+
+        manager.add_timing_sink(broken)
+        manager.add_timing_sink(recorder)
+        async with serve() as server_url:
+            await _timed_get(manager, server_url)
+            await manager.cleanup()
+
+        assert len(recorder.records) == 1
+
+
+class TestMetricsTimingSink:
+    """Test cases for recording timings into ClientMetrics."""
+
+    def test_records_phases_and_connection_kind(self):
+        """Test that measured phases and the connection kind are recorded."""
+        metrics = ClientMetrics()
+        sink = MetricsTimingSink(metrics)
+
+        sink(RequestTiming(reused=False, dns=0.001, connect=0.01, total=0.05))
+        sink(RequestTiming(reused=True, ttfb=0.02, total=0.03))
+
+        assert metrics.connections.get(kind="new") == 1
+        assert metrics.connections.get(kind="reused") == 1
+        assert metrics.phase_duration.get_count(phase="total") == 2
+        assert metrics.phase_duration.get_count(phase="dns") == 1
+        assert metrics.phase_duration.get_count(phase="queued") == 0
+
+
+class TestClientTracing:
+    """Test cases for the client's trace_requests option."""
+
+    @pytest.mark.asyncio
+    async def test_trace_requests_records_metrics(self):
+        """Test that client requests are timed into its metrics."""
+        config = FakeServerConfig(latency_ms=0, latency_jitter_ms=0)
+        async with FakeTCGPlayer(config) as server:
+            client = TCGPlayerClient(
+                config=ClientConfig(
+                    base_url=server.base_url,
+                    client_id="id",
+                    client_secret="secret",
+                    trace_requests=True,
+                    enable_caching=False,
+                )
+            )
+            await client.authenticate()
+            try:
+                await client.endpoints.catalog.get_categories()
+                await client.endpoints.catalog.get_categories()
+            finally:
+                await client.close()
+
+        metrics = client.metrics
+        assert metrics.connections.get(kind="new") == 1
+        assert metrics.connections.get(kind="reused") == 1
+        assert metrics.phase_duration.get_count(phase="ttfb") == 2